@@ -23,12 +23,15 @@ Classes:
     CalculationStats: Statistics from calculating a workbook
 """
 
-from duke_sheets._native import (
-    Workbook,
-    Worksheet,
-    CellValue,
-    CalculationStats,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from duke_sheets._native import (
+        Workbook,
+        Worksheet,
+        CellValue,
+        CalculationStats,
+    )
 
 __all__ = [
     "Workbook",
@@ -38,3 +41,18 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name):
+    # The native extension is loaded on first use rather than at import time
+    if name in __all__:
+        from duke_sheets import _native
+
+        value = getattr(_native, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,107 @@
+"""Type stubs for the duke_sheets native extension."""
+
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+CellInput = Union[None, bool, int, float, str]
+
+class CellValue:
+    """Represents a cell value (number, text, boolean, error, formula)."""
+
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def is_number(self) -> bool: ...
+    @property
+    def is_text(self) -> bool: ...
+    @property
+    def is_boolean(self) -> bool: ...
+    @property
+    def is_error(self) -> bool: ...
+    @property
+    def is_formula(self) -> bool: ...
+    def as_number(self) -> Optional[float]: ...
+    def as_text(self) -> Optional[str]: ...
+    def as_boolean(self) -> Optional[bool]: ...
+    def as_error(self) -> Optional[str]: ...
+    def formula_text(self) -> Optional[str]: ...
+    def to_python(self) -> Union[None, float, str, bool]: ...
+
+class CalculationStats:
+    """Statistics from calculating a workbook."""
+
+    @property
+    def formula_count(self) -> int: ...
+    @property
+    def cells_calculated(self) -> int: ...
+    @property
+    def errors(self) -> int: ...
+    @property
+    def circular_references(self) -> int: ...
+    @property
+    def volatile_cells(self) -> int: ...
+    @property
+    def converged(self) -> bool: ...
+    @property
+    def iterations(self) -> int: ...
+
+class Worksheet:
+    """A worksheet within a workbook."""
+
+    @property
+    def name(self) -> str: ...
+    @property
+    def used_range(self) -> Optional[Tuple[int, int, int, int]]: ...
+    def set_cell(self, address: str, value: CellInput) -> None: ...
+    def set_formula(self, address: str, formula: str) -> None: ...
+    def set_cells_bulk(
+        self,
+        values: Union[Mapping[str, CellInput], Iterable[Tuple[str, CellInput]]],
+    ) -> None: ...
+    def set_formulas_bulk(
+        self, formulas: Union[Mapping[str, str], Iterable[Tuple[str, str]]]
+    ) -> None: ...
+    def get_cell(self, address: str) -> CellValue: ...
+    def get_calculated_value(self, address: str) -> CellValue: ...
+    # numpy is an optional extra, so arrays are typed loosely
+    def read_range_numpy(self, range_str: str) -> Any: ...
+    def write_range_numpy(self, range_str: str, values: Any) -> None: ...
+    def set_row_height(self, row: int, height: float) -> None: ...
+    def set_column_width(self, col: int, width: float) -> None: ...
+    def merge_cells(self, range_str: str) -> None: ...
+    def unmerge_cells(self, range_str: str) -> bool: ...
+    def get_row_height(self, row: int) -> float: ...
+    def get_column_width(self, col: int) -> float: ...
+
+class Workbook:
+    """A workbook containing one or more worksheets."""
+
+    def __init__(self) -> None: ...
+    @staticmethod
+    def open(path: str) -> "Workbook": ...
+    def save(self, path: str) -> None: ...
+    @property
+    def sheet_count(self) -> int: ...
+    @property
+    def sheet_names(self) -> List[str]: ...
+    def get_sheet(self, index_or_name: Union[int, str]) -> Worksheet: ...
+    def add_sheet(self, name: str) -> int: ...
+    def remove_sheet(self, index: int) -> None: ...
+    def calculate(self) -> CalculationStats:
+        """Calculate all formulas in the workbook."""
+        ...
+    def calculate_with_options(
+        self,
+        iterative: bool = False,
+        max_iterations: int = 100,
+        max_change: float = 0.001,
+        force_full_calculation: bool = True,
+    ) -> CalculationStats:
+        """Calculate with custom options.
+
+        With ``force_full_calculation=False``, only formulas affected by cells
+        edited since the last calculation, and volatile formulas, are
+        re-evaluated.
+        """
+        ...
+    def define_name(self, name: str, refers_to: str) -> None: ...
+    def get_named_range(self, name: str) -> Optional[str]: ...
@@ -3,8 +3,12 @@
 //! This module provides PyO3-based Python bindings for the duke-sheets library,
 //! allowing Python code to read, write, and manipulate Excel files.
 
+use numpy::ndarray::Array2;
+use numpy::{IntoPyArray, PyArray2, PyReadonlyArrayDyn};
 use pyo3::exceptions::{PyIOError, PyIndexError, PyRuntimeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyString};
 
 use std::path::PathBuf;
 use std::sync::{Arc, RwLock};
@@ -35,6 +39,23 @@ fn cell_error_to_string(e: &CellError) -> &'static str {
     }
 }
 
+/// Interned Python string for an error code, so repeated reads share one object
+fn cell_error_to_py_string<'py>(py: Python<'py>, e: &CellError) -> Bound<'py, PyString> {
+    match e {
+        CellError::Div0 => intern!(py, "#DIV/0!"),
+        CellError::Na => intern!(py, "#N/A"),
+        CellError::Name => intern!(py, "#NAME?"),
+        CellError::Null => intern!(py, "#NULL!"),
+        CellError::Num => intern!(py, "#NUM!"),
+        CellError::Ref => intern!(py, "#REF!"),
+        CellError::Value => intern!(py, "#VALUE!"),
+        CellError::GettingData => intern!(py, "#GETTING_DATA"),
+        CellError::Spill => intern!(py, "#SPILL!"),
+        CellError::Calc => intern!(py, "#CALC!"),
+    }
+    .clone()
+}
+
 // =============================================================================
 // CellValue - Python wrapper for cell values
 // =============================================================================
@@ -54,6 +75,22 @@ pub struct PyCellValue {
     inner: CoreCellValue,
 }
 
+impl PyCellValue {
+    /// Copy the parts of a core value that the Python API exposes
+    ///
+    /// Numbers, booleans, errors and empty cells are plain copies and text
+    /// shares the underlying `Arc<str>`. Formulas keep only their text, so
+    /// reading a formula cell never deep-copies its cached result or spilled
+    /// array.
+    fn from_core(value: &CoreCellValue) -> Self {
+        let inner = match value {
+            CoreCellValue::Formula { text, .. } => CoreCellValue::formula(text.as_str()),
+            other => other.clone(),
+        };
+        Self { inner }
+    }
+}
+
 #[pymethods]
 impl PyCellValue {
     /// Check if the cell is empty
@@ -101,9 +138,9 @@ impl PyCellValue {
     }
 
     /// Get the value as text, or None if not text
-    fn as_text(&self) -> Option<String> {
+    fn as_text<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
         match &self.inner {
-            CoreCellValue::String(s) => Some(s.to_string()),
+            CoreCellValue::String(s) => Some(PyString::new_bound(py, s.as_str())),
             _ => None,
         }
     }
@@ -117,9 +154,9 @@ impl PyCellValue {
     }
 
     /// Get the error string, or None if not an error
-    fn as_error(&self) -> Option<&'static str> {
+    fn as_error<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
         match &self.inner {
-            CoreCellValue::Error(e) => Some(cell_error_to_string(e)),
+            CoreCellValue::Error(e) => Some(cell_error_to_py_string(py, e)),
             _ => None,
         }
     }
@@ -137,9 +174,9 @@ impl PyCellValue {
         match &self.inner {
             CoreCellValue::Empty => py.None(),
             CoreCellValue::Number(n) => n.into_py(py),
-            CoreCellValue::String(s) => s.to_string().into_py(py),
+            CoreCellValue::String(s) => PyString::new_bound(py, s.as_str()).into_py(py),
             CoreCellValue::Boolean(b) => b.into_py(py),
-            CoreCellValue::Error(e) => cell_error_to_string(e).into_py(py),
+            CoreCellValue::Error(e) => cell_error_to_py_string(py, e).into_py(py),
             CoreCellValue::Formula { text, .. } => text.into_py(py),
             CoreCellValue::SpillTarget { .. } => py.None(), // Spill targets appear empty
         }
@@ -157,15 +194,15 @@ impl PyCellValue {
         }
     }
 
-    fn __str__(&self) -> String {
+    fn __str__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match &self.inner {
-            CoreCellValue::Empty => "".to_string(),
-            CoreCellValue::Number(n) => n.to_string(),
-            CoreCellValue::String(s) => s.to_string(),
-            CoreCellValue::Boolean(b) => if *b { "TRUE" } else { "FALSE" }.to_string(),
-            CoreCellValue::Error(e) => cell_error_to_string(e).to_string(),
-            CoreCellValue::Formula { text, .. } => text.clone(),
-            CoreCellValue::SpillTarget { .. } => "".to_string(),
+            CoreCellValue::Empty | CoreCellValue::SpillTarget { .. } => intern!(py, "").clone(),
+            CoreCellValue::Number(n) => PyString::new_bound(py, &n.to_string()),
+            CoreCellValue::String(s) => PyString::new_bound(py, s.as_str()),
+            CoreCellValue::Boolean(true) => intern!(py, "TRUE").clone(),
+            CoreCellValue::Boolean(false) => intern!(py, "FALSE").clone(),
+            CoreCellValue::Error(e) => cell_error_to_py_string(py, e),
+            CoreCellValue::Formula { text, .. } => PyString::new_bound(py, text),
         }
     }
 }
@@ -293,6 +330,62 @@ impl PyWorksheet {
         ws.set_cell_formula(address, formula).map_err(to_py_err)
     }
 
+    /// Set many cell values in a single call
+    ///
+    /// All addresses and values are converted up front, then written under
+    /// one lock, so a batch costs a single call into the native module.
+    ///
+    /// Args:
+    ///     values: dict mapping addresses to values, or a list of
+    ///         (address, value) tuples. Values follow the same rules as
+    ///         set_cell().
+    #[pyo3(signature = (values))]
+    fn set_cells_bulk(&self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        let items = extract_address_pairs(values)?;
+        let mut batch = Vec::with_capacity(items.len());
+        for (address, value) in &items {
+            let addr = parse_address(address)?;
+            batch.push((addr, python_to_cell_value(value)?));
+        }
+
+        let mut wb = self.workbook.write().map_err(to_py_err)?;
+        let ws = wb
+            .worksheet_mut(self.sheet_index)
+            .ok_or_else(|| PyIndexError::new_err("Worksheet no longer exists"))?;
+
+        for (addr, cell_value) in batch {
+            ws.set_cell_value_at(addr.row, addr.col, cell_value)
+                .map_err(to_py_err)?;
+        }
+        Ok(())
+    }
+
+    /// Set many formulas in a single call
+    ///
+    /// Args:
+    ///     formulas: dict mapping addresses to formula strings, or a list of
+    ///         (address, formula) tuples
+    #[pyo3(signature = (formulas))]
+    fn set_formulas_bulk(&self, formulas: &Bound<'_, PyAny>) -> PyResult<()> {
+        let items = extract_address_pairs(formulas)?;
+        let mut batch = Vec::with_capacity(items.len());
+        for (address, formula) in &items {
+            let addr = parse_address(address)?;
+            batch.push((addr, formula.extract::<String>()?));
+        }
+
+        let mut wb = self.workbook.write().map_err(to_py_err)?;
+        let ws = wb
+            .worksheet_mut(self.sheet_index)
+            .ok_or_else(|| PyIndexError::new_err("Worksheet no longer exists"))?;
+
+        for (addr, formula) in batch {
+            ws.set_cell_formula_at(addr.row, addr.col, &formula)
+                .map_err(to_py_err)?;
+        }
+        Ok(())
+    }
+
     /// Get the raw cell value (not calculated)
     #[pyo3(signature = (address))]
     fn get_cell(&self, address: &str) -> PyResult<PyCellValue> {
@@ -304,9 +397,12 @@ impl PyWorksheet {
         let addr = duke_sheets_core::CellAddress::parse(address)
             .map_err(|e| PyValueError::new_err(format!("Invalid cell address: {}", e)))?;
 
-        let value = ws.get_value_at(addr.row, addr.col);
-
-        Ok(PyCellValue { inner: value })
+        Ok(ws
+            .cell_at(addr.row, addr.col)
+            .map(|cell| PyCellValue::from_core(&cell.value))
+            .unwrap_or(PyCellValue {
+                inner: CoreCellValue::Empty,
+            }))
     }
 
     /// Get the calculated value of a cell
@@ -323,12 +419,107 @@ impl PyWorksheet {
         let addr = duke_sheets_core::CellAddress::parse(address)
             .map_err(|e| PyValueError::new_err(format!("Invalid cell address: {}", e)))?;
 
-        let value = ws
+        Ok(ws
             .get_calculated_value_at(addr.row, addr.col)
-            .cloned()
-            .unwrap_or(CoreCellValue::Empty);
+            .map(PyCellValue::from_core)
+            .unwrap_or(PyCellValue {
+                inner: CoreCellValue::Empty,
+            }))
+    }
 
-        Ok(PyCellValue { inner: value })
+    /// Read the calculated values of a range into a 2-D float64 numpy array
+    ///
+    /// Non-numeric and empty cells are returned as NaN. Booleans are
+    /// returned as 1.0 / 0.0.
+    ///
+    /// Args:
+    ///     range_str: Range address (e.g., "A1:C10")
+    ///
+    /// Returns:
+    ///     numpy.ndarray of shape (rows, cols)
+    #[pyo3(signature = (range_str))]
+    fn read_range_numpy<'py>(
+        &self,
+        py: Python<'py>,
+        range_str: &str,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let range = parse_range(range_str)?;
+        let rows = (range.end.row - range.start.row + 1) as usize;
+        let cols = (range.end.col - range.start.col + 1) as usize;
+
+        let mut data = Vec::with_capacity(rows * cols);
+        {
+            let wb = self.workbook.read().map_err(to_py_err)?;
+            let ws = wb
+                .worksheet(self.sheet_index)
+                .ok_or_else(|| PyIndexError::new_err("Worksheet no longer exists"))?;
+
+            for row in range.start.row..=range.end.row {
+                for col in range.start.col..=range.end.col {
+                    let n = match ws.get_calculated_value_at(row, col) {
+                        Some(CoreCellValue::Number(n)) => *n,
+                        Some(CoreCellValue::Boolean(b)) => f64::from(u8::from(*b)),
+                        _ => f64::NAN,
+                    };
+                    data.push(n);
+                }
+            }
+        }
+
+        let array = Array2::from_shape_vec((rows, cols), data).map_err(to_py_err)?;
+        Ok(array.into_pyarray_bound(py))
+    }
+
+    /// Write a float64 numpy array into a range
+    ///
+    /// Values are written in row-major order, so a 1-D array fills a
+    /// single row or column and a 2-D array must match the range shape.
+    /// NaN entries clear the corresponding cell.
+    ///
+    /// Args:
+    ///     range_str: Range address (e.g., "A1:A4")
+    ///     values: numpy array with as many elements as the range has cells
+    #[pyo3(signature = (range_str, values))]
+    fn write_range_numpy(
+        &self,
+        range_str: &str,
+        values: PyReadonlyArrayDyn<'_, f64>,
+    ) -> PyResult<()> {
+        let range = parse_range(range_str)?;
+        let rows = (range.end.row - range.start.row + 1) as usize;
+        let cols = (range.end.col - range.start.col + 1) as usize;
+
+        let array = values.as_array();
+        let matches_shape = match array.shape() {
+            [n] => *n == rows * cols && (rows == 1 || cols == 1),
+            [r, c] => *r == rows && *c == cols,
+            _ => false,
+        };
+        if !matches_shape {
+            return Err(PyValueError::new_err(format!(
+                "Array of shape {:?} does not fit range {} ({} x {})",
+                array.shape(),
+                range_str,
+                rows,
+                cols
+            )));
+        }
+
+        let mut wb = self.workbook.write().map_err(to_py_err)?;
+        let ws = wb
+            .worksheet_mut(self.sheet_index)
+            .ok_or_else(|| PyIndexError::new_err("Worksheet no longer exists"))?;
+
+        for (i, &n) in array.iter().enumerate() {
+            let row = range.start.row + (i / cols) as u32;
+            let col = range.start.col + (i % cols) as u16;
+            if n.is_nan() {
+                ws.clear_cell_at(row, col);
+            } else {
+                ws.set_cell_value_at(row, col, n).map_err(to_py_err)?;
+            }
+        }
+        Ok(())
     }
 
     /// Get the used range as (min_row, min_col, max_row, max_col)
@@ -472,11 +663,13 @@ impl PyWorkbook {
     ///     Workbook instance
     #[staticmethod]
     #[pyo3(signature = (path))]
-    fn open(path: &str) -> PyResult<Self> {
+    fn open(py: Python<'_>, path: &str) -> PyResult<Self> {
         use duke_sheets::WorkbookExt;
         let path = PathBuf::from(path);
 
-        let wb = Workbook::open(&path).map_err(|e| PyIOError::new_err(e.to_string()))?;
+        let wb = py
+            .allow_threads(|| Workbook::open(&path).map_err(|e| e.to_string()))
+            .map_err(PyIOError::new_err)?;
 
         Ok(Self {
             inner: Arc::new(RwLock::new(wb)),
@@ -492,13 +685,15 @@ impl PyWorkbook {
     /// Args:
     ///     path: Path to save to
     #[pyo3(signature = (path))]
-    fn save(&self, path: &str) -> PyResult<()> {
+    fn save(&self, py: Python<'_>, path: &str) -> PyResult<()> {
         use duke_sheets::WorkbookExt;
-        let wb = self.inner.read().map_err(to_py_err)?;
         let path = PathBuf::from(path);
 
-        wb.save(&path)
-            .map_err(|e| PyIOError::new_err(e.to_string()))
+        py.allow_threads(|| {
+            let wb = self.inner.read().map_err(to_py_err)?;
+            wb.save(&path)
+                .map_err(|e| PyIOError::new_err(e.to_string()))
+        })
     }
 
     /// Get the number of worksheets
@@ -584,37 +779,52 @@ impl PyWorkbook {
     ///
     /// Returns:
     ///     CalculationStats with information about the calculation
-    fn calculate(&self) -> PyResult<PyCalculationStats> {
-        let mut wb = self.inner.write().map_err(to_py_err)?;
-        let stats = wb.calculate().map_err(to_py_err)?;
-        Ok(stats.into())
+    fn calculate(&self, py: Python<'_>) -> PyResult<PyCalculationStats> {
+        py.allow_threads(|| {
+            let mut wb = self.inner.write().map_err(to_py_err)?;
+            let stats = wb.calculate().map_err(to_py_err)?;
+            Ok(stats.into())
+        })
     }
 
-    /// Calculate with custom options for iterative calculation
+    /// Calculate with custom options
     ///
     /// Args:
     ///     iterative: Enable iterative calculation for circular references
     ///     max_iterations: Maximum number of iterations (default 100)
     ///     max_change: Convergence threshold (default 0.001)
+    ///     force_full_calculation: Re-evaluate every formula (default True).
+    ///         When False, only formulas affected by cells edited since the
+    ///         last calculation, and volatile formulas, are re-evaluated.
     ///
     /// Returns:
     ///     CalculationStats with information about the calculation
-    #[pyo3(signature = (iterative = false, max_iterations = 100, max_change = 0.001))]
+    #[pyo3(signature = (
+        iterative = false,
+        max_iterations = 100,
+        max_change = 0.001,
+        force_full_calculation = true
+    ))]
     fn calculate_with_options(
         &self,
+        py: Python<'_>,
         iterative: bool,
         max_iterations: u32,
         max_change: f64,
+        force_full_calculation: bool,
     ) -> PyResult<PyCalculationStats> {
-        let mut wb = self.inner.write().map_err(to_py_err)?;
         let options = CalculationOptions {
             iterative,
             max_iterations,
             max_change,
+            force_full_calculation,
             ..Default::default()
         };
-        let stats = wb.calculate_with_options(&options).map_err(to_py_err)?;
-        Ok(stats.into())
+        py.allow_threads(|| {
+            let mut wb = self.inner.write().map_err(to_py_err)?;
+            let stats = wb.calculate_with_options(&options).map_err(to_py_err)?;
+            Ok(stats.into())
+        })
     }
 
     /// Define a named range
@@ -670,6 +880,38 @@ fn python_to_cell_value(value: &Bound<'_, PyAny>) -> PyResult<CoreCellValue> {
     }
 }
 
+/// Parse an A1-style cell address, raising ValueError on failure
+fn parse_address(address: &str) -> PyResult<duke_sheets_core::CellAddress> {
+    duke_sheets_core::CellAddress::parse(address)
+        .map_err(|e| PyValueError::new_err(format!("Invalid cell address: {}", e)))
+}
+
+/// Parse an A1-style range, raising ValueError on failure
+fn parse_range(range_str: &str) -> PyResult<duke_sheets_core::CellRange> {
+    duke_sheets_core::CellRange::parse(range_str)
+        .map_err(|e| PyValueError::new_err(format!("Invalid range: {}", e)))
+}
+
+/// Collect (address, value) pairs from a dict or a sequence of 2-tuples
+fn extract_address_pairs<'py>(
+    values: &Bound<'py, PyAny>,
+) -> PyResult<Vec<(String, Bound<'py, PyAny>)>> {
+    if let Ok(dict) = values.downcast::<PyDict>() {
+        let mut items = Vec::with_capacity(dict.len());
+        for (key, value) in dict.iter() {
+            items.push((key.extract::<String>()?, value));
+        }
+        Ok(items)
+    } else {
+        let mut items = Vec::with_capacity(values.len().unwrap_or(0));
+        for item in values.iter()? {
+            let (address, value) = item?.extract::<(String, Bound<'py, PyAny>)>()?;
+            items.push((address, value));
+        }
+        Ok(items)
+    }
+}
+
 // =============================================================================
 // Module definition
 // =============================================================================
@@ -3,39 +3,45 @@ Pytest configuration and shared fixtures for duke_sheets tests.
 """
 
 import pytest
-import tempfile
-import os
+
+
+@pytest.fixture(scope="session")
+def ds():
+    """The duke_sheets module, imported once per test session."""
+    import duke_sheets
+    return duke_sheets
 
 
 @pytest.fixture
-def workbook():
+def workbook(ds):
     """Create a fresh workbook for each test."""
-    import duke_sheets
-    return duke_sheets.Workbook()
+    return ds.Workbook()
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for file tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_dir(tmp_path):
+    """Create a temporary directory for file tests.
+
+    Backed by pytest's tmp_path so each xdist worker gets its own tree.
+    """
+    return str(tmp_path)
 
 
 @pytest.fixture
-def sample_workbook():
+def sample_workbook(ds):
     """Create a workbook with some sample data."""
-    import duke_sheets
-    
-    wb = duke_sheets.Workbook()
+    wb = ds.Workbook()
     sheet = wb.get_sheet(0)
     
     # Set up some sample data
-    sheet.set_cell("A1", 10.0)
-    sheet.set_cell("A2", 20.0)
-    sheet.set_cell("A3", 30.0)
-    sheet.set_cell("B1", "Hello")
-    sheet.set_cell("B2", "World")
-    sheet.set_cell("C1", True)
-    sheet.set_cell("C2", False)
+    sheet.set_cells_bulk({
+        "A1": 10.0,
+        "A2": 20.0,
+        "A3": 30.0,
+        "B1": "Hello",
+        "B2": "World",
+        "C1": True,
+        "C2": False,
+    })
     
     return wb
@@ -155,6 +155,30 @@ class TestRecalculation:
         assert stats1.formula_count == 1
         assert stats2.formula_count == 1
 
+    def test_incremental_recalculation(self, workbook):
+        """With force_full_calculation=False only affected formulas rerun."""
+        sheet = workbook.get_sheet(0)
+        sheet.set_cell("A1", 5.0)
+        sheet.set_cell("B1", 1.0)
+        sheet.set_formula("A2", "=A1*2")
+        sheet.set_formula("A3", "=A2+10")
+        sheet.set_formula("B2", "=B1+1")
+
+        stats = workbook.calculate_with_options(force_full_calculation=False)
+        assert stats.cells_calculated == 3
+
+        # Nothing changed, nothing to evaluate
+        stats = workbook.calculate_with_options(force_full_calculation=False)
+        assert stats.formula_count == 3
+        assert stats.cells_calculated == 0
+
+        # Only the dependents of A1 are recomputed
+        sheet.set_cell("A1", 7.0)
+        stats = workbook.calculate_with_options(force_full_calculation=False)
+        assert stats.cells_calculated == 2
+        assert sheet.get_calculated_value("A3").as_number() == 24.0
+        assert sheet.get_calculated_value("B2").as_number() == 2.0
+
 
 class TestCalculationOrder:
     """Test that formulas are calculated in correct order."""
@@ -179,11 +203,9 @@ class TestCalculationOrder:
         assert sheet.get_calculated_value("C1").as_number() == 35.0
         assert sheet.get_calculated_value("D1").as_number() == 70.0
 
-    def test_cross_sheet_dependencies(self):
+    def test_cross_sheet_dependencies(self, ds):
         """Formulas should work across sheets."""
-        import duke_sheets
-        
-        wb = duke_sheets.Workbook()
+        wb = ds.Workbook()
         wb.add_sheet("Data")
         
         sheet1 = wb.get_sheet(0)
@@ -87,6 +87,19 @@ class TestFormulaCalculation:
         value = sheet.get_calculated_value("A5")
         assert value.as_number() == 10.0
 
+    def test_sum_over_numpy_range(self, workbook):
+        """SUM should see values written with write_range_numpy."""
+        np = pytest.importorskip("numpy")
+        sheet = workbook.get_sheet(0)
+        sheet.write_range_numpy("A1:A4", np.array([1.0, 2.0, 3.0, 4.0]))
+        sheet.set_formula("A5", "=SUM(A1:A4)")
+
+        workbook.calculate()
+
+        result = sheet.read_range_numpy("A1:A5")
+        assert result.shape == (5, 1)
+        assert result[4, 0] == 10.0
+
     def test_average_function(self, workbook):
         """Should calculate AVERAGE function."""
         sheet = workbook.get_sheet(0)
@@ -84,6 +84,81 @@ class TestCellOperations:
         assert value.as_number() == 42.0
 
 
+class TestBulkOperations:
+    """Test batched cell and formula setters."""
+
+    def test_set_cells_bulk_dict(self, workbook):
+        """Should set every value in a dict."""
+        sheet = workbook.get_sheet(0)
+        sheet.set_cells_bulk({"A1": 1.0, "B1": "x", "C1": True, "D1": None})
+
+        assert sheet.get_cell("A1").as_number() == 1.0
+        assert sheet.get_cell("B1").as_text() == "x"
+        assert sheet.get_cell("C1").as_boolean() == True
+        assert sheet.get_cell("D1").is_empty
+
+    def test_set_cells_bulk_tuples(self, workbook):
+        """Should accept a list of (address, value) tuples."""
+        sheet = workbook.get_sheet(0)
+        sheet.set_cells_bulk([("A1", 1), ("A2", 2), ("A3", 3)])
+
+        assert sheet.get_cell("A3").as_number() == 3.0
+
+    def test_set_cells_bulk_invalid_address(self, workbook):
+        """An invalid address should fail before anything is written."""
+        sheet = workbook.get_sheet(0)
+
+        with pytest.raises(ValueError):
+            sheet.set_cells_bulk({"A1": 1.0, "invalid": 2.0})
+        assert sheet.get_cell("A1").is_empty
+
+    def test_set_formulas_bulk(self, workbook):
+        """Should set every formula in the batch."""
+        sheet = workbook.get_sheet(0)
+        sheet.set_cell("A1", 10.0)
+        sheet.set_formulas_bulk({"B1": "=A1*2", "C1": "=B1+1"})
+
+        workbook.calculate()
+        assert sheet.get_calculated_value("B1").as_number() == 20.0
+        assert sheet.get_calculated_value("C1").as_number() == 21.0
+
+
+class TestNumpyRanges:
+    """Test numpy range reads and writes."""
+
+    def test_write_read_roundtrip(self, workbook):
+        """A written 2-D array should read back unchanged."""
+        np = pytest.importorskip("numpy")
+        sheet = workbook.get_sheet(0)
+        data = np.array([[1.0, 2.0], [3.0, 4.0]])
+        sheet.write_range_numpy("B2:C3", data)
+
+        assert sheet.get_cell("C2").as_number() == 2.0
+        result = sheet.read_range_numpy("B2:C3")
+        assert result.shape == (2, 2)
+        assert (result == data).all()
+
+    def test_read_non_numeric_is_nan(self, workbook):
+        """Text and empty cells should read as NaN."""
+        np = pytest.importorskip("numpy")
+        sheet = workbook.get_sheet(0)
+        sheet.set_cell("A1", "text")
+        sheet.set_cell("A2", 5.0)
+
+        result = sheet.read_range_numpy("A1:A3")
+        assert np.isnan(result[0, 0])
+        assert result[1, 0] == 5.0
+        assert np.isnan(result[2, 0])
+
+    def test_write_shape_mismatch(self, workbook):
+        """An array that does not fit the range should raise ValueError."""
+        np = pytest.importorskip("numpy")
+        sheet = workbook.get_sheet(0)
+
+        with pytest.raises(ValueError):
+            sheet.write_range_numpy("A1:A3", np.array([1.0, 2.0]))
+
+
 class TestUsedRange:
     """Test used range detection."""
 
@@ -5,6 +5,96 @@ use crate::{MAX_COLS, MAX_ROWS};
 use std::fmt;
 use std::str::FromStr;
 
+/// A `u128` with every byte set to 1, for SWAR (SIMD within a register) tricks
+const LANES: u128 = u128::MAX / 0xFF;
+
+/// Column letters for a zero-based column index, built in a stack buffer
+///
+/// Returns the buffer and the offset the letters start at. Four letters
+/// cover every `u16` column.
+fn column_letters(col: u16) -> ([u8; 4], usize) {
+    let mut buf = [0u8; 4];
+    let mut start = buf.len();
+    let mut n = col as u32 + 1; // 1-based for calculation
+
+    while n > 0 {
+        n -= 1;
+        start -= 1;
+        buf[start] = (n % 26) as u8 + b'A';
+        n /= 26;
+    }
+
+    (buf, start)
+}
+
+/// Fast path for plain relative addresses like "B7" or "XFD1048576"
+///
+/// Decodes 1-3 column letters and 1-7 row digits without a per-byte loop:
+/// the address is loaded into one register, letter and digit bytes are
+/// classified lane-wise, and the row is folded with the SWAR atoi trick.
+/// Returns `None` (leaving errors and `$` markers to the general parser)
+/// unless the address is well formed and in bounds.
+fn parse_relative_a1(bytes: &[u8]) -> Option<(u32, u16)> {
+    let len = bytes.len();
+    if !(2..=10).contains(&len) {
+        return None;
+    }
+
+    let mut buf = [0u8; 16];
+    buf[..len].copy_from_slice(bytes);
+    let word = u128::from_le_bytes(buf);
+    if word & (LANES * 0x80) != 0 {
+        return None;
+    }
+
+    // High bit of each lane is set where the byte is an ASCII digit (no lane
+    // can carry into the next since every byte is below 0x80)
+    let digits = (word + LANES * (0x80 - b'0' as u128))
+        & !(word + LANES * (0x80 - b'9' as u128 - 1))
+        & (LANES * 0x80);
+    let letter_count = (digits.trailing_zeros() / 8) as usize;
+    if !(1..=3).contains(&letter_count) || len - letter_count > 7 {
+        return None;
+    }
+    let digit_count = len - letter_count;
+    // Every byte after the letters must be a digit
+    let expected =
+        (LANES * 0x80) & ((1u128 << (8 * len)) - 1) & !((1u128 << (8 * letter_count)) - 1);
+    if digits != expected {
+        return None;
+    }
+
+    // Column: uppercase the letter lanes, check they are A-Z, then shift
+    // them to the end of a 3-lane word so the weights are always 676/26/1
+    let letter_mask = (1u32 << (8 * letter_count)) - 1;
+    let letters = (word as u32 & letter_mask) & 0x00DF_DFDF;
+    let lanes = 0x0101_0101 & letter_mask;
+    let is_letter = (letters + lanes * (0x80 - b'A' as u32))
+        & !(letters + lanes * (0x80 - b'Z' as u32 - 1))
+        & (lanes * 0x80);
+    if is_letter != lanes * 0x80 {
+        return None;
+    }
+    let values = (letters - lanes * (b'A' as u32 - 1)) << (8 * (3 - letter_count));
+    let col = (values & 0xFF) * 676 + ((values >> 8) & 0xFF) * 26 + (values >> 16) - 1;
+
+    // Row: left-pad the digits with '0' to eight lanes, combine neighbouring
+    // digits into pairs, then fold the four pairs with two multiplies
+    let row_digits = (word >> (8 * letter_count)) as u64;
+    let padded =
+        (row_digits << (8 * (8 - digit_count))) | (0x3030_3030_3030_3030 >> (8 * digit_count));
+    let v = padded - 0x3030_3030_3030_3030;
+    let pairs = v * 10 + (v >> 8);
+    let high = (pairs & 0x0000_00FF_0000_00FF).wrapping_mul(100 + (1_000_000 << 32));
+    let low = ((pairs >> 16) & 0x0000_00FF_0000_00FF).wrapping_mul(1 + (10_000 << 32));
+    let row = (high.wrapping_add(low) >> 32) as u32;
+
+    if row == 0 || row > MAX_ROWS || col >= MAX_COLS as u32 {
+        return None;
+    }
+    Some((row - 1, col as u16))
+}
+
 /// A cell address (e.g., "A1", "$B$2")
 ///
 /// Cell addresses in Excel use a combination of column letters (A-XFD) and row numbers (1-1048576).
@@ -70,6 +160,9 @@ impl CellAddress {
     /// ```
     pub fn parse(s: &str) -> Result<Self> {
         let s = s.trim();
+        if let Some((row, col)) = parse_relative_a1(s.as_bytes()) {
+            return Ok(Self::new(row, col));
+        }
         if s.is_empty() {
             return Err(Error::InvalidAddress("empty address".into()));
         }
@@ -147,17 +240,8 @@ impl CellAddress {
 
     /// Convert column index to letters (0 = A, 25 = Z, 26 = AA, etc.)
     pub fn column_to_letters(col: u16) -> String {
-        let mut result = String::new();
-        let mut n = col as u32 + 1; // 1-based for calculation
-
-        while n > 0 {
-            n -= 1;
-            let c = ((n % 26) as u8 + b'A') as char;
-            result.insert(0, c);
-            n /= 26;
-        }
-
-        result
+        let (buf, start) = column_letters(col);
+        buf[start..].iter().map(|&b| b as char).collect()
     }
 
     /// Convert column letters to index (A = 0, Z = 25, AA = 26, etc.)
@@ -167,40 +251,30 @@ impl CellAddress {
         }
 
         let mut col: u32 = 0;
-        for c in letters.chars() {
-            if !c.is_ascii_alphabetic() {
+        for (i, &b) in letters.as_bytes().iter().enumerate() {
+            if !b.is_ascii_alphabetic() {
+                let c = letters[i..].chars().next().unwrap_or_default();
                 return Err(Error::InvalidAddress(format!(
                     "invalid column letter '{}'",
                     c
                 )));
             }
-            col = col * 26 + (c.to_ascii_uppercase() as u32 - 'A' as u32 + 1);
-        }
-
-        let col = col - 1; // Convert to 0-based
-
-        if col >= MAX_COLS as u32 {
-            return Err(Error::ColumnOutOfBounds(col as u16, MAX_COLS - 1));
+            col = col * 26 + (b.to_ascii_uppercase() - b'A') as u32 + 1;
+            // Stop before a long run of letters can overflow
+            if col > MAX_COLS as u32 {
+                return Err(Error::ColumnOutOfBounds(
+                    (col - 1).min(u16::MAX as u32) as u16,
+                    MAX_COLS - 1,
+                ));
+            }
         }
 
-        Ok(col as u16)
+        Ok((col - 1) as u16) // Convert to 0-based
     }
 
     /// Format as A1-style string
     pub fn to_a1_string(&self) -> String {
-        let mut result = String::new();
-
-        if self.col_absolute {
-            result.push('$');
-        }
-        result.push_str(&Self::column_to_letters(self.col));
-
-        if self.row_absolute {
-            result.push('$');
-        }
-        result.push_str(&(self.row + 1).to_string());
-
-        result
+        self.to_string()
     }
 
     /// Create a range from this address to another
@@ -211,7 +285,12 @@ impl CellAddress {
 
 impl fmt::Display for CellAddress {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}", self.to_a1_string())
+        // Formatted straight into `f`: writers emit one of these per cell
+        let (buf, start) = column_letters(self.col);
+        let letters = std::str::from_utf8(&buf[start..]).map_err(|_| fmt::Error)?;
+        let col_marker = if self.col_absolute { "$" } else { "" };
+        let row_marker = if self.row_absolute { "$" } else { "" };
+        write!(f, "{}{}{}{}", col_marker, letters, row_marker, self.row + 1)
     }
 }
 
@@ -346,17 +425,17 @@ impl CellRange {
 
     /// Format as A1:B10 string
     pub fn to_a1_string(&self) -> String {
-        if self.start == self.end {
-            self.start.to_a1_string()
-        } else {
-            format!("{}:{}", self.start.to_a1_string(), self.end.to_a1_string())
-        }
+        self.to_string()
     }
 }
 
 impl fmt::Display for CellRange {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}", self.to_a1_string())
+        if self.start == self.end {
+            write!(f, "{}", self.start)
+        } else {
+            write!(f, "{}:{}", self.start, self.end)
+        }
     }
 }
 
@@ -417,6 +496,7 @@ mod tests {
         assert_eq!(CellAddress::column_to_letters(701), "ZZ");
         assert_eq!(CellAddress::column_to_letters(702), "AAA");
         assert_eq!(CellAddress::column_to_letters(16383), "XFD"); // Max Excel column
+        assert_eq!(CellAddress::column_to_letters(u16::MAX), "CRXP");
     }
 
     #[test]
@@ -433,6 +513,10 @@ mod tests {
         // Case insensitive
         assert_eq!(CellAddress::letters_to_column("a").unwrap(), 0);
         assert_eq!(CellAddress::letters_to_column("aa").unwrap(), 26);
+
+        assert!(CellAddress::letters_to_column("XFE").is_err());
+        assert!(CellAddress::letters_to_column("ZZZZZZZZZZZZZZZZ").is_err());
+        assert!(CellAddress::letters_to_column("A1").is_err());
     }
 
     #[test]
@@ -476,6 +560,44 @@ mod tests {
         assert!(CellAddress::parse("XFE1").is_err()); // Column too large
     }
 
+    #[test]
+    fn test_parse_relative_a1_matches_general_parser() {
+        for col in [0u16, 1, 25, 26, 701, 702, 16383] {
+            for row in [0u32, 8, 9, 99, 1234, 999_999, 1_048_575] {
+                let a1 = format!("{}{}", CellAddress::column_to_letters(col), row + 1);
+                assert_eq!(parse_relative_a1(a1.as_bytes()), Some((row, col)), "{}", a1);
+                let lower = a1.to_ascii_lowercase();
+                assert_eq!(
+                    parse_relative_a1(lower.as_bytes()),
+                    Some((row, col)),
+                    "{}",
+                    lower
+                );
+            }
+        }
+
+        // Anything unusual is left to the general parser
+        for s in [
+            "A",
+            "1",
+            "A0",
+            "$A1",
+            "A$1",
+            "A+1",
+            "A01B",
+            "AAAA1",
+            "A12345678",
+            "XFE1",
+            "A1048577",
+            "@1",
+            "[1",
+            "a:1",
+        ] {
+            assert_eq!(parse_relative_a1(s.as_bytes()), None, "{}", s);
+        }
+        assert_eq!(CellAddress::parse("A01").unwrap(), CellAddress::new(0, 0));
+    }
+
     #[test]
     fn test_cell_address_display() {
         assert_eq!(CellAddress::new(0, 0).to_string(), "A1");
@@ -268,6 +268,7 @@ impl CellStorage {
     pub fn clear(&mut self) {
         self.rows.clear();
         self.merged_regions.clear();
+        self.string_pool.clear();
         self.invalidate_bounds();
     }
 
@@ -565,6 +566,11 @@ impl CellStorage {
         self.spill_sources.contains_key(&(row, col))
     }
 
+    /// Check if any cell is a spill source
+    pub fn has_spill_sources(&self) -> bool {
+        !self.spill_sources.is_empty()
+    }
+
     /// Clear all spill targets for a given source
     ///
     /// This removes all SpillTarget cells that reference the given source cell.
@@ -632,6 +638,24 @@ mod tests {
         assert!(storage.get(1, 1).is_none());
     }
 
+    #[test]
+    fn test_strings_are_not_interned_on_write() {
+        let mut storage = CellStorage::new();
+        storage.set_value(0, 0, CellValue::string("text"));
+        storage.set(1, 0, CellData::new(CellValue::string("text")));
+        assert!(storage.string_pool().is_empty());
+    }
+
+    #[test]
+    fn test_clear_empties_string_pool() {
+        let mut storage = CellStorage::new();
+        let s = storage.string_pool_mut().intern("repeated");
+        storage.set_value(0, 0, CellValue::String(s));
+
+        storage.clear();
+        assert!(storage.string_pool().is_empty());
+    }
+
     #[test]
     fn test_empty_cells_not_stored() {
         let mut storage = CellStorage::new();
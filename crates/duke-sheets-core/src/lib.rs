@@ -49,7 +49,7 @@ pub use conditional_format::{
 pub use error::{Error, Result};
 pub use validation::{DataValidation, ValidationErrorStyle, ValidationOperator, ValidationType};
 pub use workbook::{Workbook, WorkbookSettings};
-pub use worksheet::Worksheet;
+pub use worksheet::{CellChanges, Worksheet};
 
 // Re-export all style types for convenience
 pub use style::{
@@ -18,6 +18,8 @@ pub struct Workbook {
     active_sheet: usize,
     /// Named ranges (defined names)
     named_ranges: NamedRangeCollection,
+    /// Sheets or names changed since the last calculation
+    structure_changed: bool,
 }
 
 impl Workbook {
@@ -28,6 +30,7 @@ impl Workbook {
             settings: WorkbookSettings::default(),
             active_sheet: 0,
             named_ranges: NamedRangeCollection::new(),
+            structure_changed: true,
         };
         wb.add_worksheet_with_name("Sheet1").unwrap();
         wb
@@ -40,6 +43,7 @@ impl Workbook {
             settings: WorkbookSettings::default(),
             active_sheet: 0,
             named_ranges: NamedRangeCollection::new(),
+            structure_changed: true,
         }
     }
 
@@ -85,6 +89,7 @@ impl Workbook {
 
     /// Iterate over all worksheets mutably
     pub fn worksheets_mut(&mut self) -> impl Iterator<Item = &mut Worksheet> {
+        self.structure_changed = true;
         self.worksheets.iter_mut()
     }
 
@@ -101,6 +106,7 @@ impl Workbook {
         let index = self.worksheets.len();
         let worksheet = Worksheet::new(name);
         self.worksheets.push(worksheet);
+        self.structure_changed = true;
 
         Ok(index)
     }
@@ -115,6 +121,7 @@ impl Workbook {
 
         let worksheet = Worksheet::new(name);
         self.worksheets.insert(index, worksheet);
+        self.structure_changed = true;
 
         // Adjust active sheet index if needed
         if self.active_sheet >= index && !self.worksheets.is_empty() {
@@ -129,6 +136,7 @@ impl Workbook {
         self.validate_sheet_name(worksheet.name())?;
         let index = self.worksheets.len();
         self.worksheets.push(worksheet);
+        self.structure_changed = true;
         Ok(index)
     }
 
@@ -139,6 +147,7 @@ impl Workbook {
         }
 
         let worksheet = self.worksheets.remove(index);
+        self.structure_changed = true;
 
         // Adjust active sheet index
         if !self.worksheets.is_empty() {
@@ -163,6 +172,7 @@ impl Workbook {
 
         let worksheet = self.worksheets.remove(from);
         self.worksheets.insert(to, worksheet);
+        self.structure_changed = true;
 
         // Adjust active sheet if needed
         if self.active_sheet == from {
@@ -187,6 +197,7 @@ impl Workbook {
         self.validate_sheet_name_excluding(new_name, Some(index))?;
 
         self.worksheets[index].set_name(new_name);
+        self.structure_changed = true;
         Ok(())
     }
 
@@ -211,9 +222,29 @@ impl Workbook {
 
     /// Get mutable workbook settings
     pub fn settings_mut(&mut self) -> &mut WorkbookSettings {
+        self.structure_changed = true;
         &mut self.settings
     }
 
+    // ==================== Change Tracking ====================
+
+    /// Whether sheets, names or settings changed since the last call to
+    /// [`mark_calculated`](Self::mark_calculated)
+    ///
+    /// When this is `true`, cell-level changes reported by
+    /// [`Worksheet::changes`] are not enough to decide what to recalculate.
+    pub fn structure_changed(&self) -> bool {
+        self.structure_changed
+    }
+
+    /// Reset change tracking after a successful calculation
+    pub fn mark_calculated(&mut self) {
+        self.structure_changed = false;
+        for worksheet in &mut self.worksheets {
+            worksheet.take_changes();
+        }
+    }
+
     // ==================== Named Ranges ====================
 
     /// Define a new workbook-scoped named range
@@ -237,6 +268,7 @@ impl Workbook {
         scope: NameScope,
     ) -> Result<()> {
         let range = NamedRange::new(name, refers_to, scope);
+        self.structure_changed = true;
         self.named_ranges
             .define(range)
             .map_err(|e| Error::InvalidName(e))
@@ -261,11 +293,13 @@ impl Workbook {
 
     /// Remove a workbook-scoped named range
     pub fn remove_name(&mut self, name: &str) -> Option<NamedRange> {
+        self.structure_changed = true;
         self.named_ranges.remove(name, &NameScope::Workbook)
     }
 
     /// Remove a sheet-scoped named range
     pub fn remove_name_from_sheet(&mut self, name: &str, sheet_index: usize) -> Option<NamedRange> {
+        self.structure_changed = true;
         self.named_ranges
             .remove(name, &NameScope::Sheet(sheet_index))
     }
@@ -277,6 +311,7 @@ impl Workbook {
 
     /// Get the named range collection (mutable)
     pub fn named_ranges_mut(&mut self) -> &mut NamedRangeCollection {
+        self.structure_changed = true;
         &mut self.named_ranges
     }
 
@@ -39,6 +39,41 @@ pub struct Worksheet {
     data_validations: Vec<DataValidation>,
     /// Conditional formatting rules
     conditional_formats: Vec<ConditionalFormatRule>,
+    /// Cell edits since the last calculation
+    changes: CellChanges,
+}
+
+/// Maximum number of individually tracked cell edits before a sheet
+/// falls back to [`CellChanges::All`]
+const MAX_TRACKED_CHANGES: usize = 4096;
+
+/// Cells edited since changes were last taken with [`Worksheet::take_changes`]
+///
+/// Only edits to cell contents are tracked. Writing calculation results
+/// (e.g. [`Worksheet::set_formula_result`]) does not count as a change.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub enum CellChanges {
+    /// No cells were edited
+    #[default]
+    None,
+    /// The listed (row, col) cells were edited
+    Cells(Vec<(u32, u16)>),
+    /// Too many cells were edited to track individually, or cells were
+    /// edited through raw mutable access
+    All,
+}
+
+impl CellChanges {
+    fn mark(&mut self, row: u32, col: u16) {
+        match self {
+            CellChanges::None => *self = CellChanges::Cells(vec![(row, col)]),
+            CellChanges::Cells(cells) if cells.len() < MAX_TRACKED_CHANGES => {
+                cells.push((row, col))
+            }
+            CellChanges::Cells(_) => *self = CellChanges::All,
+            CellChanges::All => {}
+        }
+    }
 }
 
 impl Worksheet {
@@ -57,6 +92,7 @@ impl Worksheet {
             comment_authors: Vec::new(),
             data_validations: Vec::new(),
             conditional_formats: Vec::new(),
+            changes: CellChanges::None,
         }
     }
 
@@ -68,6 +104,8 @@ impl Worksheet {
     /// Set the sheet name
     pub fn set_name<S: Into<String>>(&mut self, name: S) {
         self.name = name.into();
+        // References by sheet name may now resolve differently
+        self.changes = CellChanges::All;
     }
 
     /// Check if the sheet is visible
@@ -114,7 +152,11 @@ impl Worksheet {
     }
 
     /// Get a mutable cell by row and column indices
+    ///
+    /// The sheet cannot tell what is changed through the returned reference,
+    /// so this marks every cell as changed for the next calculation.
     pub fn cell_at_mut(&mut self, row: u32, col: u16) -> Option<&mut CellData> {
+        self.changes = CellChanges::All;
         self.cells.get_mut(row, col)
     }
 
@@ -189,6 +231,7 @@ impl Worksheet {
     ) -> Result<()> {
         self.validate_cell_position(row, col)?;
         self.cells.set_value(row, col, value.into());
+        self.changes.mark(row, col);
         Ok(())
     }
 
@@ -210,6 +253,7 @@ impl Worksheet {
         };
 
         self.cells.set_value(row, col, CellValue::formula(formula));
+        self.changes.mark(row, col);
         Ok(())
     }
 
@@ -230,13 +274,14 @@ impl Worksheet {
     /// Clear a cell
     pub fn clear_cell(&mut self, address: &str) -> Result<()> {
         let addr = CellAddress::parse(address)?;
-        self.cells.remove(addr.row, addr.col);
+        self.clear_cell_at(addr.row, addr.col);
         Ok(())
     }
 
     /// Clear a cell by indices
     pub fn clear_cell_at(&mut self, row: u32, col: u16) {
         self.cells.remove(row, col);
+        self.changes.mark(row, col);
     }
 
     // === Range Operations ===
@@ -254,6 +299,7 @@ impl Worksheet {
     pub fn clear_range(&mut self, range: &CellRange) {
         for addr in range.cells() {
             self.cells.remove(addr.row, addr.col);
+            self.changes.mark(addr.row, addr.col);
         }
     }
 
@@ -267,6 +313,7 @@ impl Worksheet {
         for addr in range.cells() {
             self.validate_cell_position(addr.row, addr.col)?;
             self.cells.set_value(addr.row, addr.col, value.clone());
+            self.changes.mark(addr.row, addr.col);
         }
         Ok(())
     }
@@ -599,9 +646,27 @@ impl Worksheet {
     /// Get mutable cell storage (internal use)
     #[allow(dead_code)]
     pub(crate) fn cells_mut(&mut self) -> &mut CellStorage {
+        self.changes = CellChanges::All;
         &mut self.cells
     }
 
+    // === Change Tracking ===
+
+    /// Cells edited since changes were last taken
+    pub fn changes(&self) -> &CellChanges {
+        &self.changes
+    }
+
+    /// Take the cells edited since the last call, resetting the tracker
+    pub fn take_changes(&mut self) -> CellChanges {
+        std::mem::take(&mut self.changes)
+    }
+
+    /// Mark every cell as changed
+    pub fn mark_all_changed(&mut self) {
+        self.changes = CellChanges::All;
+    }
+
     /// Validate cell position
     fn validate_cell_position(&self, row: u32, col: u16) -> Result<()> {
         if row >= MAX_ROWS {
@@ -812,6 +877,11 @@ impl Worksheet {
         self.cells.is_spill_source(row, col)
     }
 
+    /// Check if any cell on the sheet is a spill source
+    pub fn has_spills(&self) -> bool {
+        self.cells.has_spill_sources()
+    }
+
     /// Get the source cell coordinates for a spill target
     pub fn get_spill_source(&self, row: u32, col: u16) -> Option<(u32, u16)> {
         self.cells
@@ -971,6 +1041,24 @@ mod tests {
         assert_eq!(value.formula_text(), Some("=SUM(B1:B10)"));
     }
 
+    #[test]
+    fn test_change_tracking() {
+        let mut ws = Worksheet::new("Test");
+
+        ws.set_cell_value("A1", 1.0).unwrap();
+        ws.set_cell_formula("B1", "=A1*2").unwrap();
+        ws.set_formula_result(0, 1, CellValue::Number(2.0)).unwrap();
+        assert_eq!(ws.take_changes(), CellChanges::Cells(vec![(0, 0), (0, 1)]));
+        assert_eq!(ws.take_changes(), CellChanges::None);
+
+        ws.cell_at_mut(0, 0);
+        assert_eq!(ws.take_changes(), CellChanges::All);
+
+        ws.fill_range(&CellRange::parse("A1:A5000").unwrap(), 1.0)
+            .unwrap();
+        assert_eq!(ws.take_changes(), CellChanges::All);
+    }
+
     #[test]
     fn test_used_range() {
         let mut ws = Worksheet::new("Test");
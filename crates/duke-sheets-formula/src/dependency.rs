@@ -176,6 +176,144 @@ impl DependencyGraph {
     }
 }
 
+/// A strongly connected component of a [`CsrGraph`]
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct Component {
+    /// Cells in the component
+    pub cells: Vec<CellKey>,
+    /// Whether the component is a circular reference (more than one cell,
+    /// or a single cell that references itself)
+    pub is_cycle: bool,
+}
+
+/// Precedent edges between a fixed set of cells, packed in compressed
+/// sparse row (CSR) form
+///
+/// The precedents of node `i` are `col_idx[row_ptr[i]..row_ptr[i + 1]]`.
+/// Storing edges in two flat arrays keeps traversal cache-friendly compared
+/// to walking the hash sets in [`DependencyGraph`].
+#[derive(Debug, Clone, Default)]
+pub struct CsrGraph {
+    nodes: Vec<CellKey>,
+    row_ptr: Vec<u32>,
+    col_idx: Vec<u32>,
+}
+
+impl CsrGraph {
+    /// Build a graph over `nodes` from the precedents recorded in `graph`
+    ///
+    /// Edges to cells outside `nodes` are dropped.
+    pub fn from_precedents(graph: &DependencyGraph, nodes: &[CellKey]) -> Self {
+        let index: HashMap<CellKey, u32> = nodes
+            .iter()
+            .enumerate()
+            .map(|(i, &cell)| (cell, i as u32))
+            .collect();
+
+        let mut row_ptr = Vec::with_capacity(nodes.len() + 1);
+        let mut col_idx = Vec::new();
+        row_ptr.push(0);
+        for &cell in nodes {
+            col_idx.extend(
+                graph
+                    .get_precedents(cell)
+                    .filter_map(|precedent| index.get(&precedent).copied()),
+            );
+            row_ptr.push(col_idx.len() as u32);
+        }
+
+        Self {
+            nodes: nodes.to_vec(),
+            row_ptr,
+            col_idx,
+        }
+    }
+
+    /// Number of nodes in the graph
+    pub fn node_count(&self) -> usize {
+        self.nodes.len()
+    }
+
+    fn precedents(&self, node: u32) -> &[u32] {
+        let start = self.row_ptr[node as usize] as usize;
+        let end = self.row_ptr[node as usize + 1] as usize;
+        &self.col_idx[start..end]
+    }
+
+    /// Find strongly connected components using Tarjan's algorithm
+    ///
+    /// Components are returned in calculation order: every component comes
+    /// after the components it depends on. The traversal uses explicit
+    /// stacks, so deep dependency chains cannot overflow the call stack.
+    pub fn strongly_connected_components(&self) -> Vec<Component> {
+        const UNVISITED: u32 = u32::MAX;
+
+        let n = self.nodes.len();
+        let mut index = vec![UNVISITED; n];
+        let mut lowlink = vec![0u32; n];
+        let mut on_stack = vec![false; n];
+        let mut stack: Vec<u32> = Vec::new();
+        // (node, position of the next edge to visit)
+        let mut call: Vec<(u32, u32)> = Vec::new();
+        let mut next_index = 0u32;
+        let mut components = Vec::new();
+
+        for root in 0..n as u32 {
+            if index[root as usize] != UNVISITED {
+                continue;
+            }
+
+            index[root as usize] = next_index;
+            lowlink[root as usize] = next_index;
+            next_index += 1;
+            stack.push(root);
+            on_stack[root as usize] = true;
+            call.push((root, self.row_ptr[root as usize]));
+
+            while let Some(&(v, pos)) = call.last() {
+                let vi = v as usize;
+                if pos < self.row_ptr[vi + 1] {
+                    call.last_mut().unwrap().1 += 1;
+                    let w = self.col_idx[pos as usize];
+                    let wi = w as usize;
+                    if index[wi] == UNVISITED {
+                        index[wi] = next_index;
+                        lowlink[wi] = next_index;
+                        next_index += 1;
+                        stack.push(w);
+                        on_stack[wi] = true;
+                        call.push((w, self.row_ptr[wi]));
+                    } else if on_stack[wi] {
+                        lowlink[vi] = lowlink[vi].min(index[wi]);
+                    }
+                    continue;
+                }
+
+                call.pop();
+                if let Some(&(u, _)) = call.last() {
+                    lowlink[u as usize] = lowlink[u as usize].min(lowlink[vi]);
+                }
+
+                if lowlink[vi] == index[vi] {
+                    let mut cells = Vec::new();
+                    loop {
+                        let w = stack.pop().unwrap();
+                        on_stack[w as usize] = false;
+                        cells.push(self.nodes[w as usize]);
+                        if w == v {
+                            break;
+                        }
+                    }
+                    let is_cycle = cells.len() > 1 || self.precedents(v).contains(&v);
+                    components.push(Component { cells, is_cycle });
+                }
+            }
+        }
+
+        components
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -210,4 +348,56 @@ mod tests {
         assert!(graph.has_circular_reference(b1));
         assert!(graph.has_circular_reference(c1));
     }
+
+    #[test]
+    fn test_csr_components_in_calculation_order() {
+        let mut graph = DependencyGraph::new();
+
+        let a1 = CellKey::new(0, 0, 0);
+        let b1 = CellKey::new(0, 0, 1);
+        let c1 = CellKey::new(0, 0, 2);
+        let d1 = CellKey::new(0, 0, 3);
+
+        // D1 = C1, C1 = B1, B1 = A1
+        graph.add_dependency(c1, d1);
+        graph.add_dependency(b1, c1);
+        graph.add_dependency(a1, b1);
+
+        let csr = CsrGraph::from_precedents(&graph, &[d1, b1, c1, a1]);
+        let order: Vec<CellKey> = csr
+            .strongly_connected_components()
+            .into_iter()
+            .inspect(|c| assert!(!c.is_cycle))
+            .flat_map(|c| c.cells)
+            .collect();
+
+        assert_eq!(order, vec![a1, b1, c1, d1]);
+    }
+
+    #[test]
+    fn test_csr_cycles() {
+        let mut graph = DependencyGraph::new();
+
+        let a1 = CellKey::new(0, 0, 0);
+        let b1 = CellKey::new(0, 0, 1);
+        let c1 = CellKey::new(0, 0, 2);
+        let d1 = CellKey::new(0, 0, 3);
+
+        // A1 <-> B1, C1 depends on the cycle, D1 references itself
+        graph.add_dependency(a1, b1);
+        graph.add_dependency(b1, a1);
+        graph.add_dependency(b1, c1);
+        graph.add_dependency(d1, d1);
+
+        let csr = CsrGraph::from_precedents(&graph, &[c1, a1, b1, d1]);
+        let components = csr.strongly_connected_components();
+
+        let cycles: Vec<&Component> = components.iter().filter(|c| c.is_cycle).collect();
+        assert_eq!(cycles.len(), 2);
+        assert!(components.iter().any(|c| c.is_cycle && c.cells == vec![d1]));
+
+        let pos = |cell| components.iter().position(|c| c.cells.contains(&cell));
+        assert!(pos(a1) < pos(c1));
+        assert_eq!(pos(a1), pos(b1));
+    }
 }
@@ -5,6 +5,7 @@
 //! This crate provides:
 //! - Formula parsing (text → AST)
 //! - Formula evaluation (AST → value)
+//! - Compilation of arithmetic formulas to a stack-machine program
 //! - Built-in Excel functions (~450)
 //! - Dependency tracking for calculation chains
 //!
@@ -23,8 +24,10 @@ pub mod error;
 pub mod evaluator;
 pub mod functions;
 pub mod parser;
+pub mod program;
 
 pub use ast::{BinaryOperator, CellReference, FormulaExpr, RangeReference, UnaryOperator};
 pub use error::{FormulaError, FormulaResult};
 pub use evaluator::{evaluate, EvaluationContext, FormulaValue};
-pub use parser::parse_formula;
+pub use parser::{parse_formula, parse_formula_cached};
+pub use program::FormulaProgram;
@@ -4,7 +4,16 @@
 
 use crate::ast::{BinaryOperator, CellReference, FormulaExpr, RangeReference, UnaryOperator};
 use crate::error::{FormulaError, FormulaResult};
+use ahash::AHashMap;
 use duke_sheets_core::{CellAddress, CellError, CellRange};
+use std::sync::{Arc, Mutex, OnceLock};
+
+/// Number of distinct formulas kept by [`parse_formula_cached`] before the
+/// cache is reset
+const PARSE_CACHE_CAPACITY: usize = 4096;
+
+/// Parsed ASTs keyed by trimmed formula text
+static PARSE_CACHE: OnceLock<Mutex<AHashMap<String, Arc<FormulaExpr>>>> = OnceLock::new();
 
 /// Parse a formula string into an AST
 ///
@@ -39,6 +48,29 @@ pub fn parse_formula(formula: &str) -> FormulaResult<FormulaExpr> {
     Ok(expr)
 }
 
+/// Parse a formula string, sharing the AST with earlier identical formulas
+///
+/// References in the AST are absolute, so the result depends only on the
+/// formula text and can be reused by any cell holding the same text.
+/// Parse errors are not cached.
+pub fn parse_formula_cached(formula: &str) -> FormulaResult<Arc<FormulaExpr>> {
+    let key = formula.trim();
+    let cache = PARSE_CACHE.get_or_init(|| Mutex::new(AHashMap::new()));
+
+    if let Some(ast) = cache.lock().unwrap_or_else(|e| e.into_inner()).get(key) {
+        return Ok(Arc::clone(ast));
+    }
+
+    let ast = Arc::new(parse_formula(key)?);
+
+    let mut cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+    if cache.len() >= PARSE_CACHE_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(key.to_string(), Arc::clone(&ast));
+    Ok(ast)
+}
+
 /// Token types
 #[derive(Debug, Clone, PartialEq)]
 enum Token {
@@ -765,6 +797,16 @@ impl<'a> FormulaParser<'a> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_parse_formula_cached_shares_ast() {
+        let a = parse_formula_cached("=A1*2+1").unwrap();
+        let b = parse_formula_cached(" =A1*2+1 ").unwrap();
+        assert!(Arc::ptr_eq(&a, &b));
+        assert_eq!(*a, parse_formula("=A1*2+1").unwrap());
+
+        assert!(parse_formula_cached("=1+").is_err());
+    }
+
     #[test]
     fn test_parse_number() {
         let ast = parse_formula("=42").unwrap();
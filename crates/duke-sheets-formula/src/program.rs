@@ -0,0 +1,261 @@
+//! Compiled formula programs
+//!
+//! Formulas that are pure arithmetic over numbers and cell references can be
+//! compiled into a flat stack-machine program. Running the program avoids the
+//! recursive AST walk and the per-reference value clones done by
+//! [`evaluate`](crate::evaluate), which matters when the same formulas are
+//! evaluated many times (e.g. iterative calculation).
+//!
+//! A program only produces a result when it can do so exactly as the tree
+//! evaluator would. Whenever an operand is not a plain number (text, errors,
+//! missing sheets) or an operation would produce an error value, running the
+//! program returns `None` and the caller should fall back to [`evaluate`](crate::evaluate).
+
+use crate::ast::{BinaryOperator, FormulaExpr, UnaryOperator};
+use duke_sheets_core::{CellValue, Workbook};
+
+/// A single stack-machine instruction
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub enum Op {
+    /// Push a constant
+    Push(f64),
+    /// Push the numeric value of a cell
+    Load { sheet: usize, row: u32, col: u16 },
+    /// Pop two values, push their sum
+    Add,
+    /// Pop two values, push their difference
+    Subtract,
+    /// Pop two values, push their product
+    Multiply,
+    /// Pop two values, push their quotient
+    Divide,
+    /// Pop two values, push the power
+    Power,
+    /// Negate the top of the stack
+    Negate,
+    /// Divide the top of the stack by 100
+    Percent,
+}
+
+/// A formula compiled to a sequence of [`Op`]s
+#[derive(Debug, Clone, PartialEq)]
+pub struct FormulaProgram {
+    ops: Vec<Op>,
+    max_stack: usize,
+}
+
+impl FormulaProgram {
+    /// Compile an AST into a program
+    ///
+    /// Sheet names are resolved against `workbook`, with unqualified
+    /// references pointing at `current_sheet`. Returns `None` when the
+    /// formula uses anything other than numbers, cell references and
+    /// arithmetic operators, or when it is a bare cell reference (whose
+    /// result is the referenced value itself, not necessarily a number).
+    pub fn compile(expr: &FormulaExpr, workbook: &Workbook, current_sheet: usize) -> Option<Self> {
+        if matches!(expr, FormulaExpr::CellRef(_)) {
+            return None;
+        }
+
+        let mut program = Self {
+            ops: Vec::new(),
+            max_stack: 0,
+        };
+        let mut depth = 0;
+        program.emit(expr, workbook, current_sheet, &mut depth)?;
+        Some(program)
+    }
+
+    /// The compiled instructions
+    pub fn ops(&self) -> &[Op] {
+        &self.ops
+    }
+
+    /// Run the program against the current workbook values
+    ///
+    /// `stack` is scratch space that can be reused between runs to avoid
+    /// allocating. Returns `None` if the result cannot be computed exactly
+    /// as the tree evaluator would (see the module docs).
+    pub fn run(&self, workbook: &Workbook, stack: &mut Vec<f64>) -> Option<f64> {
+        stack.clear();
+        stack.reserve(self.max_stack);
+
+        for op in &self.ops {
+            match *op {
+                Op::Push(n) => stack.push(n),
+                Op::Load { sheet, row, col } => {
+                    let worksheet = workbook.worksheet(sheet)?;
+                    let n = match worksheet.cell_at(row, col) {
+                        Some(cell) => cell_number(&cell.value)?,
+                        None => 0.0,
+                    };
+                    stack.push(n);
+                }
+                Op::Negate => {
+                    let n = stack.last_mut()?;
+                    *n = -*n;
+                }
+                Op::Percent => {
+                    let n = stack.last_mut()?;
+                    *n /= 100.0;
+                }
+                binary => {
+                    let r = stack.pop()?;
+                    let l = stack.pop()?;
+                    let result = match binary {
+                        Op::Add => l + r,
+                        Op::Subtract => l - r,
+                        Op::Multiply => l * r,
+                        Op::Divide => {
+                            if r == 0.0 {
+                                return None;
+                            }
+                            l / r
+                        }
+                        Op::Power => {
+                            let result = l.powf(r);
+                            if result.is_nan() || result.is_infinite() {
+                                return None;
+                            }
+                            result
+                        }
+                        _ => unreachable!(),
+                    };
+                    stack.push(result);
+                }
+            }
+        }
+
+        stack.pop()
+    }
+
+    fn emit(
+        &mut self,
+        expr: &FormulaExpr,
+        workbook: &Workbook,
+        current_sheet: usize,
+        depth: &mut usize,
+    ) -> Option<()> {
+        match expr {
+            FormulaExpr::Number(n) => {
+                self.push(Op::Push(*n), depth);
+            }
+            FormulaExpr::CellRef(cell_ref) => {
+                let sheet = match &cell_ref.sheet {
+                    Some(name) => workbook.sheet_index(name)?,
+                    None => current_sheet,
+                };
+                self.push(
+                    Op::Load {
+                        sheet,
+                        row: cell_ref.address.row,
+                        col: cell_ref.address.col,
+                    },
+                    depth,
+                );
+            }
+            FormulaExpr::BinaryOp { op, left, right } => {
+                let op = match op {
+                    BinaryOperator::Add => Op::Add,
+                    BinaryOperator::Subtract => Op::Subtract,
+                    BinaryOperator::Multiply => Op::Multiply,
+                    BinaryOperator::Divide => Op::Divide,
+                    BinaryOperator::Power => Op::Power,
+                    _ => return None,
+                };
+                self.emit(left, workbook, current_sheet, depth)?;
+                self.emit(right, workbook, current_sheet, depth)?;
+                self.ops.push(op);
+                *depth -= 1;
+            }
+            FormulaExpr::UnaryOp { op, operand } => {
+                self.emit(operand, workbook, current_sheet, depth)?;
+                self.ops.push(match op {
+                    UnaryOperator::Negate => Op::Negate,
+                    UnaryOperator::Percent => Op::Percent,
+                });
+            }
+            _ => return None,
+        }
+        Some(())
+    }
+
+    fn push(&mut self, op: Op, depth: &mut usize) {
+        self.ops.push(op);
+        *depth += 1;
+        self.max_stack = self.max_stack.max(*depth);
+    }
+}
+
+/// Numeric value of a cell for arithmetic, or `None` if the tree evaluator
+/// would treat it as anything other than a plain number
+fn cell_number(value: &CellValue) -> Option<f64> {
+    match value {
+        CellValue::Number(n) => Some(*n),
+        CellValue::Boolean(b) => Some(if *b { 1.0 } else { 0.0 }),
+        CellValue::Empty | CellValue::SpillTarget { .. } => Some(0.0),
+        CellValue::Formula { cached_value, .. } => match cached_value {
+            Some(v) => cell_number(v),
+            None => Some(0.0),
+        },
+        CellValue::String(_) | CellValue::Error(_) => None,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::{evaluate, parse_formula, EvaluationContext, FormulaValue};
+
+    fn workbook() -> Workbook {
+        let mut wb = Workbook::new();
+        let ws = wb.worksheet_mut(0).unwrap();
+        ws.set_cell_value("A1", 10.0).unwrap();
+        ws.set_cell_value("A2", 4.0).unwrap();
+        ws.set_cell_value("A3", "text").unwrap();
+        wb
+    }
+
+    fn compile(formula: &str, wb: &Workbook) -> Option<FormulaProgram> {
+        FormulaProgram::compile(&parse_formula(formula).unwrap(), wb, 0)
+    }
+
+    #[test]
+    fn test_matches_tree_evaluator() {
+        let wb = workbook();
+        let ctx = EvaluationContext::new(Some(&wb), 0, 5, 5);
+        let mut stack = Vec::new();
+
+        for formula in ["=A1/2+0.5", "=-A1*A2^2", "=(A1-A2)%", "=A1+B9", "=3"] {
+            let program = compile(formula, &wb).unwrap();
+            let expected = evaluate(&parse_formula(formula).unwrap(), &ctx).unwrap();
+            assert_eq!(
+                program.run(&wb, &mut stack).map(FormulaValue::Number),
+                Some(expected),
+                "{}",
+                formula
+            );
+        }
+    }
+
+    #[test]
+    fn test_unsupported_formulas() {
+        let wb = workbook();
+        assert!(compile("=A1", &wb).is_none());
+        assert!(compile("=SUM(A1:A2)", &wb).is_none());
+        assert!(compile("=A1&A2", &wb).is_none());
+        assert!(compile("=Missing!A1+1", &wb).is_none());
+    }
+
+    #[test]
+    fn test_falls_back_on_non_numeric_results() {
+        let wb = workbook();
+        let mut stack = Vec::new();
+        assert_eq!(compile("=A3+1", &wb).unwrap().run(&wb, &mut stack), None);
+        assert_eq!(compile("=A1/0", &wb).unwrap().run(&wb, &mut stack), None);
+        assert_eq!(
+            compile("=(-1)^0.5", &wb).unwrap().run(&wb, &mut stack),
+            None
+        );
+    }
+}
@@ -12,7 +12,7 @@ use tokio::process::{Child, Command};
 use tokio::time::sleep;
 
 use crate::error::{BridgeError, Result};
-use crate::workbook::Workbook;
+use crate::workbook::{file_url, make_property_value, Workbook};
 
 /// Configuration for the LibreOffice bridge.
 pub struct LibreOfficeConfig {
@@ -133,66 +133,12 @@ impl LibreOfficeBridge {
 
     /// Create a new empty spreadsheet workbook.
     pub async fn create_workbook(&mut self) -> Result<Workbook<'_>> {
-        // loadComponentFromURL("private:factory/scalc", "_blank", 0, ())
-        let method = interface::load_component_from_url();
-        let result = self.conn.call(&self.desktop, &method, &[
-            UnoValue::String("private:factory/scalc".to_string()),
-            UnoValue::String("_blank".to_string()),
-            UnoValue::Long(0),
-            UnoValue::Sequence(vec![]), // empty PropertyValue sequence
-        ]).await?;
-
-        let doc_oid = proxy::extract_oid_from_return(&result)
-            .ok_or_else(|| BridgeError::OperationFailed(
-                "loadComponentFromURL returned null".into()
-            ))?;
-
-        let doc_proxy = UnoProxy::new(
-            doc_oid,
-            Type::interface(type_names::X_COMPONENT),
-        );
-
-        tracing::info!("Created new spreadsheet: {}", doc_proxy.oid);
-
-        Ok(Workbook::new(&mut self.conn, doc_proxy))
+        Self::create_workbook_with(&mut self.conn, &self.desktop).await
     }
 
     /// Open an existing workbook from a file path.
     pub async fn open_workbook(&mut self, path: &str) -> Result<Workbook<'_>> {
-        // Convert to file:// URL
-        let url = if path.starts_with("file://") {
-            path.to_string()
-        } else {
-            let abs = if path.starts_with('/') {
-                path.to_string()
-            } else {
-                std::env::current_dir()
-                    .unwrap_or_default()
-                    .join(path)
-                    .display()
-                    .to_string()
-            };
-            format!("file://{abs}")
-        };
-
-        let method = interface::load_component_from_url();
-        let result = self.conn.call(&self.desktop, &method, &[
-            UnoValue::String(url),
-            UnoValue::String("_blank".to_string()),
-            UnoValue::Long(0),
-            UnoValue::Sequence(vec![]),
-        ]).await?;
-
-        let doc_oid = proxy::extract_oid_from_return(&result)
-            .ok_or_else(|| BridgeError::OperationFailed(
-                "loadComponentFromURL returned null for open".into()
-            ))?;
-
-        let doc_proxy = UnoProxy::new(
-            doc_oid,
-            Type::interface(type_names::X_COMPONENT),
-        );
-
+        let doc_proxy = load_component(&mut self.conn, &self.desktop, file_url(path)).await?;
         Ok(Workbook::new(&mut self.conn, doc_proxy))
     }
 
@@ -212,23 +158,8 @@ impl LibreOfficeBridge {
         conn: &'a mut UrpConnection,
         desktop: &UnoProxy,
     ) -> Result<Workbook<'a>> {
-        let method = interface::load_component_from_url();
-        let result = conn.call(desktop, &method, &[
-            UnoValue::String("private:factory/scalc".to_string()),
-            UnoValue::String("_blank".to_string()),
-            UnoValue::Long(0),
-            UnoValue::Sequence(vec![]),
-        ]).await?;
-
-        let doc_oid = proxy::extract_oid_from_return(&result)
-            .ok_or_else(|| BridgeError::OperationFailed(
-                "loadComponentFromURL returned null".into()
-            ))?;
-
-        let doc_proxy = UnoProxy::new(
-            doc_oid,
-            Type::interface(type_names::X_COMPONENT),
-        );
+        let doc_proxy =
+            load_component(conn, desktop, "private:factory/scalc".to_string()).await?;
 
         tracing::info!("Created new spreadsheet: {}", doc_proxy.oid);
 
@@ -248,3 +179,33 @@ impl LibreOfficeBridge {
         Ok(())
     }
 }
+
+/// Load a document with `loadComponentFromURL` and return its XComponent
+/// proxy.
+///
+/// Documents are loaded `Hidden`: they are only ever driven through the API,
+/// so LibreOffice can skip creating and painting a window for them.
+async fn load_component(
+    conn: &mut UrpConnection,
+    desktop: &UnoProxy,
+    url: String,
+) -> Result<UnoProxy> {
+    let hidden = make_property_value("Hidden", UnoValue::Bool(true), Type::boolean());
+    let method = interface::load_component_from_url();
+    let result = conn.call(desktop, &method, &[
+        UnoValue::String(url),
+        UnoValue::String("_blank".to_string()),
+        UnoValue::Long(0),
+        UnoValue::Sequence(vec![hidden]),
+    ]).await?;
+
+    let doc_oid = proxy::extract_oid_from_return(&result)
+        .ok_or_else(|| BridgeError::OperationFailed(
+            "loadComponentFromURL returned null".into()
+        ))?;
+
+    Ok(UnoProxy::new(
+        doc_oid,
+        Type::interface(type_names::X_COMPONENT),
+    ))
+}
@@ -44,5 +44,5 @@ pub mod workbook;
 
 pub use bridge::{LibreOfficeBridge, LibreOfficeConfig};
 pub use error::BridgeError;
-pub use uno_types::{GradientSpec, StyleSpec};
+pub use uno_types::{CfRuleSpec, GradientSpec, StyleSpec};
 pub use workbook::{CellValue, Workbook};
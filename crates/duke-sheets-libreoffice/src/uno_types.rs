@@ -366,7 +366,7 @@ pub mod validation_alert_style {
 /// Wire format: Struct(Enum style, Long startColor, Long endColor, Short angle,
 ///                     Short border, Short xOffset, Short yOffset,
 ///                     Short startIntensity, Short endIntensity, Short stepCount)
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq)]
 pub struct GradientSpec {
     /// Gradient style: LINEAR=0, AXIAL=1, RADIAL=2, ELLIPTICAL=3, SQUARE=4, RECT=5
     pub style: i32,
@@ -461,7 +461,7 @@ pub mod struct_type_names {
 /// Specification for cell/range styling, mirroring the Python `StyleSpec` dataclass.
 ///
 /// All fields are optional. Only non-default values are applied to the cell.
-#[derive(Debug, Clone, Default)]
+#[derive(Debug, Clone, Default, PartialEq)]
 pub struct StyleSpec {
     // Font
     pub bold: bool,
@@ -501,6 +501,27 @@ pub struct StyleSpec {
     pub number_format: Option<String>,
 }
 
+impl StyleSpec {
+    /// Whether the spec sets nothing, so applying it would be a no-op.
+    pub fn is_empty(&self) -> bool {
+        *self == Self::default()
+    }
+}
+
+/// One conditional format rule, for adding several rules to a range at once
+/// with `Workbook::add_conditional_formats`.
+#[derive(Debug, Clone, Default)]
+pub struct CfRuleSpec {
+    /// Condition operator name (see `condition_operator::from_name`)
+    pub operator: String,
+    /// The formula/value string
+    pub formula: String,
+    /// Name for the CF cell style
+    pub style_name: String,
+    /// The style to apply when the condition matches
+    pub style: StyleSpec,
+}
+
 // ============================================================================
 // Tests
 // ============================================================================
@@ -509,6 +530,16 @@ pub struct StyleSpec {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_style_spec_is_empty() {
+        assert!(StyleSpec::default().is_empty());
+        assert!(!StyleSpec {
+            bold: true,
+            ..Default::default()
+        }
+        .is_empty());
+    }
+
     #[test]
     fn test_cell_address_to_uno() {
         let addr = CellAddress::new(0, 3, 5);
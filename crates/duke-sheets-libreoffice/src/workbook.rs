@@ -6,7 +6,7 @@ use libreoffice_urp::proxy::{self, UnoProxy};
 use libreoffice_urp::types::{Any, Type, UnoValue, type_names};
 
 use crate::error::{BridgeError, Result};
-use crate::uno_types::{self, BorderLine2, CellAddress, Locale, StyleSpec};
+use crate::uno_types::{self, BorderLine2, CellAddress, CfRuleSpec, Locale, StyleSpec};
 
 /// A cell value that can be sent to/from LibreOffice.
 #[derive(Debug, Clone)]
@@ -45,6 +45,27 @@ impl From<String> for CellValue {
 pub struct Workbook<'a> {
     conn: &'a mut UrpConnection,
     doc: UnoProxy,
+    /// Document-level containers, resolved on first use. They are stable for
+    /// the lifetime of the document, so each is fetched over URP only once.
+    sheets: Option<UnoProxy>,
+    sheets_index: Option<UnoProxy>,
+    cell_styles: Option<UnoProxy>,
+    number_formats: Option<UnoProxy>,
+    /// Sheet proxies already resolved, keyed by sheet index and interface
+    /// (see `get_sheet_proxy_as`).
+    sheet_proxies: Vec<(i32, &'static str, UnoProxy)>,
+    /// Row and column containers (as XIndexAccess), keyed by sheet index and
+    /// container interface (see `get_line_props`).
+    line_containers: Vec<(i32, &'static str, UnoProxy)>,
+    /// Conditional-format cell styles already created in this document,
+    /// keyed by their spec (see `create_cf_style`).
+    cf_styles: Vec<(StyleSpec, String)>,
+    /// Number format keys already looked up or registered in this document,
+    /// keyed by format string (see `get_or_create_number_format`).
+    number_format_keys: Vec<(String, i32)>,
+    /// Whether LibreOffice recalculates formulas as cells change (see
+    /// `set_automatic_calculation`).
+    automatic_calculation: bool,
 }
 
 // ============================================================================
@@ -54,7 +75,7 @@ pub struct Workbook<'a> {
 /// Build a `com.sun.star.beans.PropertyValue` as a `UnoValue::Struct`.
 ///
 /// PropertyValue members: Name(string), Handle(long), Value(any), State(enum).
-fn make_property_value(name: &str, value: UnoValue, type_desc: Type) -> UnoValue {
+pub(crate) fn make_property_value(name: &str, value: UnoValue, type_desc: Type) -> UnoValue {
     UnoValue::Struct(vec![
         UnoValue::String(name.to_string()),
         UnoValue::Long(0),
@@ -63,9 +84,47 @@ fn make_property_value(name: &str, value: UnoValue, type_desc: Type) -> UnoValue
     ])
 }
 
+/// Convert a file path to a `file://` URL, resolving relative paths against
+/// the current directory. Values that already are `file://` URLs are kept.
+pub(crate) fn file_url(path: &str) -> String {
+    if path.starts_with("file://") {
+        return path.to_string();
+    }
+    let path = std::path::Path::new(path);
+    let abs = if path.is_absolute() {
+        path.to_path_buf()
+    } else {
+        std::env::current_dir().unwrap_or_default().join(path)
+    };
+    let abs = abs.display().to_string().replace('\\', "/");
+    // Windows paths ("C:/...") need an empty authority before the drive
+    if abs.starts_with('/') {
+        format!("file://{abs}")
+    } else {
+        format!("file:///{abs}")
+    }
+}
+
+/// Wrap a value in a `UnoValue::Any` of the given type.
+fn any(type_desc: Type, value: UnoValue) -> UnoValue {
+    UnoValue::Any(Box::new(Any { type_desc, value }))
+}
+
 impl<'a> Workbook<'a> {
     pub(crate) fn new(conn: &'a mut UrpConnection, doc: UnoProxy) -> Self {
-        Self { conn, doc }
+        Self {
+            conn,
+            doc,
+            sheets: None,
+            sheets_index: None,
+            cell_styles: None,
+            number_formats: None,
+            sheet_proxies: Vec::new(),
+            line_containers: Vec::new(),
+            cf_styles: Vec::new(),
+            number_format_keys: Vec::new(),
+            automatic_calculation: true,
+        }
     }
 
     /// Get direct access to the URP connection (for advanced operations).
@@ -97,29 +156,49 @@ impl<'a> Workbook<'a> {
 
     /// Get the XSpreadsheets collection proxy.
     async fn get_sheets_proxy(&mut self) -> Result<UnoProxy> {
+        if let Some(ref sheets) = self.sheets {
+            return Ok(sheets.clone());
+        }
         let ssd_proxy = self.doc_qi(type_names::X_SPREADSHEET_DOCUMENT).await?;
         let method = interface::get_sheets();
         let result = self.conn.call(&ssd_proxy, &method, &[]).await?;
         let oid = proxy::extract_oid_from_return(&result)
             .ok_or_else(|| BridgeError::OperationFailed("getSheets returned null".into()))?;
-        Ok(UnoProxy::new(oid, Type::interface(type_names::X_SPREADSHEETS)))
+        let sheets = UnoProxy::new(oid, Type::interface(type_names::X_SPREADSHEETS));
+        self.sheets = Some(sheets.clone());
+        Ok(sheets)
+    }
+
+    /// Get the sheets collection as XIndexAccess.
+    async fn get_sheets_index(&mut self) -> Result<UnoProxy> {
+        if let Some(ref idx) = self.sheets_index {
+            return Ok(idx.clone());
+        }
+        let sheets = self.get_sheets_proxy().await?;
+        let idx = self.qi(&sheets, type_names::X_INDEX_ACCESS).await?;
+        self.sheets_index = Some(idx.clone());
+        Ok(idx)
     }
 
     /// Get a sheet proxy by its zero-based index, typed for the given interface.
+    ///
+    /// Every cell-addressed call starts here, so resolved proxies are cached
+    /// to save the getByIndex and queryInterface round-trips. Sheets are only
+    /// ever appended (`add_sheet`), so an index keeps naming the same sheet.
     async fn get_sheet_proxy_as(
         &mut self,
         sheet_index: i32,
-        iface_type_name: &str,
+        iface_type_name: &'static str,
     ) -> Result<UnoProxy> {
-        let sheets = self.get_sheets_proxy().await?;
-        // XIndexAccess on sheets
-        let idx_type = Type::interface(type_names::X_INDEX_ACCESS);
-        let sheets_idx = UnoProxy::new(sheets.oid, idx_type.clone());
-        let sheets_proxy = self
-            .conn
-            .query_interface(&sheets_idx, idx_type)
-            .await?
-            .unwrap_or(sheets_idx);
+        if let Some((_, _, proxy)) = self
+            .sheet_proxies
+            .iter()
+            .find(|(i, t, _)| *i == sheet_index && *t == iface_type_name)
+        {
+            return Ok(proxy.clone());
+        }
+
+        let sheets_proxy = self.get_sheets_index().await?;
 
         let method = interface::get_by_index();
         let result = self
@@ -136,6 +215,7 @@ impl<'a> Workbook<'a> {
             .query_interface(&raw, target_type)
             .await?
             .unwrap_or(raw);
+        self.sheet_proxies.push((sheet_index, iface_type_name, proxy.clone()));
         Ok(proxy)
     }
 
@@ -188,35 +268,80 @@ impl<'a> Workbook<'a> {
         Ok(UnoProxy::new(oid, Type::interface(type_names::X_CELL)))
     }
 
+    /// Get a range proxy (as XCellRange) by zero-indexed corner positions on
+    /// a sheet.
+    async fn get_range_on_sheet(
+        &mut self,
+        sheet_index: i32,
+        left: i32,
+        top: i32,
+        right: i32,
+        bottom: i32,
+    ) -> Result<UnoProxy> {
+        let sheet = self.get_sheet_cell_range(sheet_index).await?;
+        let method = interface::get_cell_range_by_position();
+        let result = self
+            .conn
+            .call(
+                &sheet,
+                &method,
+                &[
+                    UnoValue::Long(left),
+                    UnoValue::Long(top),
+                    UnoValue::Long(right),
+                    UnoValue::Long(bottom),
+                ],
+            )
+            .await?;
+        let oid = Self::require_oid(&result, "getCellRangeByPosition")?;
+        Ok(UnoProxy::new(oid, Type::interface(type_names::X_CELL_RANGE)))
+    }
+
     /// Parse a cell reference like "A1" into (col, row) zero-indexed.
+    ///
+    /// Works on the raw bytes without allocating, since every cell-addressed
+    /// call goes through here.
     pub fn parse_cell_ref(cell_ref: &str) -> Result<(i32, i32)> {
-        let mut col: i32 = 0;
-        let mut i = 0;
-        let chars: Vec<char> = cell_ref.chars().collect();
-
-        // Parse column letters
-        while i < chars.len() && chars[i].is_ascii_alphabetic() {
-            col = col * 26 + (chars[i].to_ascii_uppercase() as i32 - 'A' as i32 + 1);
-            i += 1;
+        let invalid = || BridgeError::InvalidCellRef(cell_ref.to_string());
+        let bytes = cell_ref.as_bytes();
+        let letters = bytes.iter().take_while(|b| b.is_ascii_alphabetic()).count();
+        let digits = &bytes[letters..];
+        if letters == 0 || digits.is_empty() || !digits.iter().all(u8::is_ascii_digit) {
+            return Err(invalid());
         }
-        col -= 1; // Zero-indexed
 
-        if col < 0 {
-            return Err(BridgeError::InvalidCellRef(cell_ref.to_string()));
+        // Parse column letters
+        let mut col: i32 = 0;
+        for &b in &bytes[..letters] {
+            col = col
+                .checked_mul(26)
+                .and_then(|c| c.checked_add((b.to_ascii_uppercase() - b'A') as i32 + 1))
+                .ok_or_else(invalid)?;
         }
 
         // Parse row number
-        let row_str = &cell_ref[i..];
-        let row: i32 = row_str
-            .parse::<i32>()
-            .map_err(|_| BridgeError::InvalidCellRef(cell_ref.to_string()))?
-            - 1; // Zero-indexed
-
-        if row < 0 {
-            return Err(BridgeError::InvalidCellRef(cell_ref.to_string()));
+        let mut row: i32 = 0;
+        for &b in digits {
+            row = row
+                .checked_mul(10)
+                .and_then(|r| r.checked_add((b - b'0') as i32))
+                .ok_or_else(invalid)?;
+        }
+        if row == 0 {
+            return Err(invalid());
         }
 
-        Ok((col, row))
+        Ok((col - 1, row - 1)) // Zero-indexed
+    }
+
+    /// Parse a range reference like "A1:B5" (or a single cell like "A1")
+    /// into zero-indexed (left, top, right, bottom) corners.
+    pub fn parse_range_ref(range_ref: &str) -> Result<(i32, i32, i32, i32)> {
+        let invalid = |_| BridgeError::InvalidCellRef(range_ref.to_string());
+        let (start, end) = range_ref.split_once(':').unwrap_or((range_ref, range_ref));
+        let (c0, r0) = Self::parse_cell_ref(start).map_err(invalid)?;
+        let (c1, r1) = Self::parse_cell_ref(end).map_err(invalid)?;
+        Ok((c0.min(c1), r0.min(r1), c0.max(c1), r0.max(r1)))
     }
 
     // ========================================================================
@@ -322,6 +447,85 @@ impl<'a> Workbook<'a> {
         }
     }
 
+    /// Get the computed values of a range (e.g. "A1:C10") on a sheet, one
+    /// `Vec` per row.
+    ///
+    /// The whole block is read with a single `XCellRangeData::getDataArray`
+    /// call, so checking many cells should read their bounding range rather
+    /// than calling `get_cell_value` per cell. Formula cells yield their
+    /// result and blank cells yield `CellValue::Empty`.
+    pub async fn get_range_data(
+        &mut self,
+        sheet_index: i32,
+        range_ref: &str,
+    ) -> Result<Vec<Vec<CellValue>>> {
+        let range = self.get_cell_range_by_name(sheet_index, range_ref).await?;
+        let data_proxy = self.qi(&range, type_names::X_CELL_RANGE_DATA).await?;
+        let method = interface::get_data_array();
+        let result = self.conn.call(&data_proxy, &method, &[]).await?;
+        Self::into_rows(result, "getDataArray")?
+            .into_iter()
+            .map(|row| {
+                row.into_iter()
+                    .map(|item| match item.into_any().map(|a| a.value) {
+                        Some(UnoValue::Double(n)) => Ok(CellValue::Number(n)),
+                        Some(UnoValue::String(s)) if s.is_empty() => Ok(CellValue::Empty),
+                        Some(UnoValue::String(s)) => Ok(CellValue::String(s)),
+                        other => Err(BridgeError::OperationFailed(format!(
+                            "getDataArray returned unexpected item: {other:?}"
+                        ))),
+                    })
+                    .collect()
+            })
+            .collect()
+    }
+
+    /// Get the formulas of a range (e.g. "A1:C10") on a sheet, one `Vec`
+    /// per row, with a single `XCellRangeFormula::getFormulaArray` call.
+    ///
+    /// Cells without a formula yield their contents as typed, as with
+    /// `get_cell_formula`.
+    pub async fn get_range_formulas(
+        &mut self,
+        sheet_index: i32,
+        range_ref: &str,
+    ) -> Result<Vec<Vec<String>>> {
+        let range = self.get_cell_range_by_name(sheet_index, range_ref).await?;
+        let formula_proxy = self.qi(&range, type_names::X_CELL_RANGE_FORMULA).await?;
+        let method = interface::get_formula_array();
+        let result = self.conn.call(&formula_proxy, &method, &[]).await?;
+        Self::into_rows(result, "getFormulaArray")?
+            .into_iter()
+            .map(|row| {
+                row.into_iter()
+                    .map(|item| match item {
+                        UnoValue::String(s) => Ok(s),
+                        other => Err(BridgeError::OperationFailed(format!(
+                            "getFormulaArray returned unexpected item: {other:?}"
+                        ))),
+                    })
+                    .collect()
+            })
+            .collect()
+    }
+
+    /// Split a `sequence<sequence<...>>` reply into its rows.
+    fn into_rows(result: UnoValue, method: &str) -> Result<Vec<Vec<UnoValue>>> {
+        let unexpected = |other: UnoValue| {
+            BridgeError::OperationFailed(format!("{method} returned unexpected type: {other:?}"))
+        };
+        match result {
+            UnoValue::Sequence(rows) => rows
+                .into_iter()
+                .map(|row| match row {
+                    UnoValue::Sequence(items) => Ok(items),
+                    other => Err(unexpected(other)),
+                })
+                .collect(),
+            other => Err(unexpected(other)),
+        }
+    }
+
     // ========================================================================
     // Sheet management
     // ========================================================================
@@ -341,14 +545,7 @@ impl<'a> Workbook<'a> {
     /// Add a new sheet with the given name at the end.
     pub async fn add_sheet(&mut self, name: &str) -> Result<()> {
         let sheets = self.get_sheets_proxy().await?;
-        // Get count first
-        let idx_proxy = self.qi(&sheets, type_names::X_INDEX_ACCESS).await?;
-        let count_method = interface::get_count();
-        let count_result = self.conn.call(&idx_proxy, &count_method, &[]).await?;
-        let count = match count_result {
-            UnoValue::Long(n) => n,
-            _ => 0,
-        };
+        let count = self.sheet_count().await?;
 
         let method = interface::insert_new_by_name();
         self.conn
@@ -366,8 +563,7 @@ impl<'a> Workbook<'a> {
 
     /// Get the number of sheets.
     pub async fn sheet_count(&mut self) -> Result<i32> {
-        let sheets = self.get_sheets_proxy().await?;
-        let idx_proxy = self.qi(&sheets, type_names::X_INDEX_ACCESS).await?;
+        let idx_proxy = self.get_sheets_index().await?;
         let method = interface::get_count();
         let result = self.conn.call(&idx_proxy, &method, &[]).await?;
         match result {
@@ -376,6 +572,57 @@ impl<'a> Workbook<'a> {
         }
     }
 
+    /// Get the names of all sheets, in order, with a single
+    /// `getElementNames` call.
+    pub async fn sheet_names(&mut self) -> Result<Vec<String>> {
+        let sheets = self.get_sheets_proxy().await?;
+        let method = interface::get_element_names();
+        let result = self.conn.call(&sheets, &method, &[]).await?;
+        let unexpected = |other: &UnoValue| {
+            BridgeError::OperationFailed(format!(
+                "getElementNames returned unexpected type: {other:?}"
+            ))
+        };
+        match result {
+            UnoValue::Sequence(names) => names
+                .into_iter()
+                .map(|name| match name {
+                    UnoValue::String(s) => Ok(s),
+                    other => Err(unexpected(&other)),
+                })
+                .collect(),
+            other => Err(unexpected(&other)),
+        }
+    }
+
+    // ========================================================================
+    // Calculation
+    // ========================================================================
+
+    /// Turn automatic recalculation on or off.
+    ///
+    /// With it off, writing many formulas no longer triggers a recalculation
+    /// after every cell. Formula results read back through the bridge are
+    /// then stale until `calculate_all`; `save` and `save_as_xls` recalculate
+    /// first so the stored cached values are current.
+    pub async fn set_automatic_calculation(&mut self, enabled: bool) -> Result<()> {
+        let calc = self.doc_qi(type_names::X_CALCULATABLE).await?;
+        let method = interface::enable_automatic_calculation();
+        self.conn
+            .call(&calc, &method, &[UnoValue::Bool(enabled)])
+            .await?;
+        self.automatic_calculation = enabled;
+        Ok(())
+    }
+
+    /// Recalculate every formula in the document.
+    pub async fn calculate_all(&mut self) -> Result<()> {
+        let calc = self.doc_qi(type_names::X_CALCULATABLE).await?;
+        let method = interface::calculate_all();
+        self.conn.call(&calc, &method, &[]).await?;
+        Ok(())
+    }
+
     // ========================================================================
     // Property access (XPropertySet)
     // ========================================================================
@@ -399,6 +646,65 @@ impl<'a> Workbook<'a> {
         Ok(())
     }
 
+    /// Set several properties on a proxy object with one
+    /// XMultiPropertySet::setPropertyValues call.
+    ///
+    /// Property names must be unique. A single property goes through
+    /// `set_property`, and an empty list makes no call at all. Objects
+    /// without XMultiPropertySet get one setPropertyValue call per property
+    /// on a single XPropertySet proxy.
+    pub async fn set_properties(
+        &mut self,
+        proxy: &UnoProxy,
+        mut props: Vec<(&str, UnoValue)>,
+    ) -> Result<()> {
+        if props.len() <= 1 {
+            return match props.pop() {
+                Some((name, value)) => self.set_property(proxy, name, value).await,
+                None => Ok(()),
+            };
+        }
+
+        let mps_proxy = match self
+            .conn
+            .query_interface(proxy, Type::interface(type_names::X_MULTI_PROPERTY_SET))
+            .await?
+        {
+            Some(mps_proxy) => mps_proxy,
+            None => {
+                let ps_proxy = self.qi(proxy, type_names::X_PROPERTY_SET).await?;
+                let method = interface::set_property_value();
+                for (name, value) in props {
+                    self.conn
+                        .call(
+                            &ps_proxy,
+                            &method,
+                            &[UnoValue::String(name.to_string()), value],
+                        )
+                        .await?;
+                }
+                return Ok(());
+            }
+        };
+
+        // setPropertyValues requires the names in sorted order
+        props.sort_by(|(a, _), (b, _)| a.cmp(b));
+        let (names, values): (Vec<_>, Vec<_>) = props
+            .into_iter()
+            .map(|(name, value)| (UnoValue::String(name.to_string()), value))
+            .unzip();
+
+        let method = interface::set_property_values();
+        self.conn
+            .call(
+                &mps_proxy,
+                &method,
+                &[UnoValue::Sequence(names), UnoValue::Sequence(values)],
+            )
+            .await?;
+        Ok(())
+    }
+
     /// Get a property value from a proxy object (via XPropertySet::getPropertyValue).
     pub async fn get_property(
         &mut self,
@@ -423,6 +729,15 @@ impl<'a> Workbook<'a> {
         sheet_index: i32,
         range_ref: &str,
     ) -> Result<UnoProxy> {
+        // Plain "A1:B5" refs are resolved by position so LibreOffice doesn't
+        // have to parse them; anything else (absolute refs, sheet prefixes,
+        // named ranges) is looked up by name.
+        if let Ok((left, top, right, bottom)) = Self::parse_range_ref(range_ref) {
+            return self
+                .get_range_on_sheet(sheet_index, left, top, right, bottom)
+                .await;
+        }
+
         let sheet = self.get_sheet_cell_range(sheet_index).await?;
         let method = interface::get_cell_range_by_name();
         let result = self
@@ -440,14 +755,300 @@ impl<'a> Workbook<'a> {
         ))
     }
 
+    /// Set a rectangular block of values starting at `top_left` (e.g. "B1").
+    ///
+    /// Each inner `Vec` is one row, and all rows must be the same length.
+    /// The whole block is written with a single `XCellRangeData::setDataArray`
+    /// call instead of one round-trip per cell. `setDataArray` cannot carry
+    /// formulas, so formula cells are left empty in the block and then set
+    /// through the same range proxy, one `setFormulaArray` call per run of
+    /// adjacent formula cells in a row.
+    pub async fn set_range_values(
+        &mut self,
+        sheet_index: i32,
+        top_left: &str,
+        rows: &[Vec<CellValue>],
+    ) -> Result<()> {
+        let width = Self::block_width(rows)?;
+        if width == 0 {
+            return Ok(());
+        }
+
+        let mut data = Vec::with_capacity(rows.len());
+        let mut formulas = Vec::new();
+        for (r_off, r) in rows.iter().enumerate() {
+            let mut items = Vec::with_capacity(width);
+            for (c_off, cv) in r.iter().enumerate() {
+                let (type_desc, value) = match cv {
+                    CellValue::Number(n) => (Type::double(), UnoValue::Double(*n)),
+                    CellValue::String(s) => (Type::string(), UnoValue::String(s.clone())),
+                    // An empty string leaves the cell empty (void would become #N/A)
+                    CellValue::Empty => (Type::string(), UnoValue::String(String::new())),
+                    CellValue::Formula(f) => {
+                        formulas.push((c_off as i32, r_off as i32, f.clone()));
+                        (Type::string(), UnoValue::String(String::new()))
+                    }
+                };
+                items.push(UnoValue::Any(Box::new(Any { type_desc, value })));
+            }
+            data.push(UnoValue::Sequence(items));
+        }
+
+        let range = self
+            .write_data_array(sheet_index, top_left, width, data)
+            .await?;
+
+        // Sparse overlay: positions are relative to the range. Formulas that
+        // sit next to each other in a row are written as one run.
+        let mut formulas = formulas.into_iter().peekable();
+        while let Some((c_off, r_off, formula)) = formulas.next() {
+            let mut run = vec![formula];
+            while let Some((_, _, next)) = formulas.next_if(|&(c, r, _)| {
+                r == r_off && c == c_off + run.len() as i32
+            }) {
+                run.push(next);
+            }
+            self.set_formula_run(&range, c_off, r_off, run).await?;
+        }
+        Ok(())
+    }
+
+    /// Set formulas in consecutive cells of one row of `range`, starting at
+    /// (`col`, `row`) relative to it.
+    async fn set_formula_run(
+        &mut self,
+        range: &UnoProxy,
+        col: i32,
+        row: i32,
+        mut run: Vec<String>,
+    ) -> Result<()> {
+        if run.len() == 1 {
+            let method = interface::get_cell_by_position();
+            let result = self
+                .conn
+                .call(range, &method, &[UnoValue::Long(col), UnoValue::Long(row)])
+                .await?;
+            let oid = Self::require_oid(&result, "getCellByPosition")?;
+            let cell = UnoProxy::new(oid, Type::interface(type_names::X_CELL));
+            let method = interface::cell_set_formula();
+            self.conn
+                .call(&cell, &method, &[UnoValue::String(run.pop().unwrap_or_default())])
+                .await?;
+            return Ok(());
+        }
+
+        let method = interface::get_cell_range_by_position();
+        let result = self
+            .conn
+            .call(
+                range,
+                &method,
+                &[
+                    UnoValue::Long(col),
+                    UnoValue::Long(row),
+                    UnoValue::Long(col + run.len() as i32 - 1),
+                    UnoValue::Long(row),
+                ],
+            )
+            .await?;
+        let oid = Self::require_oid(&result, "getCellRangeByPosition")?;
+        let sub_range = UnoProxy::new(oid, Type::interface(type_names::X_CELL_RANGE));
+        let formula_proxy = self.qi(&sub_range, type_names::X_CELL_RANGE_FORMULA).await?;
+        let row_values = run.into_iter().map(UnoValue::String).collect();
+        let method = interface::set_formula_array();
+        self.conn
+            .call(
+                &formula_proxy,
+                &method,
+                &[UnoValue::Sequence(vec![UnoValue::Sequence(row_values)])],
+            )
+            .await?;
+        Ok(())
+    }
+
+    /// Set values in arbitrary cells of a sheet, given as `(cell_ref, value)`
+    /// pairs.
+    ///
+    /// Every reference is validated before anything is written. Contiguous
+    /// blocks should go through `set_range_values` and friends instead, which
+    /// write the whole block in one call.
+    pub async fn set_cell_values<'r, V: Into<CellValue>>(
+        &mut self,
+        sheet_index: i32,
+        entries: impl IntoIterator<Item = (&'r str, V)>,
+    ) -> Result<()> {
+        let cells = entries
+            .into_iter()
+            .map(|(cell_ref, value)| Ok((Self::parse_cell_ref(cell_ref)?, value.into())))
+            .collect::<Result<Vec<_>>>()?;
+        for ((col, row), value) in cells {
+            let cell = self.get_cell_on_sheet(sheet_index, col, row).await?;
+            self.set_cell_value_on_proxy(&cell, value).await?;
+        }
+        Ok(())
+    }
+
+    /// Set a column of values starting at `top` (e.g. "B3" fills B3, B4, ...)
+    /// with a single `setDataArray` call.
+    pub async fn set_column_values<V: Into<CellValue>>(
+        &mut self,
+        sheet_index: i32,
+        top: &str,
+        values: impl IntoIterator<Item = V>,
+    ) -> Result<()> {
+        let rows: Vec<Vec<CellValue>> = values.into_iter().map(|v| vec![v.into()]).collect();
+        self.set_range_values(sheet_index, top, &rows).await
+    }
+
+    /// Set a row of values starting at `left` (e.g. "B3" fills B3, C3, ...)
+    /// with a single `setDataArray` call.
+    pub async fn set_row_values<V: Into<CellValue>>(
+        &mut self,
+        sheet_index: i32,
+        left: &str,
+        values: impl IntoIterator<Item = V>,
+    ) -> Result<()> {
+        let row: Vec<CellValue> = values.into_iter().map(Into::into).collect();
+        self.set_range_values(sheet_index, left, &[row]).await
+    }
+
+    /// Set a rectangular block of numbers starting at `top_left`.
+    ///
+    /// Fast path of `set_range_values` for all-numeric data: no per-cell type
+    /// dispatch and no formula overlay, just one `setDataArray` call.
+    pub async fn set_range_numbers(
+        &mut self,
+        sheet_index: i32,
+        top_left: &str,
+        rows: &[Vec<f64>],
+    ) -> Result<()> {
+        let width = Self::block_width(rows)?;
+        if width == 0 {
+            return Ok(());
+        }
+
+        let double = Type::double();
+        let data = rows
+            .iter()
+            .map(|r| {
+                UnoValue::Sequence(
+                    r.iter()
+                        .map(|n| {
+                            UnoValue::Any(Box::new(Any {
+                                type_desc: double.clone(),
+                                value: UnoValue::Double(*n),
+                            }))
+                        })
+                        .collect(),
+                )
+            })
+            .collect();
+
+        self.write_data_array(sheet_index, top_left, width, data)
+            .await?;
+        Ok(())
+    }
+
+    /// Set a rectangular block of formulas starting at `top_left` with one
+    /// `setFormulaArray` call.
+    ///
+    /// Entries are interpreted as if typed into the cell, so constants such
+    /// as "10" or "text" can be mixed in. For blocks of mostly values with a
+    /// few formulas, `set_range_values` is the better fit.
+    pub async fn set_range_formulas<S: AsRef<str>>(
+        &mut self,
+        sheet_index: i32,
+        top_left: &str,
+        rows: &[Vec<S>],
+    ) -> Result<()> {
+        let width = Self::block_width(rows)?;
+        if width == 0 {
+            return Ok(());
+        }
+
+        let (col, row) = Self::parse_cell_ref(top_left)?;
+        let range = self
+            .get_range_on_sheet(
+                sheet_index,
+                col,
+                row,
+                col + width as i32 - 1,
+                row + rows.len() as i32 - 1,
+            )
+            .await?;
+        let data = rows
+            .iter()
+            .map(|r| {
+                UnoValue::Sequence(
+                    r.iter()
+                        .map(|f| UnoValue::String(f.as_ref().to_string()))
+                        .collect(),
+                )
+            })
+            .collect();
+
+        let formula_proxy = self.qi(&range, type_names::X_CELL_RANGE_FORMULA).await?;
+        let method = interface::set_formula_array();
+        self.conn
+            .call(&formula_proxy, &method, &[UnoValue::Sequence(data)])
+            .await?;
+        Ok(())
+    }
+
+    /// Width of a block of rows, or an error if the rows are ragged.
+    fn block_width<T>(rows: &[Vec<T>]) -> Result<usize> {
+        let width = rows.first().map_or(0, Vec::len);
+        if rows.iter().any(|r| r.len() != width) {
+            return Err(BridgeError::OperationFailed(
+                "block rows must all have the same length".into(),
+            ));
+        }
+        Ok(width)
+    }
+
+    /// Write `data` (a sequence of row sequences of Any, `width` wide) with
+    /// `setDataArray`, and return the XCellRange proxy of the written block.
+    async fn write_data_array(
+        &mut self,
+        sheet_index: i32,
+        top_left: &str,
+        width: usize,
+        data: Vec<UnoValue>,
+    ) -> Result<UnoProxy> {
+        let (col, row) = Self::parse_cell_ref(top_left)?;
+        let range = self
+            .get_range_on_sheet(
+                sheet_index,
+                col,
+                row,
+                col + width as i32 - 1,
+                row + data.len() as i32 - 1,
+            )
+            .await?;
+
+        let data_proxy = self.qi(&range, type_names::X_CELL_RANGE_DATA).await?;
+        let method = interface::set_data_array();
+        self.conn
+            .call(&data_proxy, &method, &[UnoValue::Sequence(data)])
+            .await?;
+        Ok(range)
+    }
+
     /// Merge a range of cells on a sheet.
     pub async fn merge_range(&mut self, sheet_index: i32, range_ref: &str) -> Result<()> {
-        let range = self.get_cell_range_by_name(sheet_index, range_ref).await?;
-        let mergeable = self.qi(&range, type_names::X_MERGEABLE).await?;
+        self.merge_ranges(sheet_index, &[range_ref]).await
+    }
+
+    /// Merge several ranges of cells on a sheet.
+    pub async fn merge_ranges(&mut self, sheet_index: i32, range_refs: &[&str]) -> Result<()> {
         let method = interface::merge();
-        self.conn
-            .call(&mergeable, &method, &[UnoValue::Bool(true)])
-            .await?;
+        for range_ref in range_refs {
+            let range = self.get_cell_range_by_name(sheet_index, range_ref).await?;
+            let mergeable = self.qi(&range, type_names::X_MERGEABLE).await?;
+            self.conn
+                .call(&mergeable, &method, &[UnoValue::Bool(true)])
+                .await?;
+        }
         Ok(())
     }
 
@@ -466,7 +1067,25 @@ impl<'a> Workbook<'a> {
         text: &str,
         _author: Option<&str>,
     ) -> Result<()> {
-        let (col, row) = Self::parse_cell_ref(cell_ref)?;
+        self.add_comments(sheet_index, &[(cell_ref, text)]).await
+    }
+
+    /// Add `(cell_ref, text)` comments to several cells of a sheet.
+    ///
+    /// The sheet's annotations container is fetched once for the whole batch,
+    /// and every reference is validated before anything is inserted.
+    pub async fn add_comments(
+        &mut self,
+        sheet_index: i32,
+        comments: &[(&str, &str)],
+    ) -> Result<()> {
+        let positions = comments
+            .iter()
+            .map(|(cell_ref, _)| Self::parse_cell_ref(cell_ref))
+            .collect::<Result<Vec<_>>>()?;
+        if positions.is_empty() {
+            return Ok(());
+        }
 
         // Get annotations supplier
         let sheet = self
@@ -480,19 +1099,20 @@ impl<'a> Workbook<'a> {
             Type::interface(type_names::X_SHEET_ANNOTATIONS),
         );
 
-        // Create CellAddress struct
-        let cell_addr = CellAddress::new(sheet_index as i16, col, row);
         let method = interface::annotations_insert_new();
-        self.conn
-            .call(
-                &ann_proxy,
-                &method,
-                &[
-                    cell_addr.to_uno(),
-                    UnoValue::String(text.to_string()),
-                ],
-            )
-            .await?;
+        for ((col, row), (_, text)) in positions.into_iter().zip(comments) {
+            let cell_addr = CellAddress::new(sheet_index as i16, col, row);
+            self.conn
+                .call(
+                    &ann_proxy,
+                    &method,
+                    &[
+                        cell_addr.to_uno(),
+                        UnoValue::String(text.to_string()),
+                    ],
+                )
+                .await?;
+        }
 
         // Note: setAuthor is not reliably supported in LO — the Python code
         // wraps it in try/except. We skip it for now.
@@ -504,6 +1124,51 @@ impl<'a> Workbook<'a> {
     // Row / Column dimensions
     // ========================================================================
 
+    /// Get the row or column at a zero-based index as an XPropertySet.
+    ///
+    /// `container` is `X_TABLE_ROWS` or `X_TABLE_COLUMNS`. The sheet's
+    /// container is resolved once and cached, so each further row or column
+    /// costs a single getByIndex.
+    async fn get_line_props(
+        &mut self,
+        sheet_index: i32,
+        container: &'static str,
+        index: i32,
+    ) -> Result<UnoProxy> {
+        let cached = self
+            .line_containers
+            .iter()
+            .find(|(i, t, _)| *i == sheet_index && *t == container)
+            .map(|(_, _, proxy)| proxy.clone());
+        let lines_idx = match cached {
+            Some(proxy) => proxy,
+            None => {
+                let sheet = self
+                    .get_sheet_proxy_as(sheet_index, type_names::X_COLUMN_ROW_RANGE)
+                    .await?;
+                let (method, context) = if container == type_names::X_TABLE_ROWS {
+                    (interface::get_rows(), "getRows")
+                } else {
+                    (interface::get_columns(), "getColumns")
+                };
+                let result = self.conn.call(&sheet, &method, &[]).await?;
+                let oid = Self::require_oid(&result, context)?;
+                let lines = UnoProxy::new(oid, Type::interface(container));
+                let idx = self.qi(&lines, type_names::X_INDEX_ACCESS).await?;
+                self.line_containers.push((sheet_index, container, idx.clone()));
+                idx
+            }
+        };
+
+        let method = interface::get_by_index();
+        let result = self
+            .conn
+            .call(&lines_idx, &method, &[UnoValue::Long(index)])
+            .await?;
+        let oid = Self::require_oid(&result, "getByIndex")?;
+        Ok(UnoProxy::new(oid, Type::interface(type_names::X_PROPERTY_SET)))
+    }
+
     /// Set the height of a row on a sheet (height in points).
     pub async fn set_row_height(
         &mut self,
@@ -511,26 +1176,9 @@ impl<'a> Workbook<'a> {
         row: i32,
         height_pt: f64,
     ) -> Result<()> {
-        let sheet = self
-            .get_sheet_proxy_as(sheet_index, type_names::X_COLUMN_ROW_RANGE)
-            .await?;
-        let method = interface::get_rows();
-        let result = self.conn.call(&sheet, &method, &[]).await?;
-        let rows_oid = Self::require_oid(&result, "getRows")?;
-        let rows_proxy = UnoProxy::new(rows_oid, Type::interface(type_names::X_TABLE_ROWS));
-
-        // getByIndex on rows
-        let rows_idx = self.qi(&rows_proxy, type_names::X_INDEX_ACCESS).await?;
-        let get_by_idx = interface::get_by_index();
-        let row_result = self
-            .conn
-            .call(&rows_idx, &get_by_idx, &[UnoValue::Long(row)])
+        let row_proxy = self
+            .get_line_props(sheet_index, type_names::X_TABLE_ROWS, row)
             .await?;
-        let row_oid = Self::require_oid(&row_result, "rows.getByIndex")?;
-        let row_proxy = UnoProxy::new(
-            row_oid,
-            Type::interface(type_names::X_PROPERTY_SET),
-        );
 
         // Height is in 1/100 mm; 1pt = 0.3528mm → multiply by 35.28
         let height_100mm = (height_pt * 35.28) as i32;
@@ -545,6 +1193,18 @@ impl<'a> Workbook<'a> {
         .await
     }
 
+    /// Set the heights of several rows on a sheet from `(row, height_pt)` pairs.
+    pub async fn set_row_heights(
+        &mut self,
+        sheet_index: i32,
+        heights: &[(i32, f64)],
+    ) -> Result<()> {
+        for &(row, height_pt) in heights {
+            self.set_row_height(sheet_index, row, height_pt).await?;
+        }
+        Ok(())
+    }
+
     /// Set the width of a column on a sheet (width in character units, approximate).
     pub async fn set_column_width(
         &mut self,
@@ -552,28 +1212,9 @@ impl<'a> Workbook<'a> {
         col: i32,
         width_chars: f64,
     ) -> Result<()> {
-        let sheet = self
-            .get_sheet_proxy_as(sheet_index, type_names::X_COLUMN_ROW_RANGE)
+        let col_proxy = self
+            .get_line_props(sheet_index, type_names::X_TABLE_COLUMNS, col)
             .await?;
-        let method = interface::get_columns();
-        let result = self.conn.call(&sheet, &method, &[]).await?;
-        let cols_oid = Self::require_oid(&result, "getColumns")?;
-        let cols_proxy = UnoProxy::new(
-            cols_oid,
-            Type::interface(type_names::X_TABLE_COLUMNS),
-        );
-
-        let cols_idx = self.qi(&cols_proxy, type_names::X_INDEX_ACCESS).await?;
-        let get_by_idx = interface::get_by_index();
-        let col_result = self
-            .conn
-            .call(&cols_idx, &get_by_idx, &[UnoValue::Long(col)])
-            .await?;
-        let col_oid = Self::require_oid(&col_result, "cols.getByIndex")?;
-        let col_proxy = UnoProxy::new(
-            col_oid,
-            Type::interface(type_names::X_PROPERTY_SET),
-        );
 
         // Width in 1/100 mm; 1 char ≈ 2.5mm → multiply by 250
         let width_100mm = (width_chars * 250.0) as i32;
@@ -588,6 +1229,19 @@ impl<'a> Workbook<'a> {
         .await
     }
 
+    /// Set the widths of several columns on a sheet from `(col, width_chars)`
+    /// pairs.
+    pub async fn set_column_widths(
+        &mut self,
+        sheet_index: i32,
+        widths: &[(i32, f64)],
+    ) -> Result<()> {
+        for &(col, width_chars) in widths {
+            self.set_column_width(sheet_index, col, width_chars).await?;
+        }
+        Ok(())
+    }
+
     /// Hide or show a row on a sheet.
     pub async fn set_row_hidden(
         &mut self,
@@ -595,25 +1249,9 @@ impl<'a> Workbook<'a> {
         row: i32,
         hidden: bool,
     ) -> Result<()> {
-        let sheet = self
-            .get_sheet_proxy_as(sheet_index, type_names::X_COLUMN_ROW_RANGE)
-            .await?;
-        let method = interface::get_rows();
-        let result = self.conn.call(&sheet, &method, &[]).await?;
-        let rows_oid = Self::require_oid(&result, "getRows")?;
-        let rows_proxy = UnoProxy::new(rows_oid, Type::interface(type_names::X_TABLE_ROWS));
-
-        let rows_idx = self.qi(&rows_proxy, type_names::X_INDEX_ACCESS).await?;
-        let get_by_idx = interface::get_by_index();
-        let row_result = self
-            .conn
-            .call(&rows_idx, &get_by_idx, &[UnoValue::Long(row)])
+        let row_proxy = self
+            .get_line_props(sheet_index, type_names::X_TABLE_ROWS, row)
             .await?;
-        let row_oid = Self::require_oid(&row_result, "rows.getByIndex")?;
-        let row_proxy = UnoProxy::new(
-            row_oid,
-            Type::interface(type_names::X_PROPERTY_SET),
-        );
 
         self.set_property(
             &row_proxy,
@@ -632,19 +1270,25 @@ impl<'a> Workbook<'a> {
 
     /// Look up or register a number format string, returning its format ID.
     ///
-    /// Tries `queryKey` first; if not found (-1), calls `addNew`.
+    /// Tries `queryKey` first; if not found (-1), calls `addNew`. Keys are
+    /// stable for the lifetime of the document, so each format string is
+    /// resolved over URP only once.
     pub async fn get_or_create_number_format(&mut self, format_str: &str) -> Result<i32> {
-        // Get XNumberFormatsSupplier from the document
-        let nfs_proxy = self
-            .doc_qi(type_names::X_NUMBER_FORMATS_SUPPLIER)
-            .await?;
-        let method = interface::get_number_formats();
-        let result = self.conn.call(&nfs_proxy, &method, &[]).await?;
-        let nf_oid = Self::require_oid(&result, "getNumberFormats")?;
-        let nf_proxy = UnoProxy::new(
-            nf_oid,
-            Type::interface(type_names::X_NUMBER_FORMATS),
-        );
+        if let Some((_, key)) = self
+            .number_format_keys
+            .iter()
+            .find(|(f, _)| f == format_str)
+        {
+            return Ok(*key);
+        }
+        let key = self.resolve_number_format(format_str).await?;
+        self.number_format_keys.push((format_str.to_string(), key));
+        Ok(key)
+    }
+
+    /// Query or register a format string over URP (uncached).
+    async fn resolve_number_format(&mut self, format_str: &str) -> Result<i32> {
+        let nf_proxy = self.get_number_formats().await?;
 
         let locale = Locale::empty();
 
@@ -694,97 +1338,75 @@ impl<'a> Workbook<'a> {
         }
     }
 
+    /// Get the document's XNumberFormats container.
+    async fn get_number_formats(&mut self) -> Result<UnoProxy> {
+        if let Some(ref nf) = self.number_formats {
+            return Ok(nf.clone());
+        }
+        // Get XNumberFormatsSupplier from the document
+        let nfs_proxy = self
+            .doc_qi(type_names::X_NUMBER_FORMATS_SUPPLIER)
+            .await?;
+        let method = interface::get_number_formats();
+        let result = self.conn.call(&nfs_proxy, &method, &[]).await?;
+        let nf_oid = Self::require_oid(&result, "getNumberFormats")?;
+        let nf_proxy = UnoProxy::new(
+            nf_oid,
+            Type::interface(type_names::X_NUMBER_FORMATS),
+        );
+        self.number_formats = Some(nf_proxy.clone());
+        Ok(nf_proxy)
+    }
+
     // ========================================================================
     // Cell styling
     // ========================================================================
 
     /// Apply a `StyleSpec` to a cell or range proxy.
     ///
-    /// This mirrors the Python `_apply_style_to_cell` method, setting
-    /// properties via XPropertySet.
+    /// This mirrors the Python `_apply_style_to_cell` method. The properties
+    /// are collected first and then set together with `set_properties`.
     pub async fn apply_style(
         &mut self,
         target: &UnoProxy,
         spec: &StyleSpec,
     ) -> Result<()> {
+        let mut props: Vec<(&'static str, UnoValue)> = Vec::new();
+
         // Font properties
         if spec.bold {
-            self.set_property(
-                target,
+            props.push((
                 "CharWeight",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::float(),
-                    value: UnoValue::Float(uno_types::font_weight::BOLD),
-                })),
-            )
-            .await?;
+                any(Type::float(), UnoValue::Float(uno_types::font_weight::BOLD)),
+            ));
         }
         if spec.italic {
-            self.set_property(
-                target,
+            props.push((
                 "CharPosture",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::short(),
-                    value: UnoValue::Short(uno_types::font_slant::ITALIC),
-                })),
-            )
-            .await?;
+                any(Type::short(), UnoValue::Short(uno_types::font_slant::ITALIC)),
+            ));
         }
         if let Some(ref underline) = spec.underline {
             let ul_val = uno_types::font_underline::from_name(underline);
-            self.set_property(
-                target,
-                "CharUnderline",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::short(),
-                    value: UnoValue::Short(ul_val),
-                })),
-            )
-            .await?;
+            props.push(("CharUnderline", any(Type::short(), UnoValue::Short(ul_val))));
         }
         if spec.strikethrough {
-            self.set_property(
-                target,
+            props.push((
                 "CharStrikeout",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::short(),
-                    value: UnoValue::Short(uno_types::font_strikeout::SINGLE),
-                })),
-            )
-            .await?;
+                any(Type::short(), UnoValue::Short(uno_types::font_strikeout::SINGLE)),
+            ));
         }
         if let Some(color) = spec.font_color {
-            self.set_property(
-                target,
-                "CharColor",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::long(),
-                    value: UnoValue::Long(color),
-                })),
-            )
-            .await?;
+            props.push(("CharColor", any(Type::long(), UnoValue::Long(color))));
         }
         if let Some(size) = spec.font_size {
-            self.set_property(
-                target,
-                "CharHeight",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::float(),
-                    value: UnoValue::Float(size),
-                })),
-            )
-            .await?;
+            props.push(("CharHeight", any(Type::float(), UnoValue::Float(size))));
         }
         if let Some(ref name) = spec.font_name {
-            self.set_property(
-                target,
+            props.push((
                 "CharFontName",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::string(),
-                    value: UnoValue::String(name.clone()),
-                })),
-            )
-            .await?;
+                any(Type::string(), UnoValue::String(name.clone())),
+            ));
         }
         if let Some(ref va) = spec.font_vertical_align {
             // CharEscapement: percentage shift (33=superscript, -33=subscript, 0=baseline)
@@ -796,138 +1418,67 @@ impl<'a> Workbook<'a> {
                 "subscript" => -33,
                 _ => 0,
             };
-            self.set_property(
-                target,
-                "CharEscapement",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::short(),
-                    value: UnoValue::Short(escapement),
-                })),
-            )
-            .await?;
+            props.push(("CharEscapement", any(Type::short(), UnoValue::Short(escapement))));
         }
 
         // Fill
         // Note: fill_gradient is kept in StyleSpec for future use but LO Calc 7.3
         // cells don't support FillStyle/FillGradient drawing properties.
         if let Some(color) = spec.fill_color {
-            self.set_property(
-                target,
-                "CellBackColor",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::long(),
-                    value: UnoValue::Long(color),
-                })),
-            )
-            .await?;
+            props.push(("CellBackColor", any(Type::long(), UnoValue::Long(color))));
         }
 
         // Alignment
         if let Some(ref h) = spec.horizontal {
             let val = uno_types::hori_justify::from_name(h);
-            self.set_property(
-                target,
-                "HoriJustify",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::long(),
-                    value: UnoValue::Long(val),
-                })),
-            )
-            .await?;
+            props.push(("HoriJustify", any(Type::long(), UnoValue::Long(val))));
         }
         if let Some(ref v) = spec.vertical {
             let val = uno_types::vert_justify::from_name(v);
-            self.set_property(
-                target,
-                "VertJustify",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::long(),
-                    value: UnoValue::Long(val),
-                })),
-            )
-            .await?;
+            props.push(("VertJustify", any(Type::long(), UnoValue::Long(val))));
         }
         if spec.wrap_text {
-            self.set_property(
-                target,
-                "IsTextWrapped",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::boolean(),
-                    value: UnoValue::Bool(true),
-                })),
-            )
-            .await?;
+            props.push(("IsTextWrapped", any(Type::boolean(), UnoValue::Bool(true))));
         }
         if spec.shrink_to_fit {
-            self.set_property(
-                target,
-                "ShrinkToFit",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::boolean(),
-                    value: UnoValue::Bool(true),
-                })),
-            )
-            .await?;
+            props.push(("ShrinkToFit", any(Type::boolean(), UnoValue::Bool(true))));
         }
         if spec.rotation != 0 {
             if spec.rotation == 255 {
                 // Stacked text
-                self.set_property(
-                    target,
-                    "Orientation",
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::long(),
-                        value: UnoValue::Long(1),
-                    })),
-                )
-                .await?;
+                props.push(("Orientation", any(Type::long(), UnoValue::Long(1))));
             } else {
                 // Rotation in 1/100 degree
-                self.set_property(
-                    target,
+                props.push((
                     "RotateAngle",
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::long(),
-                        value: UnoValue::Long(spec.rotation * 100),
-                    })),
-                )
-                .await?;
+                    any(Type::long(), UnoValue::Long(spec.rotation * 100)),
+                ));
             }
         }
         if spec.indent > 0 {
-            self.set_property(
-                target,
+            props.push((
                 "ParaIndent",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::short(),
-                    value: UnoValue::Short((spec.indent * 200) as i16),
-                })),
-            )
-            .await?;
+                any(Type::short(), UnoValue::Short((spec.indent * 200) as i16)),
+            ));
         }
 
         // Borders — all sides
+        let border_type = || Type::r#struct(uno_types::struct_type_names::BORDER_LINE2);
         if let Some(ref style_name) = spec.border_style {
             let color = spec.border_color.unwrap_or(0x000000);
             let (line_style, line_width) =
                 uno_types::border_line_style::from_name(style_name);
-            let border = BorderLine2::new(color, line_style, line_width);
-            for side in &["TopBorder", "BottomBorder", "LeftBorder", "RightBorder"] {
-                self.set_property(
-                    target,
-                    side,
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::r#struct(
-                            uno_types::struct_type_names::BORDER_LINE2,
-                        ),
-                        value: border.to_uno(),
-                    })),
-                )
-                .await?;
+            // Build the BorderLine2 value once and share it across the four sides
+            let border = any(
+                border_type(),
+                BorderLine2::new(color, line_style, line_width).to_uno(),
+            );
+            for side in ["TopBorder", "BottomBorder", "LeftBorder", "RightBorder"] {
+                props.push((side, border.clone()));
             }
         }
 
-        // Individual borders
+        // Individual borders (override the all-sides border)
         for (prop_name, border_opt) in [
             ("LeftBorder", &spec.left_border),
             ("RightBorder", &spec.right_border),
@@ -937,36 +1488,22 @@ impl<'a> Workbook<'a> {
             if let Some((ref style_name, color)) = border_opt {
                 let (line_style, line_width) =
                     uno_types::border_line_style::from_name(style_name);
-                let border = BorderLine2::new(*color, line_style, line_width);
-                self.set_property(
-                    target,
-                    prop_name,
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::r#struct(
-                            uno_types::struct_type_names::BORDER_LINE2,
-                        ),
-                        value: border.to_uno(),
-                    })),
-                )
-                .await?;
+                let border = any(
+                    border_type(),
+                    BorderLine2::new(*color, line_style, line_width).to_uno(),
+                );
+                props.retain(|(name, _)| *name != prop_name);
+                props.push((prop_name, border));
             }
         }
 
         // Number format
         if let Some(ref fmt) = spec.number_format {
             let fmt_id = self.get_or_create_number_format(fmt).await?;
-            self.set_property(
-                target,
-                "NumberFormat",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::long(),
-                    value: UnoValue::Long(fmt_id),
-                })),
-            )
-            .await?;
+            props.push(("NumberFormat", any(Type::long(), UnoValue::Long(fmt_id))));
         }
 
-        Ok(())
+        self.set_properties(target, props).await
     }
 
     /// Apply a `StyleSpec` to a cell identified by reference on a sheet.
@@ -977,10 +1514,67 @@ impl<'a> Workbook<'a> {
         spec: &StyleSpec,
     ) -> Result<()> {
         let (col, row) = Self::parse_cell_ref(cell_ref)?;
+        self.set_cell_style_at(sheet_index, col, row, spec).await
+    }
+
+    /// Apply a `StyleSpec` to a cell identified by zero-indexed position on
+    /// a sheet.
+    ///
+    /// Loops over rows or columns should prefer this to formatting an A1
+    /// reference per cell only to have it parsed again.
+    pub async fn set_cell_style_at(
+        &mut self,
+        sheet_index: i32,
+        col: i32,
+        row: i32,
+        spec: &StyleSpec,
+    ) -> Result<()> {
+        if spec.is_empty() {
+            return Ok(());
+        }
         let cell = self.get_cell_on_sheet(sheet_index, col, row).await?;
         self.apply_style(&cell, spec).await
     }
 
+    /// Apply a `StyleSpec` to each of several cells identified by A1
+    /// notation on a sheet.
+    ///
+    /// Every reference is validated before any cell is styled. Consecutive
+    /// entries with the same style that run down a column or along a row are
+    /// styled as one range, and entries with an empty style are skipped.
+    pub async fn set_cell_styles<'r>(
+        &mut self,
+        sheet_index: i32,
+        entries: impl IntoIterator<Item = (&'r str, &'r StyleSpec)>,
+    ) -> Result<()> {
+        let cells = entries
+            .into_iter()
+            .map(|(cell_ref, spec)| Ok((Self::parse_cell_ref(cell_ref)?, spec)))
+            .collect::<Result<Vec<_>>>()?;
+
+        let mut cells = cells.into_iter().filter(|(_, spec)| !spec.is_empty()).peekable();
+        while let Some(((col, row), spec)) = cells.next() {
+            let (mut end_col, mut end_row) = (col, row);
+            while let Some(((c, r), _)) = cells.next_if(|&((c, r), s)| {
+                s == spec
+                    && ((c == col && end_col == col && r == end_row + 1)
+                        || (r == row && end_row == row && c == end_col + 1))
+            }) {
+                (end_col, end_row) = (c, r);
+            }
+
+            if (end_col, end_row) == (col, row) {
+                self.set_cell_style_at(sheet_index, col, row, spec).await?;
+            } else {
+                let range = self
+                    .get_range_on_sheet(sheet_index, col, row, end_col, end_row)
+                    .await?;
+                self.apply_style(&range, spec).await?;
+            }
+        }
+        Ok(())
+    }
+
     /// Apply a `StyleSpec` to a range identified by A1 notation on a sheet.
     pub async fn set_range_style(
         &mut self,
@@ -988,6 +1582,9 @@ impl<'a> Workbook<'a> {
         range_ref: &str,
         spec: &StyleSpec,
     ) -> Result<()> {
+        if spec.is_empty() {
+            return Ok(());
+        }
         let range = self.get_cell_range_by_name(sheet_index, range_ref).await?;
         self.apply_style(&range, spec).await
     }
@@ -996,12 +1593,11 @@ impl<'a> Workbook<'a> {
     // Conditional formatting
     // ========================================================================
 
-    /// Create a named cell style for conditional formatting and return its name.
-    async fn create_cf_style(
-        &mut self,
-        style_name: &str,
-        spec: &StyleSpec,
-    ) -> Result<String> {
+    /// Get the document's "CellStyles" family as XNameContainer.
+    async fn get_cell_styles(&mut self) -> Result<UnoProxy> {
+        if let Some(ref cs) = self.cell_styles {
+            return Ok(cs.clone());
+        }
         // Get style families
         let sf_proxy = self
             .doc_qi(type_names::X_STYLE_FAMILIES_SUPPLIER)
@@ -1026,6 +1622,25 @@ impl<'a> Workbook<'a> {
             cs_oid,
             Type::interface(type_names::X_NAME_CONTAINER),
         );
+        self.cell_styles = Some(cs_proxy.clone());
+        Ok(cs_proxy)
+    }
+
+    /// Create a named cell style for conditional formatting and return its name.
+    ///
+    /// Styles are cached per workbook by spec; a repeated spec returns the name
+    /// of the style created first without another round-trip.
+    async fn create_cf_style(
+        &mut self,
+        style_name: &str,
+        spec: &StyleSpec,
+    ) -> Result<String> {
+        // Rules that share a spec share one style instead of inserting a copy
+        if let Some((_, name)) = self.cf_styles.iter().find(|(s, _)| s == spec) {
+            return Ok(name.clone());
+        }
+
+        let cs_proxy = self.get_cell_styles().await?;
 
         // doc.createInstance("com.sun.star.style.CellStyle")
         let msf_proxy = self.doc_qi(type_names::X_MULTI_SERVICE_FACTORY).await?;
@@ -1065,6 +1680,7 @@ impl<'a> Workbook<'a> {
         // Apply style properties
         self.apply_style(&style_proxy, spec).await?;
 
+        self.cf_styles.push((spec.clone(), style_name.to_string()));
         Ok(style_name.to_string())
     }
 
@@ -1075,6 +1691,9 @@ impl<'a> Workbook<'a> {
     /// - `formula`: The formula/value string
     /// - `style_name`: Name for the CF cell style
     /// - `style`: The style to apply when condition matches
+    ///
+    /// If a style with an identical spec was already created on this workbook,
+    /// the rule reuses it and `style_name` is ignored.
     pub async fn add_conditional_format(
         &mut self,
         sheet_index: i32,
@@ -1084,8 +1703,45 @@ impl<'a> Workbook<'a> {
         style_name: &str,
         style: &StyleSpec,
     ) -> Result<()> {
-        // Create the named cell style
-        self.create_cf_style(style_name, style).await?;
+        self.add_cf_rules(sheet_index, range_ref, &[(operator, formula, style_name, style)])
+            .await
+    }
+
+    /// Add several conditional format rules to the same range.
+    ///
+    /// Equivalent to calling `add_conditional_format` once per rule, but the
+    /// range's ConditionalFormat entries are read and written back only once.
+    pub async fn add_conditional_formats(
+        &mut self,
+        sheet_index: i32,
+        range_ref: &str,
+        rules: &[CfRuleSpec],
+    ) -> Result<()> {
+        let rules: Vec<_> = rules
+            .iter()
+            .map(|r| {
+                (
+                    r.operator.as_str(),
+                    r.formula.as_str(),
+                    r.style_name.as_str(),
+                    &r.style,
+                )
+            })
+            .collect();
+        self.add_cf_rules(sheet_index, range_ref, &rules).await
+    }
+
+    /// Append `(operator, formula, style_name, style)` rules to a range's
+    /// ConditionalFormat entries with a single read and write-back.
+    async fn add_cf_rules(
+        &mut self,
+        sheet_index: i32,
+        range_ref: &str,
+        rules: &[(&str, &str, &str, &StyleSpec)],
+    ) -> Result<()> {
+        if rules.is_empty() {
+            return Ok(());
+        }
 
         // Get the *range's* ConditionalFormat property so we append to existing
         // rules rather than overwriting them.
@@ -1103,25 +1759,30 @@ impl<'a> Workbook<'a> {
             Type::interface(type_names::X_SHEET_CONDITIONAL_ENTRIES),
         );
 
-        // Build the condition properties tuple
-        let op_val = uno_types::condition_operator::from_name(operator);
-        let props = UnoValue::Sequence(vec![
-            make_property_value(
-                "Operator",
-                UnoValue::Enum(op_val),
-                Type::r#enum("com.sun.star.sheet.ConditionOperator"),
-            ),
-            make_property_value("Formula1", UnoValue::String(formula.to_string()), Type::string()),
-            make_property_value(
-                "StyleName",
-                UnoValue::String(style_name.to_string()),
-                Type::string(),
-            ),
-        ]);
-
-        // addNew(props)
-        let method = interface::conditional_entries_add_new();
-        self.conn.call(&cf_proxy, &method, &[props]).await?;
+        for &(operator, formula, style_name, style) in rules {
+            // Create the named cell style (or reuse an identical one)
+            let style_name = self.create_cf_style(style_name, style).await?;
+
+            // Build the condition properties tuple
+            let op_val = uno_types::condition_operator::from_name(operator);
+            let props = UnoValue::Sequence(vec![
+                make_property_value(
+                    "Operator",
+                    UnoValue::Enum(op_val),
+                    Type::r#enum("com.sun.star.sheet.ConditionOperator"),
+                ),
+                make_property_value("Formula1", UnoValue::String(formula.to_string()), Type::string()),
+                make_property_value(
+                    "StyleName",
+                    UnoValue::String(style_name),
+                    Type::string(),
+                ),
+            ]);
+
+            // addNew(props)
+            let method = interface::conditional_entries_add_new();
+            self.conn.call(&cf_proxy, &method, &[props]).await?;
+        }
 
         // Apply CF entries back to the cell range (reuse the range proxy from above)
         self.set_property(
@@ -1175,155 +1836,70 @@ impl<'a> Workbook<'a> {
             Type::interface(type_names::X_PROPERTY_SET),
         );
 
-        // Set Type
-        let vtype = uno_types::validation_type::from_name(validation_type);
-        self.set_property(
-            &val_proxy,
-            "Type",
-            UnoValue::Any(Box::new(Any {
-                type_desc: Type::r#enum("com.sun.star.sheet.ValidationType"),
-                value: UnoValue::Enum(vtype),
-            })),
-        )
-        .await?;
+        let string = |s: &str| any(Type::string(), UnoValue::String(s.to_string()));
+        let boolean = |b: bool| any(Type::boolean(), UnoValue::Bool(b));
 
-        // Set Operator
+        let vtype = uno_types::validation_type::from_name(validation_type);
         let vop = uno_types::condition_operator::from_name(operator);
-        self.set_property(
-            &val_proxy,
-            "Operator",
-            UnoValue::Any(Box::new(Any {
-                type_desc: Type::r#enum("com.sun.star.sheet.ConditionOperator"),
-                value: UnoValue::Enum(vop),
-            })),
-        )
-        .await?;
+        let alert_val = uno_types::validation_alert_style::from_name(error_style);
+        let mut props = vec![
+            (
+                "Type",
+                any(
+                    Type::r#enum("com.sun.star.sheet.ValidationType"),
+                    UnoValue::Enum(vtype),
+                ),
+            ),
+            (
+                "Operator",
+                any(
+                    Type::r#enum("com.sun.star.sheet.ConditionOperator"),
+                    UnoValue::Enum(vop),
+                ),
+            ),
+            // Options
+            ("IgnoreBlankCells", boolean(allow_blank)),
+            ("ShowList", boolean(show_dropdown)),
+            (
+                "ErrorAlertStyle",
+                any(
+                    Type::r#enum("com.sun.star.sheet.ValidationAlertStyle"),
+                    UnoValue::Enum(alert_val),
+                ),
+            ),
+        ];
 
-        // Set formulas
+        // Formulas
         if !formula1.is_empty() {
-            self.set_property(
-                &val_proxy,
-                "Formula1",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::string(),
-                    value: UnoValue::String(formula1.to_string()),
-                })),
-            )
-            .await?;
+            props.push(("Formula1", string(formula1)));
         }
         if !formula2.is_empty() {
-            self.set_property(
-                &val_proxy,
-                "Formula2",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::string(),
-                    value: UnoValue::String(formula2.to_string()),
-                })),
-            )
-            .await?;
+            props.push(("Formula2", string(formula2)));
         }
 
-        // Options
-        self.set_property(
-            &val_proxy,
-            "IgnoreBlankCells",
-            UnoValue::Any(Box::new(Any {
-                type_desc: Type::boolean(),
-                value: UnoValue::Bool(allow_blank),
-            })),
-        )
-        .await?;
-        self.set_property(
-            &val_proxy,
-            "ShowList",
-            UnoValue::Any(Box::new(Any {
-                type_desc: Type::boolean(),
-                value: UnoValue::Bool(show_dropdown),
-            })),
-        )
-        .await?;
-
         // Input message
         if input_title.is_some() || input_message.is_some() {
-            self.set_property(
-                &val_proxy,
-                "ShowInputMessage",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::boolean(),
-                    value: UnoValue::Bool(true),
-                })),
-            )
-            .await?;
+            props.push(("ShowInputMessage", boolean(true)));
             if let Some(title) = input_title {
-                self.set_property(
-                    &val_proxy,
-                    "InputTitle",
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::string(),
-                        value: UnoValue::String(title.to_string()),
-                    })),
-                )
-                .await?;
+                props.push(("InputTitle", string(title)));
             }
             if let Some(msg) = input_message {
-                self.set_property(
-                    &val_proxy,
-                    "InputMessage",
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::string(),
-                        value: UnoValue::String(msg.to_string()),
-                    })),
-                )
-                .await?;
+                props.push(("InputMessage", string(msg)));
             }
         }
 
         // Error message
         if error_title.is_some() || error_message.is_some() {
-            self.set_property(
-                &val_proxy,
-                "ShowErrorMessage",
-                UnoValue::Any(Box::new(Any {
-                    type_desc: Type::boolean(),
-                    value: UnoValue::Bool(true),
-                })),
-            )
-            .await?;
+            props.push(("ShowErrorMessage", boolean(true)));
             if let Some(title) = error_title {
-                self.set_property(
-                    &val_proxy,
-                    "ErrorTitle",
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::string(),
-                        value: UnoValue::String(title.to_string()),
-                    })),
-                )
-                .await?;
+                props.push(("ErrorTitle", string(title)));
             }
             if let Some(msg) = error_message {
-                self.set_property(
-                    &val_proxy,
-                    "ErrorMessage",
-                    UnoValue::Any(Box::new(Any {
-                        type_desc: Type::string(),
-                        value: UnoValue::String(msg.to_string()),
-                    })),
-                )
-                .await?;
+                props.push(("ErrorMessage", string(msg)));
             }
         }
 
-        // Error alert style
-        let alert_val = uno_types::validation_alert_style::from_name(error_style);
-        self.set_property(
-            &val_proxy,
-            "ErrorAlertStyle",
-            UnoValue::Any(Box::new(Any {
-                type_desc: Type::r#enum("com.sun.star.sheet.ValidationAlertStyle"),
-                value: UnoValue::Enum(alert_val),
-            })),
-        )
-        .await?;
+        self.set_properties(&val_proxy, props).await?;
 
         // Apply validation back to the range
         self.set_property(
@@ -1345,65 +1921,31 @@ impl<'a> Workbook<'a> {
 
     /// Save the workbook as XLSX to the given file path.
     pub async fn save(&mut self, path: &str) -> Result<()> {
-        // Convert to file:// URL
-        let url = if path.starts_with("file://") {
-            path.to_string()
-        } else {
-            let abs = if path.starts_with('/') {
-                path.to_string()
-            } else {
-                std::env::current_dir()
-                    .unwrap_or_default()
-                    .join(path)
-                    .display()
-                    .to_string()
-            };
-            format!("file://{abs}")
-        };
-
-        // queryInterface for XStorable
-        let storable_proxy = self.doc_qi(type_names::X_STORABLE).await?;
-
-        let filter_pv = make_property_value(
-            "FilterName",
-            UnoValue::String("Calc MS Excel 2007 XML".to_string()),
-            Type::string(),
-        );
-        let overwrite_pv =
-            make_property_value("Overwrite", UnoValue::Bool(true), Type::boolean());
-        let props = UnoValue::Sequence(vec![filter_pv, overwrite_pv]);
-
-        let method = interface::store_to_url();
-        self.conn
-            .call(&storable_proxy, &method, &[UnoValue::String(url), props])
-            .await?;
-
+        self.store_to_url(path, "Calc MS Excel 2007 XML").await?;
         tracing::info!("Saved workbook to {path}");
         Ok(())
     }
 
     /// Save the workbook as XLS (Excel 97) to the given file path.
     pub async fn save_as_xls(&mut self, path: &str) -> Result<()> {
-        let url = if path.starts_with("file://") {
-            path.to_string()
-        } else {
-            let abs = if path.starts_with('/') {
-                path.to_string()
-            } else {
-                std::env::current_dir()
-                    .unwrap_or_default()
-                    .join(path)
-                    .display()
-                    .to_string()
-            };
-            format!("file://{abs}")
-        };
+        self.store_to_url(path, "MS Excel 97").await?;
+        tracing::info!("Saved workbook as XLS to {path}");
+        Ok(())
+    }
 
+    /// Store the document to `path` with the given export filter,
+    /// overwriting any existing file.
+    async fn store_to_url(&mut self, path: &str, filter_name: &str) -> Result<()> {
+        if !self.automatic_calculation {
+            self.calculate_all().await?;
+        }
+
+        // queryInterface for XStorable
         let storable_proxy = self.doc_qi(type_names::X_STORABLE).await?;
 
         let filter_pv = make_property_value(
             "FilterName",
-            UnoValue::String("MS Excel 97".to_string()),
+            UnoValue::String(filter_name.to_string()),
             Type::string(),
         );
         let overwrite_pv =
@@ -1412,10 +1954,12 @@ impl<'a> Workbook<'a> {
 
         let method = interface::store_to_url();
         self.conn
-            .call(&storable_proxy, &method, &[UnoValue::String(url), props])
+            .call(
+                &storable_proxy,
+                &method,
+                &[UnoValue::String(file_url(path)), props],
+            )
             .await?;
-
-        tracing::info!("Saved workbook as XLS to {path}");
         Ok(())
     }
 
@@ -1451,6 +1995,23 @@ mod tests {
         assert!(Workbook::parse_cell_ref("1").is_err());
         assert!(Workbook::parse_cell_ref("A0").is_err());
         assert!(Workbook::parse_cell_ref("A").is_err());
+        assert!(Workbook::parse_cell_ref("A+1").is_err());
+        assert!(Workbook::parse_cell_ref("A1B").is_err());
+        assert!(Workbook::parse_cell_ref("AAAAAAAAAAAAAAAAAAAA1").is_err());
+
+        assert_eq!(Workbook::parse_cell_ref("ab3").unwrap(), (27, 2));
+        assert_eq!(Workbook::parse_cell_ref("XFD1048576").unwrap(), (16383, 1048575));
+    }
+
+    #[test]
+    fn test_parse_range_ref() {
+        assert_eq!(Workbook::parse_range_ref("A1:C3").unwrap(), (0, 0, 2, 2));
+        assert_eq!(Workbook::parse_range_ref("B2").unwrap(), (1, 1, 1, 1));
+        assert_eq!(Workbook::parse_range_ref("C3:A1").unwrap(), (0, 0, 2, 2));
+
+        assert!(Workbook::parse_range_ref("$A$1:B2").is_err());
+        assert!(Workbook::parse_range_ref("Sheet1.A1:B2").is_err());
+        assert!(Workbook::parse_range_ref("A1:").is_err());
     }
 
     #[test]
@@ -1467,4 +2028,14 @@ mod tests {
             _ => panic!("Expected Struct"),
         }
     }
+
+    #[test]
+    fn test_file_url() {
+        assert_eq!(file_url("/tmp/out.xlsx"), "file:///tmp/out.xlsx");
+        assert_eq!(file_url("file:///tmp/out.xlsx"), "file:///tmp/out.xlsx");
+
+        let url = file_url("out.xlsx");
+        assert!(url.starts_with("file:///"), "{url}");
+        assert!(url.ends_with("/out.xlsx"), "{url}");
+    }
 }
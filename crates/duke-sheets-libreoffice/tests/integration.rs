@@ -101,6 +101,42 @@ async fn test_create_workbook_and_set_cells() {
     eprintln!("OK: Created workbook, set cells, read back values");
 }
 
+#[tokio::test]
+async fn test_batched_reads() {
+    use duke_sheets_libreoffice::CellValue;
+
+    skip_if_no_urp!();
+
+    let mut bridge =
+        duke_sheets_libreoffice::LibreOfficeBridge::connect("localhost", 2002)
+            .await
+            .expect("connect");
+
+    let mut wb = bridge.create_workbook().await.expect("create_workbook");
+
+    wb.set_cell_value("A1", 42.0).await.expect("set A1");
+    wb.set_cell_value("B1", "Hello").await.expect("set B1");
+    wb.set_cell_formula("A2", "=A1*2").await.expect("set A2");
+
+    let data = wb.get_range_data(0, "A1:B2").await.expect("get data");
+    assert!(matches!(data[0][0], CellValue::Number(n) if n == 42.0), "{data:?}");
+    assert!(matches!(&data[0][1], CellValue::String(s) if s == "Hello"), "{data:?}");
+    assert!(matches!(data[1][0], CellValue::Number(n) if n == 84.0), "{data:?}");
+    assert!(matches!(data[1][1], CellValue::Empty), "{data:?}");
+
+    let formulas = wb.get_range_formulas(0, "A1:B2").await.expect("get formulas");
+    assert_eq!(formulas[1][0], "=A1*2");
+    assert_eq!(formulas[1][1], "");
+
+    wb.set_sheet_name(0, "Data").await.expect("rename sheet");
+    wb.add_sheet("Summary").await.expect("add sheet");
+    let names = wb.sheet_names().await.expect("sheet names");
+    assert_eq!(names, ["Data", "Summary"]);
+
+    wb.close().await.expect("close");
+    let _ = bridge.shutdown().await;
+}
+
 #[tokio::test]
 async fn test_save_and_read_back_with_duke_sheets() {
     skip_if_no_urp!();
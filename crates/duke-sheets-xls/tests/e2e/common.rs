@@ -3,30 +3,61 @@
 //! Mirrors the XLSX E2E common module — reuses the same LO bridge singleton.
 
 use std::path::PathBuf;
-use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
 use std::sync::OnceLock;
 
 use duke_sheets_libreoffice::bridge::LibreOfficeBridge;
 use tokio::runtime::Runtime;
-use tokio::sync::Mutex;
+use tokio::sync::{Mutex, OnceCell};
 
 const SHARED_DIR: &str = "/tmp/duke-sheets-urp";
 
 static RUNTIME: OnceLock<Runtime> = OnceLock::new();
-static LO_BRIDGE: OnceLock<Mutex<LibreOfficeBridge>> = OnceLock::new();
+static LO_BRIDGES: OnceCell<Vec<Mutex<LibreOfficeBridge>>> = OnceCell::const_new();
+static NEXT_BRIDGE: AtomicUsize = AtomicUsize::new(0);
+static LO_AVAILABLE: OnceLock<bool> = OnceLock::new();
 static FILE_COUNTER: AtomicU64 = AtomicU64::new(0);
 
 pub fn lo_available() -> bool {
-    std::net::TcpStream::connect_timeout(
-        &"127.0.0.1:2002".parse().unwrap(),
-        std::time::Duration::from_secs(2),
-    )
-    .is_ok()
+    *LO_AVAILABLE.get_or_init(|| {
+        std::net::TcpStream::connect_timeout(
+            &std::net::SocketAddr::from(([127, 0, 0, 1], lo_ports()[0])),
+            std::time::Duration::from_secs(2),
+        )
+        .is_ok()
+    })
+}
+
+/// Same instance list as the XLSX E2E tests (`DUKE_SHEETS_LO_PORTS`).
+fn lo_ports() -> Vec<u16> {
+    let ports: Vec<u16> = std::env::var("DUKE_SHEETS_LO_PORTS")
+        .ok()
+        .map(|v| v.split(',').filter_map(|p| p.trim().parse().ok()).collect())
+        .unwrap_or_default();
+    if ports.is_empty() {
+        vec![2002]
+    } else {
+        ports
+    }
+}
+
+/// Same pool sizing as the XLSX E2E tests (`DUKE_SHEETS_LO_CONNECTIONS`).
+fn pool_size() -> usize {
+    std::env::var("DUKE_SHEETS_LO_CONNECTIONS")
+        .ok()
+        .and_then(|v| v.parse().ok())
+        .unwrap_or_else(|| {
+            std::thread::available_parallelism()
+                .map_or(1, |n| n.get())
+                .min(4)
+                .max(lo_ports().len())
+        })
+        .max(1)
 }
 
 pub fn runtime() -> &'static Runtime {
     RUNTIME.get_or_init(|| {
-        tokio::runtime::Builder::new_current_thread()
+        tokio::runtime::Builder::new_multi_thread()
             .enable_all()
             .build()
             .expect("Failed to create tokio runtime")
@@ -37,14 +68,26 @@ pub async fn lo_bridge() -> Option<&'static Mutex<LibreOfficeBridge>> {
     if !lo_available() {
         return None;
     }
-    let _ = std::fs::create_dir_all(SHARED_DIR);
-    if LO_BRIDGE.get().is_none() {
-        let bridge = LibreOfficeBridge::connect("127.0.0.1", 2002)
-            .await
-            .expect("Failed to connect to LibreOffice on localhost:2002");
-        let _ = LO_BRIDGE.set(Mutex::new(bridge));
-    }
-    LO_BRIDGE.get()
+    let bridges = LO_BRIDGES
+        .get_or_init(|| async {
+            let _ = std::fs::create_dir_all(SHARED_DIR);
+            let ports = lo_ports();
+            let mut bridges = Vec::new();
+            for i in 0..pool_size() {
+                let port = ports[i % ports.len()];
+                let bridge = LibreOfficeBridge::connect("127.0.0.1", port)
+                    .await
+                    .unwrap_or_else(|e| {
+                        panic!("Failed to connect to LibreOffice on localhost:{port}: {e}")
+                    });
+                bridges.push(Mutex::new(bridge));
+            }
+            bridges
+        })
+        .await;
+    let idle = bridges.iter().find(|b| b.try_lock().is_ok());
+    let next = NEXT_BRIDGE.fetch_add(1, Ordering::Relaxed) % bridges.len();
+    Some(idle.unwrap_or(&bridges[next]))
 }
 
 pub fn temp_fixture_path() -> PathBuf {
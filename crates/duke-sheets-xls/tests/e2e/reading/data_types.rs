@@ -13,10 +13,9 @@ fn test_xls_number_values() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", 42.0).await.unwrap();
-        wb.set_cell_value("B1", 3.14).await.unwrap();
-        wb.set_cell_value("C1", -100.0).await.unwrap();
-        wb.set_cell_value("D1", 0.0).await.unwrap();
+        wb.set_row_values(0, "A1", [42.0, 3.14, -100.0, 0.0])
+            .await
+            .unwrap();
         wb.save_as_xls(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
@@ -60,12 +59,8 @@ fn test_xls_string_values() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", "Hello").await.unwrap();
-        wb.set_cell_value("B1", "World").await.unwrap();
-        wb.set_cell_value("C1", "").await.unwrap();
-        wb.set_cell_value("D1", "Special chars: <>&\"'")
-            .await
-            .unwrap();
+        let values = ["Hello", "World", "", "Special chars: <>&\"'"];
+        wb.set_row_values(0, "A1", values).await.unwrap();
         wb.save_as_xls(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
@@ -145,9 +140,12 @@ fn test_xls_formula_values() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", 10.0).await.unwrap();
-        wb.set_cell_value("B1", 20.0).await.unwrap();
-        wb.set_cell_formula("C1", "=A1+B1").await.unwrap();
+        let values = [
+            duke_sheets_libreoffice::CellValue::Number(10.0),
+            duke_sheets_libreoffice::CellValue::Number(20.0),
+            duke_sheets_libreoffice::CellValue::Formula("=A1+B1".into()),
+        ];
+        wb.set_row_values(0, "A1", values).await.unwrap();
         wb.save_as_xls(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
@@ -67,11 +67,12 @@ fn test_xls_multiple_row_heights() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", "Row 1").await.unwrap();
-        wb.set_cell_value("A2", "Row 2").await.unwrap();
-        wb.set_cell_value("A3", "Row 3").await.unwrap();
-        wb.set_row_height(0, 0, 25.0).await.unwrap();
-        wb.set_row_height(0, 2, 40.0).await.unwrap();
+        wb.set_column_values(0, "A1", ["Row 1", "Row 2", "Row 3"])
+            .await
+            .unwrap();
+        wb.set_row_heights(0, &[(0, 25.0), (2, 40.0)])
+            .await
+            .unwrap();
         wb.save_as_xls(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
@@ -97,9 +98,9 @@ fn test_xls_hidden_row() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", "Visible").await.unwrap();
-        wb.set_cell_value("A2", "Hidden").await.unwrap();
-        wb.set_cell_value("A3", "Visible").await.unwrap();
+        wb.set_column_values(0, "A1", ["Visible", "Hidden", "Visible"])
+            .await
+            .unwrap();
         wb.set_row_hidden(0, 1, true).await.unwrap();
         wb.save_as_xls(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
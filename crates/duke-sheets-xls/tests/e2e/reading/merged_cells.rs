@@ -101,10 +101,10 @@ fn test_xls_multiple_merged_regions() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", "Region 1").await.unwrap();
-        wb.set_cell_value("A5", "Region 2").await.unwrap();
-        wb.merge_range(0, "A1:C1").await.unwrap();
-        wb.merge_range(0, "A5:B6").await.unwrap();
+        wb.set_cell_values(0, [("A1", "Region 1"), ("A5", "Region 2")])
+            .await
+            .unwrap();
+        wb.merge_ranges(0, &["A1:C1", "A5:B6"]).await.unwrap();
         wb.save_as_xls(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
@@ -3,11 +3,13 @@
 //! XLSX (Office Open XML) reader and writer for duke-sheets.
 
 pub mod error;
+pub mod options;
 pub mod reader;
 pub mod writer;
 
 mod styles;
 
 pub use error::{XlsxError, XlsxResult};
+pub use options::{XlsxCompression, XlsxWriteOptions};
 pub use reader::XlsxReader;
 pub use writer::XlsxWriter;
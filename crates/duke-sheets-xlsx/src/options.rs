@@ -0,0 +1,38 @@
+//! XLSX options
+
+/// Options for writing XLSX files
+#[derive(Debug, Clone, Default)]
+pub struct XlsxWriteOptions {
+    /// Compression applied to each part of the package (default: DEFLATE at
+    /// the zip library's default level)
+    pub compression: XlsxCompression,
+}
+
+/// Compression applied to the parts of an XLSX package
+///
+/// Deflating the XML parts dominates write time for large sheets. Files that
+/// are read back right away (e.g. test fixtures) can trade size for speed.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub enum XlsxCompression {
+    /// DEFLATE at the default level
+    #[default]
+    Default,
+    /// DEFLATE at level 1: several times faster, slightly larger files
+    Fastest,
+    /// No compression
+    Stored,
+}
+
+impl XlsxCompression {
+    /// Zip entry options for this compression setting
+    pub(crate) fn file_options(self) -> zip::write::SimpleFileOptions {
+        let options = zip::write::SimpleFileOptions::default();
+        match self {
+            XlsxCompression::Default => options,
+            XlsxCompression::Fastest => options
+                .compression_method(zip::CompressionMethod::Deflated)
+                .compression_level(Some(1)),
+            XlsxCompression::Stored => options.compression_method(zip::CompressionMethod::Stored),
+        }
+    }
+}
@@ -1,26 +1,54 @@
 //! XLSX writer
 
+use std::fmt::Write as _;
 use std::fs::File;
-use std::io::{Seek, Write};
+use std::io::{BufWriter, Seek, Write};
 use std::path::Path;
 
 use crate::error::{XlsxError, XlsxResult};
+use crate::options::XlsxWriteOptions;
 use crate::styles::XlsxStyleTable;
 use duke_sheets_core::{CellAddress, Workbook};
 
+/// Size at which buffered worksheet XML is flushed to the zip entry
+const FLUSH_THRESHOLD: usize = 64 * 1024;
+
+/// Buffer size for writing the package to a file
+const FILE_BUFFER_SIZE: usize = 256 * 1024;
+
 /// XLSX file writer
 pub struct XlsxWriter;
 
 impl XlsxWriter {
     /// Write a workbook to a file path
     pub fn write_file<P: AsRef<Path>>(workbook: &Workbook, path: P) -> XlsxResult<()> {
-        let file = File::create(path)?;
-        Self::write(workbook, file)
+        Self::write_file_with_options(workbook, path, &XlsxWriteOptions::default())
+    }
+
+    /// Write a workbook to a file path with the given options
+    pub fn write_file_with_options<P: AsRef<Path>>(
+        workbook: &Workbook,
+        path: P,
+        options: &XlsxWriteOptions,
+    ) -> XlsxResult<()> {
+        // The zip writer issues many small writes (headers, deflate blocks)
+        let file = BufWriter::with_capacity(FILE_BUFFER_SIZE, File::create(path)?);
+        Self::write_with_options(workbook, file, options)
     }
 
     /// Write a workbook to a writer
     pub fn write<W: Write + Seek>(workbook: &Workbook, writer: W) -> XlsxResult<()> {
+        Self::write_with_options(workbook, writer, &XlsxWriteOptions::default())
+    }
+
+    /// Write a workbook to a writer with the given options
+    pub fn write_with_options<W: Write + Seek>(
+        workbook: &Workbook,
+        writer: W,
+        options: &XlsxWriteOptions,
+    ) -> XlsxResult<()> {
         let mut zip = zip::ZipWriter::new(writer);
+        let file_options = options.compression.file_options();
 
         // Build a workbook-wide style table.
         let style_table = XlsxStyleTable::build(workbook);
@@ -34,41 +62,42 @@ impl XlsxWriter {
             .collect();
 
         // Write [Content_Types].xml
-        Self::write_content_types(&mut zip, workbook, &sheets_with_comments)?;
+        Self::write_content_types(&mut zip, file_options, workbook, &sheets_with_comments)?;
 
         // Write _rels/.rels
-        Self::write_root_rels(&mut zip)?;
+        Self::write_root_rels(&mut zip, file_options)?;
 
         // Write xl/workbook.xml
-        Self::write_workbook_xml(&mut zip, workbook)?;
+        Self::write_workbook_xml(&mut zip, file_options, workbook)?;
 
         // Write xl/_rels/workbook.xml.rels
-        Self::write_workbook_rels(&mut zip, workbook)?;
+        Self::write_workbook_rels(&mut zip, file_options, workbook)?;
 
         // Write xl/styles.xml
-        Self::write_styles_xml(&mut zip, &style_table)?;
+        Self::write_styles_xml(&mut zip, file_options, &style_table)?;
 
         // Write worksheets and their relationships
         for (i, sheet) in workbook.worksheets().enumerate() {
-            Self::write_worksheet(&mut zip, workbook, i, &style_table)?;
+            Self::write_worksheet(&mut zip, file_options, workbook, i, &style_table)?;
 
             // Write worksheet relationships if sheet has comments
             if sheet.comment_count() > 0 {
-                Self::write_worksheet_rels(&mut zip, i)?;
-                Self::write_comments(&mut zip, workbook, i)?;
+                Self::write_worksheet_rels(&mut zip, file_options, i)?;
+                Self::write_comments(&mut zip, file_options, workbook, i)?;
             }
         }
 
-        zip.finish()?;
+        // Flush explicitly: a buffered writer would swallow errors on drop
+        zip.finish()?.flush()?;
         Ok(())
     }
 
     fn write_content_types<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         workbook: &Workbook,
         sheets_with_comments: &[usize],
     ) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file("[Content_Types].xml", options)?;
 
         let mut content = String::from(
@@ -104,8 +133,10 @@ impl XlsxWriter {
         Ok(())
     }
 
-    fn write_root_rels<W: Write + Seek>(zip: &mut zip::ZipWriter<W>) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
+    fn write_root_rels<W: Write + Seek>(
+        zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
+    ) -> XlsxResult<()> {
         zip.start_file("_rels/.rels", options)?;
 
         let content = r#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -119,9 +150,9 @@ impl XlsxWriter {
 
     fn write_workbook_xml<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         workbook: &Workbook,
     ) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file("xl/workbook.xml", options)?;
 
         let mut content = String::from(
@@ -152,9 +183,9 @@ impl XlsxWriter {
 
     fn write_workbook_rels<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         workbook: &Workbook,
     ) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file("xl/_rels/workbook.xml.rels", options)?;
 
         let mut content = String::from(
@@ -190,9 +221,9 @@ impl XlsxWriter {
 
     fn write_styles_xml<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         style_table: &XlsxStyleTable,
     ) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file("xl/styles.xml", options)?;
         let xml = style_table.to_styles_xml();
         zip.write_all(xml.as_bytes())?;
@@ -201,11 +232,11 @@ impl XlsxWriter {
 
     fn write_worksheet<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         workbook: &Workbook,
         index: usize,
         style_table: &XlsxStyleTable,
     ) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file(&format!("xl/worksheets/sheet{}.xml", index + 1), options)?;
 
         let sheet = workbook
@@ -248,7 +279,9 @@ impl XlsxWriter {
 
         content.push_str("\n    <sheetData>");
 
-        // Write cell data (sparse, row-major)
+        // Write cell data (sparse, row-major). Cells are serialized straight
+        // into `content` rather than through per-cell `format!` strings.
+        let custom_heights = sheet.custom_row_heights();
         let mut current_row: Option<u32> = None;
         let mut written_rows: std::collections::HashSet<u32> = Default::default();
         for (row, col, cell) in sheet.iter_cells() {
@@ -256,91 +289,75 @@ impl XlsxWriter {
                 // Close previous row
                 if current_row.is_some() {
                     content.push_str("\n        </row>");
+                    // Stream completed rows into the zip entry so large sheets
+                    // are never held in memory as one string
+                    if content.len() >= FLUSH_THRESHOLD {
+                        zip.write_all(content.as_bytes())?;
+                        content.clear();
+                    }
                 }
                 // Open new row with optional dimension attributes
-                let mut row_tag = format!("\n        <row r=\"{}\"", row + 1);
-                let custom_heights = sheet.custom_row_heights();
+                let _ = write!(content, "\n        <row r=\"{}\"", row + 1);
                 if let Some(&ht) = custom_heights.get(&row) {
-                    row_tag.push_str(&format!(" ht=\"{:.2}\" customHeight=\"1\"", ht));
+                    let _ = write!(content, " ht=\"{:.2}\" customHeight=\"1\"", ht);
                 }
                 if sheet.is_row_hidden(row) {
-                    row_tag.push_str(" hidden=\"1\"");
+                    content.push_str(" hidden=\"1\"");
                 }
-                row_tag.push('>');
-                content.push_str(&row_tag);
+                content.push('>');
                 current_row = Some(row);
                 written_rows.insert(row);
             }
 
-            let addr = duke_sheets_core::CellAddress::new(row, col);
-            let cell_ref = addr.to_a1_string();
-
             let xf_id = style_table.xf_id_for(index, cell.style_index);
-            let style_attr = if xf_id != 0 {
-                format!(" s=\"{}\"", xf_id)
-            } else {
-                String::new()
+            let type_attr = match &cell.value {
+                duke_sheets_core::CellValue::String(_) => " t=\"inlineStr\"",
+                duke_sheets_core::CellValue::Boolean(_) => " t=\"b\"",
+                duke_sheets_core::CellValue::Error(_) => " t=\"e\"",
+                // Preserve style-only cells
+                duke_sheets_core::CellValue::Empty if xf_id != 0 => "",
+                // SpillTarget cells are not written to the file - they are computed
+                // at runtime from the source formula's array result.
+                // In Excel's file format, dynamic array formulas use a special
+                // mechanism, but for simplicity we skip spill targets during write.
+                duke_sheets_core::CellValue::Empty
+                | duke_sheets_core::CellValue::SpillTarget { .. } => continue,
+                _ => "",
             };
 
+            let _ = write!(
+                content,
+                "\n            <c r=\"{}\"",
+                CellAddress::new(row, col)
+            );
+            if xf_id != 0 {
+                let _ = write!(content, " s=\"{}\"", xf_id);
+            }
+            content.push_str(type_attr);
+
             match &cell.value {
                 duke_sheets_core::CellValue::Number(n) => {
-                    content.push_str(&format!(
-                        "\n            <c r=\"{}\"{}><v>{}</v></c>",
-                        cell_ref, style_attr, n
-                    ));
+                    let _ = write!(content, "><v>{}</v></c>", n);
                 }
                 duke_sheets_core::CellValue::String(s) => {
-                    content.push_str(&format!(
-                        "\n            <c r=\"{}\"{} t=\"inlineStr\"><is><t>{}</t></is></c>",
-                        cell_ref,
-                        style_attr,
-                        Self::escape_xml(s.as_str())
-                    ));
+                    content.push_str("><is><t>");
+                    Self::push_escaped_xml(&mut content, s.as_str());
+                    content.push_str("</t></is></c>");
                 }
                 duke_sheets_core::CellValue::Boolean(b) => {
-                    content.push_str(&format!(
-                        "\n            <c r=\"{}\"{} t=\"b\"><v>{}</v></c>",
-                        cell_ref,
-                        style_attr,
-                        if *b { 1 } else { 0 }
-                    ));
+                    content.push_str(if *b { "><v>1</v></c>" } else { "><v>0</v></c>" });
                 }
                 duke_sheets_core::CellValue::Formula { text, .. } => {
-                    let formula_text = if text.starts_with('=') {
-                        &text[1..]
-                    } else {
-                        text.as_str()
-                    };
-                    content.push_str(&format!(
-                        "\n            <c r=\"{}\"{}><f>{}</f></c>",
-                        cell_ref,
-                        style_attr,
-                        Self::escape_xml(formula_text)
-                    ));
+                    content.push_str("><f>");
+                    Self::push_escaped_xml(&mut content, text.strip_prefix('=').unwrap_or(text));
+                    content.push_str("</f></c>");
                 }
                 duke_sheets_core::CellValue::Error(e) => {
-                    content.push_str(&format!(
-                        "\n            <c r=\"{}\"{} t=\"e\"><v>{}</v></c>",
-                        cell_ref,
-                        style_attr,
-                        Self::escape_xml(e.as_str())
-                    ));
-                }
-                duke_sheets_core::CellValue::Empty => {
-                    // Preserve style-only cells
-                    if xf_id != 0 {
-                        content.push_str(&format!(
-                            "\n            <c r=\"{}\"{} />",
-                            cell_ref, style_attr
-                        ));
-                    }
-                }
-                duke_sheets_core::CellValue::SpillTarget { .. } => {
-                    // SpillTarget cells are not written to the file - they are computed
-                    // at runtime from the source formula's array result.
-                    // In Excel's file format, dynamic array formulas use a special
-                    // mechanism, but for simplicity we skip spill targets during write.
+                    content.push_str("><v>");
+                    Self::push_escaped_xml(&mut content, e.as_str());
+                    content.push_str("</v></c>");
                 }
+                _ => content.push_str(" />"),
             }
         }
 
@@ -350,7 +367,6 @@ impl XlsxWriter {
 
         // Write empty rows that have custom heights or are hidden but had no cells
         {
-            let custom_heights = sheet.custom_row_heights();
             let hidden_rows = sheet.hidden_rows();
             let mut empty_dim_rows: std::collections::BTreeSet<u32> = Default::default();
             for &row in custom_heights.keys() {
@@ -695,151 +711,124 @@ impl XlsxWriter {
             return;
         }
 
-        content.push_str(&format!(
+        let _ = write!(
+            content,
             "\n    <dataValidations count=\"{}\">",
             validations.len()
-        ));
+        );
 
+        // Attributes and formulas are written straight into `content`; a
+        // sheet can carry many validations and none needs its own strings.
         for validation in validations {
             if validation.ranges.is_empty() {
                 continue;
             }
 
-            // Build sqref from ranges
-            let sqref: String = validation
-                .ranges
-                .iter()
-                .map(|r| r.to_string())
-                .collect::<Vec<_>>()
-                .join(" ");
-
-            let type_attr = match &validation.validation_type {
-                ValidationType::None => String::new(),
-                _ => format!(" type=\"{}\"", validation.validation_type.xlsx_type()),
-            };
+            content.push_str("\n        <dataValidation");
+            if !matches!(validation.validation_type, ValidationType::None) {
+                let _ = write!(
+                    content,
+                    " type=\"{}\"",
+                    validation.validation_type.xlsx_type()
+                );
+            }
 
-            let operator_attr = match &validation.validation_type {
+            match &validation.validation_type {
                 ValidationType::Whole { operator, .. }
                 | ValidationType::Decimal { operator, .. }
                 | ValidationType::Date { operator, .. }
                 | ValidationType::Time { operator, .. }
                 | ValidationType::TextLength { operator, .. } => {
-                    format!(" operator=\"{}\"", operator.xlsx_operator())
+                    let _ = write!(content, " operator=\"{}\"", operator.xlsx_operator());
                 }
-                _ => String::new(),
-            };
+                _ => {}
+            }
 
-            let allow_blank = if validation.allow_blank {
-                " allowBlank=\"1\""
-            } else {
-                ""
-            };
-            let show_dropdown = if !validation.show_dropdown {
-                " showDropDown=\"1\""
-            } else {
-                ""
-            };
-            let show_input = if validation.show_input_message {
-                " showInputMessage=\"1\""
-            } else {
-                ""
-            };
-            let show_error = if validation.show_error_alert {
-                " showErrorMessage=\"1\""
-            } else {
-                ""
-            };
+            if validation.allow_blank {
+                content.push_str(" allowBlank=\"1\"");
+            }
+            if !validation.show_dropdown {
+                content.push_str(" showDropDown=\"1\"");
+            }
+            if validation.show_input_message {
+                content.push_str(" showInputMessage=\"1\"");
+            }
+            if validation.show_error_alert {
+                content.push_str(" showErrorMessage=\"1\"");
+            }
 
-            let error_style = match validation.error_style {
+            content.push_str(match validation.error_style {
                 duke_sheets_core::ValidationErrorStyle::Stop => "",
                 duke_sheets_core::ValidationErrorStyle::Warning => " errorStyle=\"warning\"",
                 duke_sheets_core::ValidationErrorStyle::Information => {
                     " errorStyle=\"information\""
                 }
-            };
-
-            let error_title = validation.error_title.as_ref().map_or(String::new(), |t| {
-                format!(" errorTitle=\"{}\"", Self::escape_xml(t))
-            });
-            let error_msg = validation
-                .error_message
-                .as_ref()
-                .map_or(String::new(), |m| {
-                    format!(" error=\"{}\"", Self::escape_xml(m))
-                });
-            let prompt_title = validation.input_title.as_ref().map_or(String::new(), |t| {
-                format!(" promptTitle=\"{}\"", Self::escape_xml(t))
             });
-            let prompt_msg = validation
-                .input_message
-                .as_ref()
-                .map_or(String::new(), |m| {
-                    format!(" prompt=\"{}\"", Self::escape_xml(m))
-                });
 
-            content.push_str(&format!(
-                "\n        <dataValidation{}{}{}{}{}{}{}{}{}{}{} sqref=\"{}\">",
-                type_attr,
-                operator_attr,
-                allow_blank,
-                show_dropdown,
-                show_input,
-                show_error,
-                error_style,
-                error_title,
-                error_msg,
-                prompt_title,
-                prompt_msg,
-                sqref
-            ));
+            let texts = [
+                (" errorTitle=\"", &validation.error_title),
+                (" error=\"", &validation.error_message),
+                (" promptTitle=\"", &validation.input_title),
+                (" prompt=\"", &validation.input_message),
+            ];
+            for (attr, text) in texts {
+                if let Some(text) = text {
+                    content.push_str(attr);
+                    Self::push_escaped_xml(content, text);
+                    content.push('"');
+                }
+            }
+
+            // sqref is the space-separated list of ranges
+            content.push_str(" sqref=\"");
+            for (i, range) in validation.ranges.iter().enumerate() {
+                if i > 0 {
+                    content.push(' ');
+                }
+                let _ = write!(content, "{}", range);
+            }
+            content.push_str("\">");
 
             // Write formulas based on validation type
             match &validation.validation_type {
                 ValidationType::List { source } => {
                     // List source: either a range or comma-separated values
-                    let formula = if source.starts_with('=') {
-                        source[1..].to_string()
+                    content.push_str("\n            <formula1>");
+                    if let Some(range) = source.strip_prefix('=') {
+                        Self::push_escaped_xml(content, range);
                     } else if source.contains('!')
                         || source
                             .chars()
                             .all(|c| c.is_ascii_alphanumeric() || c == '$' || c == ':')
                     {
-                        source.clone()
+                        Self::push_escaped_xml(content, source);
                     } else {
                         // Inline list - wrap in quotes
-                        format!("\"{}\"", source)
-                    };
-                    content.push_str(&format!(
-                        "\n            <formula1>{}</formula1>",
-                        Self::escape_xml(&formula)
-                    ));
+                        content.push_str("&quot;");
+                        Self::push_escaped_xml(content, source);
+                        content.push_str("&quot;");
+                    }
+                    content.push_str("</formula1>");
                 }
                 ValidationType::Whole { value1, value2, .. }
                 | ValidationType::Decimal { value1, value2, .. }
                 | ValidationType::Date { value1, value2, .. }
                 | ValidationType::Time { value1, value2, .. }
                 | ValidationType::TextLength { value1, value2, .. } => {
-                    content.push_str(&format!(
-                        "\n            <formula1>{}</formula1>",
-                        Self::escape_xml(value1)
-                    ));
+                    content.push_str("\n            <formula1>");
+                    Self::push_escaped_xml(content, value1);
+                    content.push_str("</formula1>");
                     if let Some(v2) = value2 {
-                        content.push_str(&format!(
-                            "\n            <formula2>{}</formula2>",
-                            Self::escape_xml(v2)
-                        ));
+                        content.push_str("\n            <formula2>");
+                        Self::push_escaped_xml(content, v2);
+                        content.push_str("</formula2>");
                     }
                 }
                 ValidationType::Custom { formula } => {
-                    let formula = if formula.starts_with('=') {
-                        &formula[1..]
-                    } else {
-                        formula
-                    };
-                    content.push_str(&format!(
-                        "\n            <formula1>{}</formula1>",
-                        Self::escape_xml(formula)
-                    ));
+                    let formula = formula.strip_prefix('=').unwrap_or(formula);
+                    content.push_str("\n            <formula1>");
+                    Self::push_escaped_xml(content, formula);
+                    content.push_str("</formula1>");
                 }
                 ValidationType::None => {}
             }
@@ -851,19 +840,34 @@ impl XlsxWriter {
     }
 
     fn escape_xml(s: &str) -> String {
-        s.replace('&', "&amp;")
-            .replace('<', "&lt;")
-            .replace('>', "&gt;")
-            .replace('"', "&quot;")
-            .replace('\'', "&apos;")
+        let mut escaped = String::with_capacity(s.len());
+        Self::push_escaped_xml(&mut escaped, s);
+        escaped
+    }
+
+    /// Append `s` to `out` with XML special characters escaped, in one pass
+    fn push_escaped_xml(out: &mut String, s: &str) {
+        let mut rest = s;
+        while let Some(pos) = rest.find(['&', '<', '>', '"', '\'']) {
+            out.push_str(&rest[..pos]);
+            out.push_str(match rest.as_bytes()[pos] {
+                b'&' => "&amp;",
+                b'<' => "&lt;",
+                b'>' => "&gt;",
+                b'"' => "&quot;",
+                _ => "&apos;",
+            });
+            rest = &rest[pos + 1..];
+        }
+        out.push_str(rest);
     }
 
     /// Write worksheet relationships file (for comments, drawings, etc.)
     fn write_worksheet_rels<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         sheet_index: usize,
     ) -> XlsxResult<()> {
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file(
             &format!("xl/worksheets/_rels/sheet{}.xml.rels", sheet_index + 1),
             options,
@@ -884,6 +888,7 @@ impl XlsxWriter {
     /// Write comments file for a worksheet
     fn write_comments<W: Write + Seek>(
         zip: &mut zip::ZipWriter<W>,
+        options: zip::write::SimpleFileOptions,
         workbook: &Workbook,
         sheet_index: usize,
     ) -> XlsxResult<()> {
@@ -895,7 +900,6 @@ impl XlsxWriter {
             return Ok(());
         }
 
-        let options = zip::write::SimpleFileOptions::default();
         zip.start_file(&format!("xl/comments{}.xml", sheet_index + 1), options)?;
 
         let mut content = String::from(
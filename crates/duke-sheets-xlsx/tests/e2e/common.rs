@@ -1,17 +1,19 @@
 //! Common utilities for E2E tests.
 //!
-//! Provides a global LibreOffice connection singleton (mutex-protected) and a
-//! shared tokio runtime. Each test creates fixtures on-demand: acquires the
-//! lock, builds the spreadsheet it needs, saves to a temp file under the shared
-//! Docker volume, reads it back with `XlsxReader`, asserts, and cleans up.
+//! Provides a global pool of LibreOffice connections (each mutex-protected)
+//! and a shared tokio runtime. Each test creates fixtures on-demand: acquires
+//! a connection, builds the spreadsheet it needs, saves to a temp file under
+//! the shared Docker volume, reads it back with `XlsxReader`, asserts, and
+//! cleans up. Fixtures are independent, so tests running on different
+//! connections build theirs concurrently.
 
 use std::path::PathBuf;
-use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
 use std::sync::OnceLock;
 
 use duke_sheets_libreoffice::bridge::LibreOfficeBridge;
 use tokio::runtime::Runtime;
-use tokio::sync::Mutex;
+use tokio::sync::{Mutex, OnceCell};
 
 /// Shared Docker volume path — accessible from both the host and the
 /// LibreOffice Docker container.
@@ -21,33 +23,84 @@ const SHARED_DIR: &str = "/tmp/duke-sheets-urp";
 /// connection to LibreOffice outlives any individual test.
 static RUNTIME: OnceLock<Runtime> = OnceLock::new();
 
-/// Global LO bridge, initialized once and shared across all tests.
-/// Protected by a tokio Mutex so only one test talks to LO at a time.
-static LO_BRIDGE: OnceLock<Mutex<LibreOfficeBridge>> = OnceLock::new();
+/// Global pool of LO bridges, connected once and shared across all tests.
+/// Each is protected by a tokio Mutex so only one test talks to it at a time.
+static LO_BRIDGES: OnceCell<Vec<Mutex<LibreOfficeBridge>>> = OnceCell::const_new();
+
+/// Round-robin cursor into `LO_BRIDGES`.
+static NEXT_BRIDGE: AtomicUsize = AtomicUsize::new(0);
+
+/// Result of the one-time reachability probe in `lo_available`.
+static LO_AVAILABLE: OnceLock<bool> = OnceLock::new();
 
 /// Counter for generating unique temp file names.
 static FILE_COUNTER: AtomicU64 = AtomicU64::new(0);
 
 /// Check if LibreOffice URP is reachable on localhost:2002.
+///
+/// Probed once per test binary; every test calls this (and `lo_bridge`)
+/// so it must not open a socket each time.
 pub fn lo_available() -> bool {
-    std::net::TcpStream::connect_timeout(
-        &"127.0.0.1:2002".parse().unwrap(),
-        std::time::Duration::from_secs(2),
-    )
-    .is_ok()
+    *LO_AVAILABLE.get_or_init(|| {
+        std::net::TcpStream::connect_timeout(
+            &std::net::SocketAddr::from(([127, 0, 0, 1], lo_ports()[0])),
+            std::time::Duration::from_secs(2),
+        )
+        .is_ok()
+    })
+}
+
+/// URP ports of the LibreOffice instances to spread connections over.
+///
+/// A single soffice process serializes most document work internally, so
+/// extra connections to it only overlap the socket round-trips. Set
+/// `DUKE_SHEETS_LO_PORTS` to a comma-separated list (e.g. `2002,2003,2004`)
+/// of instances sharing the same volume to build fixtures truly in parallel.
+/// The first port is the one probed by `lo_available`.
+fn lo_ports() -> Vec<u16> {
+    let ports: Vec<u16> = std::env::var("DUKE_SHEETS_LO_PORTS")
+        .ok()
+        .map(|v| v.split(',').filter_map(|p| p.trim().parse().ok()).collect())
+        .unwrap_or_default();
+    if ports.is_empty() {
+        vec![2002]
+    } else {
+        ports
+    }
+}
+
+/// Number of LibreOffice connections to open.
+///
+/// Defaults to the available parallelism (capped at 4), and at least one
+/// per instance in `lo_ports`; override with `DUKE_SHEETS_LO_CONNECTIONS`,
+/// e.g. `1` to serialize all fixtures.
+fn pool_size() -> usize {
+    std::env::var("DUKE_SHEETS_LO_CONNECTIONS")
+        .ok()
+        .and_then(|v| v.parse().ok())
+        .unwrap_or_else(|| {
+            std::thread::available_parallelism()
+                .map_or(1, |n| n.get())
+                .min(4)
+                .max(lo_ports().len())
+        })
+        .max(1)
 }
 
 /// Get the shared tokio runtime.
+///
+/// Multi-threaded so that tests blocking on it from different test threads
+/// make progress at the same time.
 pub fn runtime() -> &'static Runtime {
     RUNTIME.get_or_init(|| {
-        tokio::runtime::Builder::new_current_thread()
+        tokio::runtime::Builder::new_multi_thread()
             .enable_all()
             .build()
             .expect("Failed to create tokio runtime")
     })
 }
 
-/// Get the global LibreOffice bridge, connecting on first call.
+/// Get a LibreOffice bridge from the global pool, connecting on first call.
 ///
 /// Returns `None` if LibreOffice is not available (test should skip).
 /// Must be called from within the shared `runtime()`.
@@ -56,18 +109,31 @@ pub async fn lo_bridge() -> Option<&'static Mutex<LibreOfficeBridge>> {
         return None;
     }
 
-    // Ensure the shared directory exists
-    let _ = std::fs::create_dir_all(SHARED_DIR);
-
     // Initialize if needed
-    if LO_BRIDGE.get().is_none() {
-        let bridge = LibreOfficeBridge::connect("127.0.0.1", 2002)
-            .await
-            .expect("Failed to connect to LibreOffice on localhost:2002");
-        let _ = LO_BRIDGE.set(Mutex::new(bridge));
-    }
-
-    LO_BRIDGE.get()
+    let bridges = LO_BRIDGES
+        .get_or_init(|| async {
+            // Ensure the shared directory exists
+            let _ = std::fs::create_dir_all(SHARED_DIR);
+
+            let ports = lo_ports();
+            let mut bridges = Vec::new();
+            for i in 0..pool_size() {
+                let port = ports[i % ports.len()];
+                let bridge = LibreOfficeBridge::connect("127.0.0.1", port)
+                    .await
+                    .unwrap_or_else(|e| {
+                        panic!("Failed to connect to LibreOffice on localhost:{port}: {e}")
+                    });
+                bridges.push(Mutex::new(bridge));
+            }
+            bridges
+        })
+        .await;
+
+    // Prefer an idle connection, otherwise queue on the next one in turn
+    let idle = bridges.iter().find(|b| b.try_lock().is_ok());
+    let next = NEXT_BRIDGE.fetch_add(1, Ordering::Relaxed) % bridges.len();
+    Some(idle.unwrap_or(&bridges[next]))
 }
 
 /// Generate a unique temp file path under the shared Docker volume.
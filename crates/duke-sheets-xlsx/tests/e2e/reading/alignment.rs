@@ -68,7 +68,6 @@ fn test_vertical_bottom() {
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
         wb.set_cell_value("A1", "Bottom").await.unwrap();
-        wb.set_row_height(0, 0, 40.0).await.unwrap();
         let spec = duke_sheets_libreoffice::StyleSpec {
             vertical: Some("bottom".to_string()),
             ..Default::default()
@@ -152,7 +151,6 @@ fn test_rotation() {
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
         wb.set_cell_value("A1", "Rotated 45").await.unwrap();
-        wb.set_row_height(0, 0, 60.0).await.unwrap();
         let spec = duke_sheets_libreoffice::StyleSpec {
             rotation: 45,
             ..Default::default()
@@ -141,12 +141,10 @@ fn test_border_on_range() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        for row in 0..3 {
-            for col in 0..3 {
-                let cell = format!("{}{}", (b'A' + col as u8) as char, row + 1);
-                wb.set_cell_value(&cell, (row * 3 + col + 1) as f64).await.unwrap();
-            }
-        }
+        let rows: Vec<Vec<f64>> = (0..3)
+            .map(|row| (0..3).map(|col| (row * 3 + col + 1) as f64).collect())
+            .collect();
+        wb.set_range_numbers(0, "A1", &rows).await.unwrap();
         let spec = duke_sheets_libreoffice::StyleSpec {
             border_style: Some("medium".to_string()),
             border_color: Some(0x000000),
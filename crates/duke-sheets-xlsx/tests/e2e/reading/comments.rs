@@ -93,12 +93,15 @@ fn test_multiple_comments() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", "Comment 1").await.unwrap();
-        wb.add_comment(0, "A1", "First comment", None).await.unwrap();
-        wb.set_cell_value("A2", "Comment 2").await.unwrap();
-        wb.add_comment(0, "A2", "Second comment", None).await.unwrap();
-        wb.set_cell_value("A3", "Comment 3").await.unwrap();
-        wb.add_comment(0, "A3", "Third comment", None).await.unwrap();
+        wb.set_column_values(0, "A1", ["Comment 1", "Comment 2", "Comment 3"])
+            .await
+            .unwrap();
+        let comments = [
+            ("A1", "First comment"),
+            ("A2", "Second comment"),
+            ("A3", "Third comment"),
+        ];
+        wb.add_comments(0, &comments).await.unwrap();
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
@@ -2,9 +2,12 @@
 //! Includes DXF (differential format) style tests.
 
 use crate::{cleanup_fixture, lo_bridge, runtime, skip_if_no_lo, temp_fixture_path};
-use duke_sheets_core::{FillStyle, HorizontalAlignment, NumberFormat};
+use duke_sheets_core::{ConditionalFormatRule, FillStyle, HorizontalAlignment, NumberFormat, Style};
 use duke_sheets_xlsx::XlsxReader;
 
+/// Values written to B1:B5 by the conditional format fixtures.
+const CF_VALUES: [f64; 5] = [10.0, 30.0, 50.0, 70.0, 90.0];
+
 /// Helper: create a workbook with values in B1:B5 and a conditional format rule.
 async fn create_cf_fixture(
     path: &std::path::Path,
@@ -16,10 +19,7 @@ async fn create_cf_fixture(
     let mut b = lo.lock().await;
     let mut wb = b.create_workbook().await.unwrap();
 
-    for (i, val) in [10.0, 30.0, 50.0, 70.0, 90.0].iter().enumerate() {
-        let cell = format!("B{}", i + 1);
-        wb.set_cell_value(&cell, *val).await.unwrap();
-    }
+    wb.set_column_values(0, "B1", CF_VALUES).await.unwrap();
 
     let style_name = format!("CF_{}", path.file_stem().unwrap().to_str().unwrap());
     wb.add_conditional_format(0, "B1:B5", operator, formula, &style_name, style)
@@ -30,106 +30,70 @@ async fn create_cf_fixture(
     wb.close().await.unwrap();
 }
 
-#[test]
-fn test_cell_is_greater_than() {
-    skip_if_no_lo!();
+/// Helper: build the B1:B5 fixture with a single `greaterThan 50` rule in
+/// `style`, read it back and return the sheet's conditional format rules.
+fn read_cf_rules(style: &duke_sheets_libreoffice::StyleSpec) -> Vec<ConditionalFormatRule> {
     let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let style = duke_sheets_libreoffice::StyleSpec {
-            fill_color: Some(0x00FF00),
-            bold: true,
-            ..Default::default()
-        };
-        create_cf_fixture(&path, "greaterThan", "50", &style).await;
-    });
+    runtime().block_on(create_cf_fixture(&path, "greaterThan", "50", style));
 
     let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let rules = sheet.conditional_formats();
+    cleanup_fixture(&path);
+    let rules = workbook.worksheet(0).unwrap().conditional_formats().to_vec();
     assert!(!rules.is_empty(), "Should have at least one CF rule");
+    rules
+}
+
+/// Helper: the DXF format of the first rule read back by `read_cf_rules`.
+fn read_dxf_format(style: &duke_sheets_libreoffice::StyleSpec) -> Style {
+    let rules = read_cf_rules(style);
+    rules[0].format.clone().expect("Rule should have a DXF format")
+}
+
+#[test]
+fn test_cell_is_greater_than() {
+    skip_if_no_lo!();
+    let rules = read_cf_rules(&duke_sheets_libreoffice::StyleSpec {
+        fill_color: Some(0x00FF00),
+        bold: true,
+        ..Default::default()
+    });
 
     let has_cell_is = rules
         .iter()
         .any(|r| matches!(&r.rule_type, duke_sheets_core::CfRuleType::CellIs { .. }));
     assert!(has_cell_is, "Should have a CellIs rule");
-
-    cleanup_fixture(&path);
 }
 
 #[test]
 fn test_cf_dxf_bold_font() {
     skip_if_no_lo!();
-    let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let style = duke_sheets_libreoffice::StyleSpec {
-            bold: true,
-            ..Default::default()
-        };
-        create_cf_fixture(&path, "greaterThan", "50", &style).await;
+    let format = read_dxf_format(&duke_sheets_libreoffice::StyleSpec {
+        bold: true,
+        ..Default::default()
     });
-
-    let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let rules = sheet.conditional_formats();
-    assert!(!rules.is_empty());
-
-    let rule = &rules[0];
-    let format = rule.format.as_ref().expect("Rule should have a DXF format");
     assert!(format.font.bold, "DXF font should be bold");
-
-    cleanup_fixture(&path);
 }
 
 #[test]
 fn test_cf_dxf_fill() {
     skip_if_no_lo!();
-    let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let style = duke_sheets_libreoffice::StyleSpec {
-            fill_color: Some(0x00FF00),
-            ..Default::default()
-        };
-        create_cf_fixture(&path, "greaterThan", "50", &style).await;
+    let format = read_dxf_format(&duke_sheets_libreoffice::StyleSpec {
+        fill_color: Some(0x00FF00),
+        ..Default::default()
     });
-
-    let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let rules = sheet.conditional_formats();
-    assert!(!rules.is_empty());
-
-    let format = rules[0].format.as_ref().expect("Rule should have a DXF format");
     assert!(format.fill != FillStyle::None, "DXF should have non-None fill");
-
-    cleanup_fixture(&path);
 }
 
 #[test]
 fn test_cf_dxf_alignment() {
     skip_if_no_lo!();
-    let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let style = duke_sheets_libreoffice::StyleSpec {
-            horizontal: Some("center".to_string()),
-            wrap_text: true,
-            ..Default::default()
-        };
-        create_cf_fixture(&path, "greaterThan", "50", &style).await;
+    let format = read_dxf_format(&duke_sheets_libreoffice::StyleSpec {
+        horizontal: Some("center".to_string()),
+        wrap_text: true,
+        ..Default::default()
     });
-
-    let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let rules = sheet.conditional_formats();
-    assert!(!rules.is_empty());
-
-    let format = rules[0].format.as_ref().expect("Rule should have a DXF format");
     assert_eq!(format.alignment.horizontal, HorizontalAlignment::Center);
     assert!(format.alignment.wrap_text, "DXF should have wrap_text");
-
-    cleanup_fixture(&path);
 }
 
 #[test]
@@ -142,10 +106,9 @@ fn test_cf_dxf_number_format() {
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
 
-        for (i, val) in [0.1, 0.3, 0.5, 0.7, 0.9].iter().enumerate() {
-            let cell = format!("A{}", i + 1);
-            wb.set_cell_value(&cell, *val).await.unwrap();
-        }
+        wb.set_column_values(0, "A1", [0.1, 0.3, 0.5, 0.7, 0.9])
+            .await
+            .unwrap();
 
         let style = duke_sheets_libreoffice::StyleSpec {
             number_format: Some("0.00%".to_string()),
@@ -173,30 +136,16 @@ fn test_cf_dxf_number_format() {
 #[test]
 fn test_cf_dxf_border() {
     skip_if_no_lo!();
-    let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let style = duke_sheets_libreoffice::StyleSpec {
-            border_style: Some("thin".to_string()),
-            border_color: Some(0x0000FF),
-            ..Default::default()
-        };
-        create_cf_fixture(&path, "greaterThan", "50", &style).await;
+    let format = read_dxf_format(&duke_sheets_libreoffice::StyleSpec {
+        border_style: Some("thin".to_string()),
+        border_color: Some(0x0000FF),
+        ..Default::default()
     });
-
-    let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let rules = sheet.conditional_formats();
-    assert!(!rules.is_empty());
-
-    let format = rules[0].format.as_ref().expect("Rule should have a DXF format");
     let has_edges = format.border.left.is_some()
         || format.border.right.is_some()
         || format.border.top.is_some()
         || format.border.bottom.is_some();
     assert!(has_edges, "DXF should have border edges");
-
-    cleanup_fixture(&path);
 }
 
 #[test]
@@ -209,24 +158,29 @@ fn test_cf_multiple_rules() {
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
 
-        for (i, val) in [10.0, 30.0, 50.0, 70.0, 90.0].iter().enumerate() {
-            let cell = format!("B{}", i + 1);
-            wb.set_cell_value(&cell, *val).await.unwrap();
-        }
-
-        let red_style = duke_sheets_libreoffice::StyleSpec {
-            fill_color: Some(0xFF0000),
-            ..Default::default()
-        };
-        wb.add_conditional_format(0, "B1:B5", "greaterThan", "70", "CF_Red", &red_style)
-            .await
-            .unwrap();
-
-        let green_style = duke_sheets_libreoffice::StyleSpec {
-            fill_color: Some(0x00FF00),
-            ..Default::default()
-        };
-        wb.add_conditional_format(0, "B1:B5", "lessThan", "30", "CF_Green", &green_style)
+        wb.set_column_values(0, "B1", CF_VALUES).await.unwrap();
+
+        let rules = [
+            duke_sheets_libreoffice::CfRuleSpec {
+                operator: "greaterThan".into(),
+                formula: "70".into(),
+                style_name: "CF_Red".into(),
+                style: duke_sheets_libreoffice::StyleSpec {
+                    fill_color: Some(0xFF0000),
+                    ..Default::default()
+                },
+            },
+            duke_sheets_libreoffice::CfRuleSpec {
+                operator: "lessThan".into(),
+                formula: "30".into(),
+                style_name: "CF_Green".into(),
+                style: duke_sheets_libreoffice::StyleSpec {
+                    fill_color: Some(0x00FF00),
+                    ..Default::default()
+                },
+            },
+        ];
+        wb.add_conditional_formats(0, "B1:B5", &rules)
             .await
             .unwrap();
 
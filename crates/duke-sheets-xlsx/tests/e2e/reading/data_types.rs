@@ -4,6 +4,7 @@
 //! file, reads it back with `XlsxReader`, and asserts.
 
 use crate::{cleanup_fixture, lo_bridge, runtime, skip_if_no_lo, temp_fixture_path};
+use duke_sheets_libreoffice::CellValue;
 use duke_sheets_xlsx::XlsxReader;
 
 #[test]
@@ -17,10 +18,9 @@ fn test_number_values() {
         let mut bridge = lo.lock().await;
         let mut wb = bridge.create_workbook().await.expect("create workbook");
 
-        wb.set_cell_value("A1", 42.0).await.unwrap();
-        wb.set_cell_value("A2", 3.14159).await.unwrap();
-        wb.set_cell_value("A3", -100.0).await.unwrap();
-        wb.set_cell_value("A4", 0.0).await.unwrap();
+        wb.set_column_values(0, "A1", [42.0, 3.14159, -100.0, 0.0])
+            .await
+            .unwrap();
 
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
@@ -75,9 +75,8 @@ fn test_string_values() {
         let mut bridge = lo.lock().await;
         let mut wb = bridge.create_workbook().await.expect("create workbook");
 
-        wb.set_cell_value("A1", "Hello").await.unwrap();
-        wb.set_cell_value("A2", "World with spaces").await.unwrap();
-        wb.set_cell_value("A3", "Unicode: \u{65e5}\u{672c}\u{8a9e}").await.unwrap();
+        let values = ["Hello", "World with spaces", "Unicode: \u{65e5}\u{672c}\u{8a9e}"];
+        wb.set_column_values(0, "A1", values).await.unwrap();
 
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
@@ -184,10 +183,13 @@ fn test_formula_values() {
         let mut bridge = lo.lock().await;
         let mut wb = bridge.create_workbook().await.expect("create workbook");
 
-        wb.set_cell_value("A1", 10.0).await.unwrap();
-        wb.set_cell_value("A2", 20.0).await.unwrap();
-        wb.set_cell_formula("A3", "=A1+A2").await.unwrap();
-        wb.set_cell_formula("A4", "=SUM(A1:A2)").await.unwrap();
+        let values = [
+            CellValue::Number(10.0),
+            CellValue::Number(20.0),
+            CellValue::Formula("=A1+A2".into()),
+            CellValue::Formula("=SUM(A1:A2)".into()),
+        ];
+        wb.set_column_values(0, "A1", values).await.unwrap();
 
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
@@ -205,6 +207,55 @@ fn test_formula_values() {
     cleanup_fixture(&path);
 }
 
+#[test]
+fn test_formula_block() {
+    skip_if_no_lo!();
+
+    let path = temp_fixture_path();
+
+    runtime().block_on(async {
+        let lo = lo_bridge().await.expect("LO should be available");
+        let mut bridge = lo.lock().await;
+        let mut wb = bridge.create_workbook().await.expect("create workbook");
+
+        // Results must still be stored when recalculation is deferred to save
+        wb.set_automatic_calculation(false).await.unwrap();
+        let rows = [
+            vec!["10", "=A1*2"],
+            vec!["20", "=A2*2"],
+            vec!["=A1+A2", "=SUM(B1:B2)"],
+        ];
+        wb.set_range_formulas(0, "A1", &rows).await.unwrap();
+
+        wb.save(path.to_str().unwrap()).await.unwrap();
+        wb.close().await.unwrap();
+    });
+
+    let workbook = XlsxReader::read_file(&path).expect("Failed to read workbook");
+    let sheet = workbook.worksheet(0).expect("No worksheet");
+
+    assert_eq!(sheet.get_value_at(0, 0).as_number(), Some(10.0));
+    assert!(
+        sheet.get_formula_at(0, 0).is_none(),
+        "A1 should be a constant"
+    );
+    for (row, col) in [(0, 1), (1, 1), (2, 0), (2, 1)] {
+        assert!(
+            sheet.get_formula_at(row, col).is_some(),
+            "({row}, {col}) should have a formula"
+        );
+    }
+    match sheet.get_value_at(2, 0) {
+        duke_sheets_core::CellValue::Formula {
+            cached_value: Some(v),
+            ..
+        } => assert_eq!(v.as_number(), Some(30.0)),
+        other => panic!("Expected A3 formula with a cached value, got {other:?}"),
+    }
+
+    cleanup_fixture(&path);
+}
+
 #[test]
 fn test_error_values() {
     skip_if_no_lo!();
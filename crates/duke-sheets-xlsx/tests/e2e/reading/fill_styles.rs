@@ -46,17 +46,16 @@ fn test_multiple_fill_colors() {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        for (row, (label, color)) in [("Red", 0xFF0000i32), ("Green", 0x00FF00), ("Blue", 0x0000FF)]
-            .iter()
-            .enumerate()
-        {
-            let cell = format!("A{}", row + 1);
-            wb.set_cell_value(&cell, *label).await.unwrap();
+        let fills = [("Red", 0xFF0000i32), ("Green", 0x00FF00), ("Blue", 0x0000FF)];
+        wb.set_column_values(0, "A1", fills.map(|(label, _)| label))
+            .await
+            .unwrap();
+        for (row, (_, color)) in (0..).zip(fills) {
             let spec = duke_sheets_libreoffice::StyleSpec {
-                fill_color: Some(*color),
+                fill_color: Some(color),
                 ..Default::default()
             };
-            wb.set_cell_style(0, &cell, &spec).await.unwrap();
+            wb.set_cell_style_at(0, 0, row, &spec).await.unwrap();
         }
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
@@ -2,121 +2,124 @@
 
 use crate::{cleanup_fixture, lo_bridge, runtime, skip_if_no_lo, temp_fixture_path};
 use duke_sheets_core::NumberFormat;
+use duke_sheets_libreoffice::StyleSpec;
 use duke_sheets_xlsx::XlsxReader;
 
-#[test]
-fn test_percentage_format() {
-    skip_if_no_lo!();
+/// Style that only sets a number format
+fn number_format(format: &str) -> StyleSpec {
+    StyleSpec {
+        number_format: Some(format.to_string()),
+        ..Default::default()
+    }
+}
+
+/// Helper: write `value` to A1 formatted with `format`, read it back and
+/// return A1's number format.
+fn read_number_format(value: f64, format: &str) -> NumberFormat {
     let path = temp_fixture_path();
 
     runtime().block_on(async {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", 0.1234).await.unwrap();
-        let spec = duke_sheets_libreoffice::StyleSpec {
-            number_format: Some("0.00%".to_string()),
-            ..Default::default()
-        };
-        wb.set_cell_style(0, "A1", &spec).await.unwrap();
+        wb.set_cell_value("A1", value).await.unwrap();
+        wb.set_cell_style(0, "A1", &number_format(format))
+            .await
+            .unwrap();
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
 
     let workbook = XlsxReader::read_file(&path).unwrap();
+    cleanup_fixture(&path);
     let sheet = workbook.worksheet(0).unwrap();
     let style = sheet.cell_style_at(0, 0).expect("A1 should have style");
-    let fmt = style.number_format.format_string();
-    assert!(fmt.contains('%'), "Number format should contain '%', got: {fmt}");
+    style.number_format.clone()
+}
 
-    cleanup_fixture(&path);
+#[test]
+fn test_percentage_format() {
+    skip_if_no_lo!();
+    let format = read_number_format(0.1234, "0.00%");
+    let fmt = format.format_string();
+    assert!(
+        fmt.contains('%'),
+        "Number format should contain '%', got: {fmt}"
+    );
 }
 
 #[test]
 fn test_currency_format() {
     skip_if_no_lo!();
-    let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let lo = lo_bridge().await.unwrap();
-        let mut b = lo.lock().await;
-        let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", 1234.56).await.unwrap();
-        let spec = duke_sheets_libreoffice::StyleSpec {
-            number_format: Some("\"$\"#,##0.00".to_string()),
-            ..Default::default()
-        };
-        wb.set_cell_style(0, "A1", &spec).await.unwrap();
-        wb.save(path.to_str().unwrap()).await.unwrap();
-        wb.close().await.unwrap();
-    });
-
-    let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let style = sheet.cell_style_at(0, 0).expect("A1 should have style");
+    let format = read_number_format(1234.56, "\"$\"#,##0.00");
     assert!(
-        style.number_format != NumberFormat::General,
+        format != NumberFormat::General,
         "Number format should not be General"
     );
-
-    cleanup_fixture(&path);
 }
 
 #[test]
 fn test_custom_decimal_format() {
     skip_if_no_lo!();
-    let path = temp_fixture_path();
-
-    runtime().block_on(async {
-        let lo = lo_bridge().await.unwrap();
-        let mut b = lo.lock().await;
-        let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", 1234.5678).await.unwrap();
-        let spec = duke_sheets_libreoffice::StyleSpec {
-            number_format: Some("#,##0.00".to_string()),
-            ..Default::default()
-        };
-        wb.set_cell_style(0, "A1", &spec).await.unwrap();
-        wb.save(path.to_str().unwrap()).await.unwrap();
-        wb.close().await.unwrap();
-    });
-
-    let workbook = XlsxReader::read_file(&path).unwrap();
-    let sheet = workbook.worksheet(0).unwrap();
-    let style = sheet.cell_style_at(0, 0).expect("A1 should have style");
-    assert!(style.number_format != NumberFormat::General, "Should not be General");
-    let fmt = style.number_format.format_string();
+    let format = read_number_format(1234.5678, "#,##0.00");
+    assert!(format != NumberFormat::General, "Should not be General");
+    let fmt = format.format_string();
     assert!(
         fmt.contains("#,##0") || fmt.contains("0.00"),
         "Format should be decimal, got: {fmt}"
     );
-
-    cleanup_fixture(&path);
 }
 
 #[test]
 fn test_date_format() {
+    skip_if_no_lo!();
+    let format = read_number_format(45366.0, "YYYY-MM-DD");
+    assert!(format != NumberFormat::General, "Should not be General");
+}
+
+#[test]
+fn test_number_format_table() {
     skip_if_no_lo!();
     let path = temp_fixture_path();
 
+    // (cell, value, format, fragment the format read back must contain)
+    const FORMATS: &[(&str, f64, &str, &str)] = &[
+        ("A1", 0.1234, "0.00%", "%"),
+        ("A2", 1234.5678, "#,##0.00", "0.00"),
+        ("A3", 12345.678, "0.00E+00", "E+"),
+        ("A4", 1234.56, "\"$\"#,##0.00", "$"),
+    ];
+
     runtime().block_on(async {
         let lo = lo_bridge().await.unwrap();
         let mut b = lo.lock().await;
         let mut wb = b.create_workbook().await.unwrap();
-        wb.set_cell_value("A1", 45366.0).await.unwrap();
-        let spec = duke_sheets_libreoffice::StyleSpec {
-            number_format: Some("YYYY-MM-DD".to_string()),
-            ..Default::default()
-        };
-        wb.set_cell_style(0, "A1", &spec).await.unwrap();
+        wb.set_column_values(0, "A1", FORMATS.iter().map(|&(_, value, _, _)| value))
+            .await
+            .unwrap();
+        let specs: Vec<_> = FORMATS
+            .iter()
+            .map(|&(_, _, format, _)| number_format(format))
+            .collect();
+        wb.set_cell_styles(0, FORMATS.iter().map(|&(cell, ..)| cell).zip(&specs))
+            .await
+            .unwrap();
         wb.save(path.to_str().unwrap()).await.unwrap();
         wb.close().await.unwrap();
     });
 
     let workbook = XlsxReader::read_file(&path).unwrap();
     let sheet = workbook.worksheet(0).unwrap();
-    let style = sheet.cell_style_at(0, 0).expect("A1 should have style");
-    assert!(style.number_format != NumberFormat::General, "Should not be General");
+    for (row, &(cell, _, _, fragment)) in (0..).zip(FORMATS) {
+        let style = sheet
+            .cell_style_at(row, 0)
+            .unwrap_or_else(|| panic!("{cell} should have style"));
+        let fmt = style.number_format.format_string();
+        assert!(
+            fmt.contains(fragment),
+            "{cell} format should contain {fragment:?}, got: {fmt}"
+        );
+    }
 
     cleanup_fixture(&path);
 }
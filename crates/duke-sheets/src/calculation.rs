@@ -3,6 +3,13 @@
 //! Provides workbook-level formula calculation with dependency tracking,
 //! circular reference detection, and support for volatile functions.
 //!
+//! By default every formula is re-evaluated. With
+//! [`CalculationOptions::force_full_calculation`] set to `false`, only
+//! formulas affected by cell edits since the last calculation are
+//! re-evaluated (plus volatile formulas). Structural changes such as adding,
+//! renaming or removing sheets or defined names still fall back to a full
+//! recalculation.
+//!
 //! # Example
 //!
 //! ```rust,ignore
@@ -21,13 +28,14 @@
 //! ```
 
 use crate::{
-    evaluate, parse_formula, CellValue, Error, EvaluationContext, FormulaExpr, FormulaValue,
-    Result, Workbook,
+    evaluate, CellValue, Error, EvaluationContext, FormulaExpr, FormulaValue, Result, Workbook,
 };
-use duke_sheets_formula::dependency::{CellKey, DependencyGraph};
+use duke_sheets_core::CellChanges;
+use duke_sheets_formula::dependency::{CellKey, CsrGraph, DependencyGraph};
 use duke_sheets_formula::functions::FunctionRegistry;
+use duke_sheets_formula::{parse_formula_cached, FormulaProgram};
 use std::collections::{HashMap, HashSet};
-use std::sync::OnceLock;
+use std::sync::{Arc, OnceLock};
 
 /// Global function registry for volatile function lookup
 static FUNCTION_REGISTRY: OnceLock<FunctionRegistry> = OnceLock::new();
@@ -45,7 +53,12 @@ pub struct CalculationOptions {
     pub max_iterations: u32,
     /// Maximum change threshold for convergence (default: 0.001)
     pub max_change: f64,
-    /// Force recalculation of all cells, even if not dirty
+    /// Force recalculation of all cells, even if not dirty (default: true)
+    ///
+    /// When `false`, only formulas that depend on cells edited since the last
+    /// calculation, and volatile formulas, are re-evaluated. This relies on
+    /// every edit going through the worksheet's cell setters; edits made
+    /// through raw mutable access fall back to a full recalculation.
     pub force_full_calculation: bool,
     /// Include volatile functions in calculation (NOW, TODAY, RAND, etc.)
     pub calculate_volatile: bool,
@@ -107,10 +120,14 @@ struct CalculationEngine {
     options: CalculationOptions,
     /// Dependency graph built from formulas
     dependency_graph: DependencyGraph,
-    /// Parsed formula ASTs, keyed by CellKey
-    parsed_formulas: HashMap<CellKey, FormulaExpr>,
+    /// Parsed formula ASTs, keyed by CellKey (shared across identical formulas)
+    parsed_formulas: HashMap<CellKey, Arc<FormulaExpr>>,
+    /// Compiled programs for arithmetic formulas (only when iterating cycles)
+    programs: HashMap<CellKey, FormulaProgram>,
     /// Set of volatile cells
     volatile_cells: HashSet<CellKey>,
+    /// Cells whose formulas use defined names (their precedents are not tracked)
+    name_cells: HashSet<CellKey>,
     /// Cells involved in circular references
     circular_cells: HashSet<CellKey>,
 }
@@ -121,7 +138,9 @@ impl CalculationEngine {
             options,
             dependency_graph: DependencyGraph::new(),
             parsed_formulas: HashMap::new(),
+            programs: HashMap::new(),
             volatile_cells: HashSet::new(),
+            name_cells: HashSet::new(),
             circular_cells: HashSet::new(),
         }
     }
@@ -134,28 +153,50 @@ impl CalculationEngine {
         self.collect_formulas(workbook, &mut stats)?;
 
         if stats.formula_count == 0 {
+            workbook.mark_calculated();
             return Ok(stats);
         }
 
-        // Phase 2: Detect circular references
-        self.detect_circular_references();
-        stats.circular_references = self.circular_cells.len();
-
-        // Phase 3: Get calculation order (topological sort)
+        // Phase 2 + 3: Get calculation order and detect circular references
         let calc_order = self.get_calculation_order();
+        stats.circular_references = self.circular_cells.len();
 
         // Phase 4: Calculate cells in order
         if self.circular_cells.is_empty() || !self.options.iterative {
             // Simple case: no circular references or iterative calculation disabled
-            self.calculate_cells_simple(workbook, &calc_order, &mut stats)?;
+            let dirty = self.dirty_cells(workbook);
+            let parse_errors = stats.errors;
+            self.calculate_cells_simple(workbook, &calc_order, dirty.as_ref(), &mut stats)?;
+
+            // Spill targets are not part of the dependency graph, so if an
+            // updated formula started spilling, recalculate everything
+            if dirty.is_some() && workbook.worksheets().any(|ws| ws.has_spills()) {
+                stats.cells_calculated = 0;
+                stats.errors = parse_errors;
+                self.calculate_cells_simple(workbook, &calc_order, None, &mut stats)?;
+            }
         } else {
             // Iterative calculation for circular references
+            self.compile_programs(workbook);
             self.calculate_cells_iterative(workbook, &calc_order, &mut stats)?;
         }
 
+        workbook.mark_calculated();
         Ok(stats)
     }
 
+    /// Compile the formulas that are plain arithmetic
+    ///
+    /// Iterative calculation re-evaluates every formula on each pass, so the
+    /// compile cost is only worth paying when there are cycles to iterate.
+    fn compile_programs(&mut self, workbook: &Workbook) {
+        for (&cell_key, ast) in &self.parsed_formulas {
+            if let Some(program) = FormulaProgram::compile(ast, workbook, cell_key.sheet) {
+                self.programs.insert(cell_key, program);
+            }
+        }
+    }
+
     /// Collect all formulas from the workbook and build the dependency graph
     fn collect_formulas(
         &mut self,
@@ -172,8 +213,8 @@ impl CalculationEngine {
             for (row, col, formula_text) in sheet.formula_cells() {
                 let cell_key = CellKey::new(sheet_idx, row, col);
 
-                // Parse the formula
-                let ast = match parse_formula(formula_text) {
+                // Parse the formula (identical formula text reuses a cached AST)
+                let ast = match parse_formula_cached(formula_text) {
                     Ok(ast) => ast,
                     Err(e) => {
                         // Store a placeholder for unparseable formulas
@@ -190,6 +231,9 @@ impl CalculationEngine {
                 if self.options.calculate_volatile && contains_volatile_function(&ast) {
                     self.volatile_cells.insert(cell_key);
                 }
+                if contains_name_ref(&ast) {
+                    self.name_cells.insert(cell_key);
+                }
 
                 // Extract references and add to dependency graph
                 let references = extract_references(&ast, sheet_idx, workbook);
@@ -206,40 +250,85 @@ impl CalculationEngine {
         Ok(())
     }
 
-    /// Detect cells involved in circular references
-    fn detect_circular_references(&mut self) {
-        for &cell_key in self.parsed_formulas.keys() {
-            if self.dependency_graph.has_circular_reference(cell_key) {
-                self.circular_cells.insert(cell_key);
+    /// Get the calculation order and record cells in circular references
+    ///
+    /// Runs Tarjan's SCC algorithm over the formula cells packed into a
+    /// CSR graph. Components come out with precedents first, and any
+    /// component that forms a cycle marks its cells as circular.
+    fn get_calculation_order(&mut self) -> Vec<CellKey> {
+        let cells: Vec<CellKey> = self.parsed_formulas.keys().copied().collect();
+        let graph = CsrGraph::from_precedents(&self.dependency_graph, &cells);
+
+        let mut order = Vec::with_capacity(graph.node_count());
+        for component in graph.strongly_connected_components() {
+            if component.is_cycle {
+                self.circular_cells.extend(component.cells.iter().copied());
             }
+            order.extend(component.cells);
         }
-    }
 
-    /// Get the calculation order via topological sort
-    fn get_calculation_order(&self) -> Vec<CellKey> {
-        // Start with all formula cells
-        let all_cells: Vec<CellKey> = self.parsed_formulas.keys().copied().collect();
-
-        // Get recalc order (this handles topological sorting)
-        let mut order = self.dependency_graph.get_recalc_order(&all_cells);
+        order
+    }
 
-        // Reverse to get correct order (dependencies first)
-        order.reverse();
+    /// Get the cells affected by edits since the last calculation
+    ///
+    /// Returns `None` when every formula has to be recalculated: on request,
+    /// after structural changes, when a sheet could not track its edits cell
+    /// by cell, or when circular references or spilled arrays mean the
+    /// dependency graph does not describe every input.
+    fn dirty_cells(&self, workbook: &Workbook) -> Option<HashSet<CellKey>> {
+        if self.options.force_full_calculation
+            || workbook.structure_changed()
+            || !self.circular_cells.is_empty()
+        {
+            return None;
+        }
 
-        // Filter to only include formula cells
-        order.retain(|k| self.parsed_formulas.contains_key(k));
+        let mut pending: Vec<CellKey> = self
+            .volatile_cells
+            .iter()
+            .chain(&self.name_cells)
+            .copied()
+            .collect();
+        for (sheet_idx, sheet) in workbook.worksheets().enumerate() {
+            if sheet.has_spills() {
+                return None;
+            }
+            match sheet.changes() {
+                CellChanges::None => {}
+                CellChanges::Cells(cells) => pending.extend(
+                    cells
+                        .iter()
+                        .map(|&(row, col)| CellKey::new(sheet_idx, row, col)),
+                ),
+                CellChanges::All => return None,
+            }
+        }
 
-        order
+        // Everything downstream of a changed cell is dirty
+        let mut dirty = HashSet::new();
+        while let Some(cell_key) = pending.pop() {
+            if dirty.insert(cell_key) {
+                pending.extend(self.dependency_graph.get_dependents(cell_key));
+            }
+        }
+        Some(dirty)
     }
 
     /// Calculate cells in order (simple case, no iterative calculation)
+    ///
+    /// When `dirty` is given, only the cells in it are evaluated.
     fn calculate_cells_simple(
         &self,
         workbook: &mut Workbook,
         order: &[CellKey],
+        dirty: Option<&HashSet<CellKey>>,
         stats: &mut CalculationStats,
     ) -> Result<()> {
         for &cell_key in order {
+            if dirty.is_some_and(|dirty| !dirty.contains(&cell_key)) {
+                continue;
+            }
             if let Some(ast) = self.parsed_formulas.get(&cell_key) {
                 // Skip circular reference cells in non-iterative mode
                 if self.circular_cells.contains(&cell_key) && !self.options.iterative {
@@ -318,6 +407,7 @@ impl CalculationEngine {
     ) -> Result<()> {
         let mut prev_values: HashMap<CellKey, f64> = HashMap::new();
         let mut converged = false;
+        let mut stack = Vec::new();
 
         for iteration in 0..self.options.max_iterations {
             stats.iterations = iteration + 1;
@@ -325,17 +415,28 @@ impl CalculationEngine {
 
             for &cell_key in order {
                 if let Some(ast) = self.parsed_formulas.get(&cell_key) {
-                    // Evaluate the formula
-                    let ctx = EvaluationContext::new(
-                        Some(workbook),
-                        cell_key.sheet,
-                        cell_key.row,
-                        cell_key.col,
-                    );
-
-                    let result: CellValue = match evaluate(ast, &ctx) {
-                        Ok(value) => value.into(),
-                        Err(_) => CellValue::Error(duke_sheets_core::CellError::Value),
+                    // Run the compiled program if there is one, falling back to
+                    // the tree evaluator for anything it cannot compute exactly
+                    let compiled = self
+                        .programs
+                        .get(&cell_key)
+                        .and_then(|program| program.run(workbook, &mut stack));
+
+                    let result: CellValue = match compiled {
+                        Some(n) => CellValue::Number(n),
+                        None => {
+                            let ctx = EvaluationContext::new(
+                                Some(workbook),
+                                cell_key.sheet,
+                                cell_key.row,
+                                cell_key.col,
+                            );
+
+                            match evaluate(ast, &ctx) {
+                                Ok(value) => value.into(),
+                                Err(_) => CellValue::Error(duke_sheets_core::CellError::Value),
+                            }
+                        }
                     };
 
                     // Track convergence for numeric values in circular references
@@ -447,6 +548,25 @@ fn extract_references_recursive(
     }
 }
 
+/// Check if a formula refers to any defined names
+fn contains_name_ref(expr: &FormulaExpr) -> bool {
+    match expr {
+        FormulaExpr::NameRef(_) => true,
+        FormulaExpr::Function { args, .. } => args.iter().any(contains_name_ref),
+        FormulaExpr::BinaryOp { left, right, .. } => {
+            contains_name_ref(left) || contains_name_ref(right)
+        }
+        FormulaExpr::UnaryOp { operand, .. } => contains_name_ref(operand),
+        FormulaExpr::Array(rows) => rows.iter().any(|row| row.iter().any(contains_name_ref)),
+        FormulaExpr::Number(_)
+        | FormulaExpr::String(_)
+        | FormulaExpr::Boolean(_)
+        | FormulaExpr::Error(_)
+        | FormulaExpr::CellRef(_)
+        | FormulaExpr::RangeRef(_) => false,
+    }
+}
+
 /// Check if a formula contains any volatile functions
 fn contains_volatile_function(expr: &FormulaExpr) -> bool {
     match expr {
@@ -482,6 +602,7 @@ fn contains_volatile_function(expr: &FormulaExpr) -> bool {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::parse_formula;
 
     #[test]
     fn test_simple_calculation() {
@@ -536,6 +657,145 @@ mod tests {
         );
     }
 
+    fn incremental() -> CalculationOptions {
+        CalculationOptions {
+            force_full_calculation: false,
+            ..Default::default()
+        }
+    }
+
+    #[test]
+    fn test_default_recalculates_everything() {
+        let mut workbook = Workbook::new();
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.set_cell_value("A1", 5.0).unwrap();
+        sheet.set_cell_formula("A2", "=A1*2").unwrap();
+        sheet.set_cell_formula("B1", "=1+1").unwrap();
+
+        workbook.calculate().unwrap();
+        let stats = workbook.calculate().unwrap();
+        assert_eq!(stats.cells_calculated, 2);
+    }
+
+    #[test]
+    fn test_incremental_calculation() {
+        let mut workbook = Workbook::new();
+        let sheet = workbook.worksheet_mut(0).unwrap();
+
+        sheet.set_cell_value("A1", 5.0).unwrap();
+        sheet.set_cell_value("B1", 1.0).unwrap();
+        sheet.set_cell_formula("A2", "=A1*2").unwrap();
+        sheet.set_cell_formula("A3", "=A2+10").unwrap();
+        sheet.set_cell_formula("B2", "=B1+1").unwrap();
+
+        let stats = workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(stats.cells_calculated, 3);
+
+        // Nothing changed, nothing to do
+        let stats = workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(stats.formula_count, 3);
+        assert_eq!(stats.cells_calculated, 0);
+
+        // Only the cells downstream of A1 are re-evaluated
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.set_cell_value("A1", 7.0).unwrap();
+        let stats = workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(stats.cells_calculated, 2);
+
+        let sheet = workbook.worksheet(0).unwrap();
+        assert_eq!(
+            sheet.get_calculated_value_at(2, 0),
+            Some(&CellValue::Number(24.0))
+        );
+        assert_eq!(
+            sheet.get_calculated_value_at(1, 1),
+            Some(&CellValue::Number(2.0))
+        );
+
+        // A full calculation evaluates everything again
+        let stats = workbook.calculate().unwrap();
+        assert_eq!(stats.cells_calculated, 3);
+    }
+
+    #[test]
+    fn test_incremental_calculation_new_formula() {
+        let mut workbook = Workbook::new();
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.set_cell_value("A1", 2.0).unwrap();
+        sheet.set_cell_formula("A2", "=A1+1").unwrap();
+        workbook.calculate_with_options(&incremental()).unwrap();
+
+        // A new formula that feeds an existing one
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.set_cell_formula("A1", "=10").unwrap();
+        let stats = workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(stats.cells_calculated, 2);
+        assert_eq!(
+            workbook.worksheet(0).unwrap().get_calculated_value_at(1, 0),
+            Some(&CellValue::Number(11.0))
+        );
+
+        // Adding a sheet recalculates everything
+        workbook.add_worksheet().unwrap();
+        let stats = workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(stats.cells_calculated, 2);
+    }
+
+    #[test]
+    fn test_incremental_calculation_cleared_cells() {
+        let mut workbook = Workbook::new();
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.set_cell_value("A1", 3.0).unwrap();
+        sheet.set_cell_value("A2", 4.0).unwrap();
+        sheet.set_cell_formula("B1", "=A1+A2").unwrap();
+        workbook.calculate_with_options(&incremental()).unwrap();
+
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.clear_cell("A1").unwrap();
+        workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(
+            workbook.worksheet(0).unwrap().get_calculated_value_at(0, 1),
+            Some(&CellValue::Number(4.0))
+        );
+
+        let sheet = workbook.worksheet_mut(0).unwrap();
+        sheet.clear_range(&duke_sheets_core::CellRange::parse("A1:A2").unwrap());
+        workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(
+            workbook.worksheet(0).unwrap().get_calculated_value_at(0, 1),
+            Some(&CellValue::Number(0.0))
+        );
+    }
+
+    #[test]
+    fn test_incremental_calculation_cross_sheet() {
+        let mut workbook = Workbook::new();
+        workbook.add_worksheet_with_name("Data").unwrap();
+        workbook
+            .worksheet_mut(1)
+            .unwrap()
+            .set_cell_value("A1", 5.0)
+            .unwrap();
+        workbook
+            .worksheet_mut(0)
+            .unwrap()
+            .set_cell_formula("A1", "=Data!A1*2")
+            .unwrap();
+        workbook.calculate_with_options(&incremental()).unwrap();
+
+        workbook
+            .worksheet_mut(1)
+            .unwrap()
+            .set_cell_value("A1", 8.0)
+            .unwrap();
+        let stats = workbook.calculate_with_options(&incremental()).unwrap();
+        assert_eq!(stats.cells_calculated, 1);
+        assert_eq!(
+            workbook.worksheet(0).unwrap().get_calculated_value_at(0, 0),
+            Some(&CellValue::Number(16.0))
+        );
+    }
+
     #[test]
     fn test_sum_range() {
         let mut workbook = Workbook::new();
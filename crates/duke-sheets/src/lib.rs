@@ -113,7 +113,7 @@ pub use duke_sheets_chart::{
 pub use duke_sheets_csv::{CsvError, CsvReadOptions, CsvReader, CsvWriteOptions, CsvWriter};
 #[cfg(feature = "xls")]
 pub use duke_sheets_xls::{XlsError, XlsReader};
-pub use duke_sheets_xlsx::{XlsxError, XlsxReader, XlsxWriter};
+pub use duke_sheets_xlsx::{XlsxCompression, XlsxError, XlsxReader, XlsxWriteOptions, XlsxWriter};
 
 use std::path::Path;
 
@@ -1,6 +1,7 @@
 //! End-to-end tests for XLSX roundtrip (create -> save -> read -> verify)
 
 use duke_sheets::prelude::*;
+use duke_sheets::{XlsxCompression, XlsxWriteOptions};
 use std::io::Cursor;
 
 /// Test basic roundtrip with numeric values
@@ -306,6 +307,41 @@ fn test_roundtrip_empty_workbook() {
     assert!(wb2.sheet_count() >= 1);
 }
 
+/// Test roundtrip with every compression setting
+#[test]
+fn test_roundtrip_compression() {
+    let mut wb = Workbook::new();
+    let sheet = wb.worksheet_mut(0).unwrap();
+    for row in 0..100 {
+        sheet.set_cell_value_at(row, 0, row as f64).unwrap();
+        sheet.set_cell_value_at(row, 1, "repeated text").unwrap();
+    }
+
+    let mut sizes = Vec::new();
+    for compression in [
+        XlsxCompression::Default,
+        XlsxCompression::Fastest,
+        XlsxCompression::Stored,
+    ] {
+        let options = XlsxWriteOptions { compression };
+        let mut buf = Vec::new();
+        XlsxWriter::write_with_options(&wb, Cursor::new(&mut buf), &options).unwrap();
+
+        let wb2 = XlsxReader::read(Cursor::new(&buf)).unwrap();
+        let sheet2 = wb2.worksheet(0).unwrap();
+        assert_eq!(sheet2.get_value("A100").unwrap().as_number(), Some(99.0));
+        assert_eq!(
+            sheet2.get_value("B1").unwrap().as_string(),
+            Some("repeated text")
+        );
+        sizes.push(buf.len());
+    }
+
+    // Stored parts are not deflated, so that package is the largest
+    assert!(sizes[2] > sizes[0]);
+    assert!(sizes[2] > sizes[1]);
+}
+
 /// Test roundtrip with special sheet names
 #[test]
 fn test_roundtrip_special_sheet_names() {
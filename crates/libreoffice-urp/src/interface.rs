@@ -41,6 +41,14 @@ pub enum ParamType {
     Enum(&'static str),
     SequenceOfPropertyValue,
     SequenceOfProtocolProperty,
+    /// `sequence<string>` — e.g. property names.
+    SequenceOfString,
+    /// `sequence<any>` — e.g. property values.
+    SequenceOfAny,
+    /// `sequence<sequence<any>>` — a 2-D block of cell values.
+    SequenceOfSequenceOfAny,
+    /// `sequence<sequence<string>>` — a 2-D block of cell formulas.
+    SequenceOfSequenceOfString,
 }
 
 impl ParamType {
@@ -62,6 +70,10 @@ impl ParamType {
             ParamType::SequenceOfProtocolProperty => {
                 Type::sequence("com.sun.star.bridge.ProtocolProperty")
             }
+            ParamType::SequenceOfString => Type::sequence("string"),
+            ParamType::SequenceOfAny => Type::sequence("any"),
+            ParamType::SequenceOfSequenceOfAny => Type::sequence("[]any"),
+            ParamType::SequenceOfSequenceOfString => Type::sequence("[]string"),
         }
     }
 }
@@ -369,6 +381,33 @@ pub fn store_to_url() -> MethodDef {
     }
 }
 
+// ============================================================================
+// XCalculatable
+// Extends XInterface
+// Methods: calculate(3), calculateAll(4), isAutomaticCalculationEnabled(5),
+//          enableAutomaticCalculation(6)
+// ============================================================================
+
+pub fn calculate_all() -> MethodDef {
+    MethodDef {
+        name: "calculateAll",
+        index: 4,
+        params: &[],
+        return_type: Type::void(),
+        one_way: false,
+    }
+}
+
+pub fn enable_automatic_calculation() -> MethodDef {
+    MethodDef {
+        name: "enableAutomaticCalculation",
+        index: 6,
+        params: &[ParamType::Bool],
+        return_type: Type::void(),
+        one_way: false,
+    }
+}
+
 // ============================================================================
 // XCloseable
 // Extends XInterface (actually extends XCloseBroadcaster which extends XInterface)
@@ -414,6 +453,25 @@ pub fn get_property_value() -> MethodDef {
     }
 }
 
+// ============================================================================
+// XMultiPropertySet
+// Extends XInterface
+// Methods: getPropertySetInfo(3), setPropertyValues(4), getPropertyValues(5),
+//          addPropertiesChangeListener(6), removePropertiesChangeListener(7),
+//          firePropertiesChangeEvent(8)
+// ============================================================================
+
+/// `setPropertyValues(names, values)`. The names must be sorted and unique.
+pub fn set_property_values() -> MethodDef {
+    MethodDef {
+        name: "setPropertyValues",
+        index: 4,
+        params: &[ParamType::SequenceOfString, ParamType::SequenceOfAny],
+        return_type: Type::void(),
+        one_way: false,
+    }
+}
+
 // ============================================================================
 // XNameContainer / XNameAccess (for XSpreadsheets which extends both)
 // XNameAccess extends XElementAccess -> XInterface
@@ -456,11 +514,26 @@ pub fn insert_new_by_name() -> MethodDef {
 }
 
 // ============================================================================
-// XCellRange — getCellRangeByName
+// XCellRange — getCellRangeByPosition, getCellRangeByName
 // Extends XInterface (0-2)
 // Methods: getCellByPosition(3), getCellRangeByPosition(4), getCellRangeByName(5)
 // ============================================================================
 
+pub fn get_cell_range_by_position() -> MethodDef {
+    MethodDef {
+        name: "getCellRangeByPosition",
+        index: 4,
+        params: &[
+            ParamType::Long, // left
+            ParamType::Long, // top
+            ParamType::Long, // right
+            ParamType::Long, // bottom
+        ],
+        return_type: Type::interface("com.sun.star.table.XCellRange"),
+        one_way: false,
+    }
+}
+
 pub fn get_cell_range_by_name() -> MethodDef {
     MethodDef {
         name: "getCellRangeByName",
@@ -471,6 +544,58 @@ pub fn get_cell_range_by_name() -> MethodDef {
     }
 }
 
+// ============================================================================
+// XCellRangeData
+// Extends XInterface (0-2)
+// Methods: getDataArray(3), setDataArray(4)
+// ============================================================================
+
+pub fn get_data_array() -> MethodDef {
+    MethodDef {
+        name: "getDataArray",
+        index: 3,
+        params: &[],
+        return_type: Type::sequence("[]any"),
+        one_way: false,
+    }
+}
+
+pub fn set_data_array() -> MethodDef {
+    MethodDef {
+        name: "setDataArray",
+        index: 4,
+        params: &[ParamType::SequenceOfSequenceOfAny],
+        return_type: Type::void(),
+        one_way: false,
+    }
+}
+
+// ============================================================================
+// XCellRangeFormula
+// Extends XInterface (0-2)
+// Methods: getFormulaArray(3), setFormulaArray(4)
+// ============================================================================
+
+pub fn get_formula_array() -> MethodDef {
+    MethodDef {
+        name: "getFormulaArray",
+        index: 3,
+        params: &[],
+        return_type: Type::sequence("[]string"),
+        one_way: false,
+    }
+}
+
+pub fn set_formula_array() -> MethodDef {
+    MethodDef {
+        name: "setFormulaArray",
+        index: 4,
+        params: &[ParamType::SequenceOfSequenceOfString],
+        return_type: Type::void(),
+        one_way: false,
+    }
+}
+
 // ============================================================================
 // XMergeable
 // Extends XInterface (0-2)
@@ -631,6 +756,16 @@ pub fn get_by_name() -> MethodDef {
     }
 }
 
+pub fn get_element_names() -> MethodDef {
+    MethodDef {
+        name: "getElementNames",
+        index: 6,
+        params: &[],
+        return_type: Type::sequence("string"),
+        one_way: false,
+    }
+}
+
 // ============================================================================
 // XNameContainer
 // Extends XNameAccess -> XNameReplace(8) -> XNameContainer
@@ -746,4 +746,40 @@ mod tests {
         let result = read_value(&mut bytes, &ty).unwrap();
         assert_eq!(result, UnoValue::Sequence(items));
     }
+
+    #[test]
+    fn test_value_sequence_of_sequence_of_any() {
+        let any = |type_desc, value| UnoValue::Any(Box::new(Any { type_desc, value }));
+        let mut buf = BytesMut::new();
+        let value = UnoValue::Sequence(vec![
+            UnoValue::Sequence(vec![
+                any(Type::double(), UnoValue::Double(1.5)),
+                any(Type::string(), UnoValue::String("x".into())),
+            ]),
+            UnoValue::Sequence(vec![any(Type::void(), UnoValue::Void)]),
+        ]);
+        let ty = Type::sequence("[]any");
+        write_value(&mut buf, &value, &ty);
+
+        let mut bytes = buf.freeze();
+        let result = read_value(&mut bytes, &ty).unwrap();
+        assert_eq!(result, value);
+        assert!(bytes.is_empty());
+    }
+
+    #[test]
+    fn test_value_sequence_of_string() {
+        let mut buf = BytesMut::new();
+        let value = UnoValue::Sequence(vec![
+            UnoValue::String("CharColor".into()),
+            UnoValue::String("CharWeight".into()),
+        ]);
+        let ty = crate::interface::ParamType::SequenceOfString.to_type();
+        write_value(&mut buf, &value, &ty);
+
+        let mut bytes = buf.freeze();
+        let result = read_value(&mut bytes, &ty).unwrap();
+        assert_eq!(result, value);
+        assert!(bytes.is_empty());
+    }
 }
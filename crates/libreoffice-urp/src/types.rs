@@ -377,10 +377,14 @@ pub mod type_names {
     pub const X_TEXT_RANGE: &str = "com.sun.star.text.XTextRange";
     pub const X_STORABLE: &str = "com.sun.star.frame.XStorable";
     pub const X_CLOSEABLE: &str = "com.sun.star.util.XCloseable";
+    pub const X_CALCULATABLE: &str = "com.sun.star.sheet.XCalculatable";
     pub const X_PROPERTY_SET: &str = "com.sun.star.beans.XPropertySet";
+    pub const X_MULTI_PROPERTY_SET: &str = "com.sun.star.beans.XMultiPropertySet";
     pub const X_PROTOCOL_PROPERTIES: &str = "com.sun.star.bridge.XProtocolProperties";
 
     pub const X_CELL_RANGE: &str = "com.sun.star.table.XCellRange";
+    pub const X_CELL_RANGE_DATA: &str = "com.sun.star.sheet.XCellRangeData";
+    pub const X_CELL_RANGE_FORMULA: &str = "com.sun.star.sheet.XCellRangeFormula";
     pub const X_MERGEABLE: &str = "com.sun.star.util.XMergeable";
     pub const X_SHEET_ANNOTATIONS_SUPPLIER: &str = "com.sun.star.sheet.XSheetAnnotationsSupplier";
     pub const X_SHEET_ANNOTATIONS: &str = "com.sun.star.sheet.XSheetAnnotations";